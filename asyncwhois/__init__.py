@@ -1,6 +1,7 @@
+import asyncio
 import ipaddress
 from ipaddress import IPv4Address, IPv6Address
-from typing import Any, Optional, Union
+from typing import Any, AsyncIterator, Optional, Union
 from dataclasses import dataclass
 from warnings import warn
 
@@ -11,13 +12,23 @@ from .client import (
     ASNClient,
     DomainClient,
     NumberClient,
+    ParseOffload,
     convert_to_ip,
 )
+from .bulk import LookupResult, LookupStatus, SearchTerms, parse_many, run_many
+from .cache import DiskCache, NetworkCache, ReferralCache, ResultCache
+from .columnar import ColumnarWriter, ColumnFormat
 from .errors import NotFoundError, GeneralError, QueryError, WhoIsError
+from .ratelimit import RateGovernor, ServerPolicy
+from .records import DomainRecord, IPRecord
+from .sinks import CSVSink, JSONLSink
 
 __all__ = [
     "aio_rdap",
     "aio_whois",
+    "aio_rdap_many",
+    "parse_many",
+    "aio_whois_many",
     "whois",
     "rdap",
     "aio_whois_domain",
@@ -37,6 +48,21 @@ __all__ = [
     "ASNClient",
     "DomainClient",
     "NumberClient",
+    "ParseOffload",
+    "LookupResult",
+    "LookupStatus",
+    "ColumnarWriter",
+    "CSVSink",
+    "JSONLSink",
+    "ColumnFormat",
+    "DiskCache",
+    "DomainRecord",
+    "IPRecord",
+    "NetworkCache",
+    "RateGovernor",
+    "ReferralCache",
+    "ResultCache",
+    "ServerPolicy",
     "NotFoundError",
     "WhoIsError",
     "GeneralError",
@@ -241,6 +267,169 @@ async def aio_rdap(
         return "", {}
 
 
+async def aio_whois_many(
+    search_terms: SearchTerms,
+    concurrency: int = 50,
+    authoritative_only: bool = False,
+    find_authoritative_server: bool = True,
+    ignore_not_found: bool = False,
+    proxy_url: Optional[str] = None,
+    timeout: int = 10,
+    tldextract_obj: TLDExtract = None,
+    rate_governor: Optional[RateGovernor] = None,
+    referral_cache: Optional[ReferralCache] = None,
+    disk_cache: Optional[DiskCache] = None,
+    parse_offload: Union[ParseOffload, str] = ParseOffload.NONE,
+    parse_offload_threshold: int = 32 * 1024,
+) -> AsyncIterator[LookupResult]:
+    """
+    Performs WHOIS queries for every item in `search_terms` with at most `concurrency` queries
+    in flight, reusing one `DomainClient` and one `NumberClient` for the whole run. Identical
+    search terms that are in flight at the same time share a single query. Results are yielded
+    in completion order as `LookupResult` envelopes; exceptions raised by a single lookup
+    (e.g. `NotFoundError`) are reported on the envelope's `status` and `error` instead of being raised.
+
+    :param search_terms: An iterable or async iterable of domains, URLs, IPv4s, or IPv6s; consumed lazily
+    :param concurrency: Maximum number of queries running at the same time. Default is 50.
+    :param authoritative_only: DEPRECATED - If False (default), asyncwhois returns the entire WHOIS query chain,
+        otherwise if True, only the authoritative response is returned.
+    :param find_authoritative_server: This parameter only applies to domain queries. If True (default), asyncwhois
+        will attempt to find the authoritative response, otherwise if False, asyncwhois will only query the whois server
+        associated with the given TLD as specified in the IANA root db (`asyncwhois/servers/domains.py`).
+    :param ignore_not_found:  If False (default), lookups whose output contains "no such domain" language are
+        reported with `LookupStatus.NOT_FOUND`. If True, they are parsed like any other response.
+    :param proxy_url: Optional SOCKS4 or SOCKS5 proxy url (e.g. 'socks5://host:port')
+    :param timeout: Connection timeout. Default is 10 seconds.
+    :param tldextract_obj: An optional preconfigured instance of `tldextract.TLDExtract` (used for parsing URLs)
+    :param rate_governor: Per-WHOIS-server concurrency and rate limits applied to every query in the referral
+        chain. Defaults to a `RateGovernor` with the built-in policies for well-known registries.
+    :param referral_cache: Cache of whois.iana.org referrals shared by every lookup in the run.
+        Defaults to a new in-memory `ReferralCache`.
+    :param disk_cache: Optional persistent `DiskCache` of raw query chains shared by every lookup in the run.
+    :param parse_offload: Where responses are parsed: "none" (default) parses on the event loop, "thread" or
+        "process" in a thread or process pool, and "adaptive" sends only responses of at least
+        `parse_offload_threshold` characters to the process pool.
+    :param parse_offload_threshold: Size in characters from which "adaptive" offloads parsing. Default is 32 KiB.
+    :returns: an async iterator of `LookupResult`
+    """
+    if rate_governor is None:
+        rate_governor = RateGovernor()
+    if referral_cache is None:
+        referral_cache = ReferralCache()
+    domain_client = DomainClient(
+        authoritative_only=authoritative_only,
+        find_authoritative_server=find_authoritative_server,
+        ignore_not_found=ignore_not_found,
+        proxy_url=proxy_url,
+        timeout=timeout,
+        tldextract_obj=tldextract_obj,
+        rate_governor=rate_governor,
+        referral_cache=referral_cache,
+        coalesce=True,
+        disk_cache=disk_cache,
+        parse_offload=parse_offload,
+        parse_offload_threshold=parse_offload_threshold,
+    )
+    number_client = NumberClient(
+        authoritative_only=authoritative_only,
+        proxy_url=proxy_url,
+        timeout=timeout,
+        rate_governor=rate_governor,
+        referral_cache=referral_cache,
+        coalesce=True,
+        disk_cache=disk_cache,
+        parse_offload=parse_offload,
+        parse_offload_threshold=parse_offload_threshold,
+    )
+
+    async def _lookup(search_term: Any) -> tuple[str, dict]:
+        if isinstance(search_term, (ipaddress.IPv4Address, ipaddress.IPv6Address)):
+            return await number_client.aio_whois(search_term)
+        elif isinstance(search_term, str):
+            try:
+                search_term = convert_to_ip(search_term)
+            except (ipaddress.AddressValueError, ValueError):
+                return await domain_client.aio_whois(search_term)
+            return await number_client.aio_whois(search_term)
+        else:
+            return "", {}
+
+    async for result in run_many(_lookup, search_terms, concurrency):
+        yield result
+
+
+async def aio_rdap_many(
+    search_terms: SearchTerms,
+    concurrency: int = 50,
+    authoritative_only: bool = False,
+    tldextract_obj: Optional[TLDExtract] = None,
+    disk_cache: Optional[DiskCache] = None,
+) -> AsyncIterator[LookupResult]:
+    """
+    Performs RDAP queries for every item in `search_terms` with at most `concurrency` queries
+    in flight, reusing one client per kind of search term (domain, ipv4, ipv6, asn) for the whole
+    run. Identical search terms that are in flight at the same time share a single query. Results
+    are yielded in completion order as `LookupResult` envelopes; exceptions raised by a single
+    lookup are reported on the envelope's `status` and `error` instead of being raised.
+
+    :param search_terms: An iterable or async iterable of domains, URLs, IPv4s, IPv6s, or ASNs; consumed lazily
+    :param concurrency: Maximum number of queries running at the same time. Default is 50.
+    :param authoritative_only: If False (default), asyncwhois returns the entire WHOIS query chain,
+        otherwise if True, only the authoritative response is returned.
+    :param tldextract_obj: An optional preconfigured instance of `tldextract.TLDExtract` (used for parsing URLs)
+    :param disk_cache: Optional persistent `DiskCache` of RDAP responses shared by every lookup in the run.
+    :returns: an async iterator of `LookupResult`
+    """
+    clients = {
+        "domain": DomainClient(
+            authoritative_only=authoritative_only,
+            tldextract_obj=tldextract_obj,
+            coalesce=True,
+            disk_cache=disk_cache,
+        ),
+        "ipv4": NumberClient(
+            authoritative_only=authoritative_only, coalesce=True, disk_cache=disk_cache
+        ),
+        "ipv6": NumberClient(
+            authoritative_only=authoritative_only, coalesce=True, disk_cache=disk_cache
+        ),
+        "asn": ASNClient(coalesce=True, disk_cache=disk_cache),
+    }
+    locks = {kind: asyncio.Lock() for kind in clients}
+
+    async def _get_client(kind: str) -> Union[DomainClient, NumberClient, ASNClient]:
+        client = clients[kind]
+        # bootstrap each whodap client once instead of racing concurrent lookups
+        async with locks[kind]:
+            if client.whodap_client is None:
+                await client.init_async_whodap_client(ipv4=(kind == "ipv4"))
+        return client
+
+    async def _lookup(search_term: Any) -> tuple[str, dict]:
+        if isinstance(search_term, str):
+            try:
+                search_term = convert_to_ip(search_term)
+            except (ipaddress.AddressValueError, ValueError):
+                client = await _get_client("domain")
+                return await client.aio_rdap(search_term)
+        if isinstance(search_term, (ipaddress.IPv4Address, ipaddress.IPv6Address)):
+            client = await _get_client(f"ipv{search_term.version}")
+            return await client.aio_rdap(search_term)
+        elif isinstance(search_term, int):
+            client = await _get_client("asn")
+            return await client.aio_rdap(search_term)
+        else:
+            return "", {}
+
+    try:
+        async for result in run_many(_lookup, search_terms, concurrency):
+            yield result
+    finally:
+        for client in clients.values():
+            if client.whodap_client is not None:
+                await client.whodap_client.aio_close()
+
+
 # ====================
 # TODO: ALL the code below will be removed in a future release; it is here for backwards compatibility only
 
@@ -0,0 +1,255 @@
+"""Helpers for running many lookups with bounded concurrency"""
+
+import asyncio
+import collections
+import ipaddress
+import itertools
+import os
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Union,
+)
+
+from .errors import NotFoundError
+from .parse import Fields
+from .parse_rir import NumberParser
+from .parse_tld import DomainParser
+
+SearchTerms = Union[Iterable[Any], AsyncIterable[Any]]
+LookupFunc = Callable[[Any], Awaitable[tuple[str, dict]]]
+# (raw whois output, tld or ip address) pairs for `parse_many`
+ParseItems = Iterable[tuple[str, Any]]
+
+
+class LookupStatus(str, Enum):
+    OK = "ok"
+    NOT_FOUND = "not_found"
+    ERROR = "error"
+
+    def __repr__(self):
+        return self.value
+
+    def __str__(self):
+        return self.value
+
+
+@dataclass
+class LookupResult:
+    """
+    Envelope for the outcome of a single lookup in a bulk run.
+
+    `query_output` and `parser_output` are only populated when `status` is
+    `LookupStatus.OK`; otherwise the raised exception is kept in `error`.
+    """
+
+    search_term: Any
+    query_output: str = ""
+    parser_output: dict = field(default_factory=dict)
+    status: LookupStatus = LookupStatus.OK
+    error: Optional[BaseException] = None
+
+
+async def _iter_search_terms(search_terms: SearchTerms) -> AsyncIterator[Any]:
+    if hasattr(search_terms, "__aiter__"):
+        async for search_term in search_terms:
+            yield search_term
+    else:
+        for search_term in search_terms:
+            yield search_term
+
+
+async def _run_one(lookup: LookupFunc, search_term: Any) -> LookupResult:
+    try:
+        query_output, parser_output = await lookup(search_term)
+    except NotFoundError as e:
+        return LookupResult(search_term, status=LookupStatus.NOT_FOUND, error=e)
+    except Exception as e:
+        return LookupResult(search_term, status=LookupStatus.ERROR, error=e)
+    return LookupResult(search_term, query_output, parser_output)
+
+
+async def run_many(
+    lookup: LookupFunc,
+    search_terms: SearchTerms,
+    concurrency: int = 50,
+) -> AsyncIterator[LookupResult]:
+    """
+    Runs `lookup` for every item in `search_terms` with at most `concurrency`
+    lookups in flight and yields a `LookupResult` for each one in completion order.
+
+    `search_terms` is consumed lazily: a new search term is only pulled when a
+    slot frees up, so slow consumers of this iterator apply backpressure all the
+    way back to the source.
+
+    :param lookup: coroutine function returning a (query string, parsed dict) tuple
+    :param search_terms: an iterable or async iterable of search terms
+    :param concurrency: maximum number of lookups running at the same time
+    :return: an async iterator of `LookupResult`
+    """
+    if concurrency < 1:
+        raise ValueError("`concurrency` must be a positive integer")
+    terms = _iter_search_terms(search_terms)
+    pending: set[asyncio.Future] = set()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < concurrency:
+                try:
+                    search_term = await terms.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                else:
+                    pending.add(asyncio.ensure_future(_run_one(lookup, search_term)))
+            if not pending:
+                break
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        # the consumer stopped early (or was cancelled); drop in-flight lookups
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        await terms.aclose()
+
+
+# `parse_many` worker parsers by `ignore_not_found`, set up by `_init_worker`
+_worker_parsers: dict[bool, tuple[DomainParser, NumberParser]] = {}
+
+
+def _init_worker(ignore_not_found: bool) -> tuple[DomainParser, NumberParser]:
+    domain_parser = DomainParser(ignore_not_found=ignore_not_found)
+    number_parser = NumberParser()
+    # build the shared TLD and RIR parser registries before the first chunk arrives
+    domain_parser._init_parser("")
+    number_parser._init_parser(None)
+    _worker_parsers[ignore_not_found] = (domain_parser, number_parser)
+    return domain_parser, number_parser
+
+
+def _parse_chunk(
+    chunk: list[tuple[str, Any]], fields: Fields, ignore_not_found: bool
+) -> list[tuple[Optional[dict], Optional[BaseException]]]:
+    """
+    Parses every (blob, tld or ip) pair of `chunk` and returns a
+    (parser output, error) tuple for each one; the blobs are not sent back.
+    """
+    parsers = _worker_parsers.get(ignore_not_found)
+    if parsers is None:
+        # an executor created without `_init_worker` as its initializer
+        parsers = _init_worker(ignore_not_found)
+    domain_parser, number_parser = parsers
+    results = []
+    for blob, key in chunk:
+        try:
+            if isinstance(key, (ipaddress.IPv4Address, ipaddress.IPv6Address)):
+                ip = key
+            else:
+                try:
+                    ip = ipaddress.ip_address(key)
+                except ValueError:
+                    ip = None
+            if ip is None:
+                parser_output = domain_parser.parse(blob, key, fields)
+            else:
+                parser_output = number_parser.parse(blob, ip, fields)
+        except Exception as e:
+            results.append((None, e))
+        else:
+            results.append((dict(parser_output), None))
+    return results
+
+
+def _to_result(
+    key: Any, blob: str, parser_output: Optional[dict], error: Optional[BaseException]
+) -> LookupResult:
+    if error is None:
+        return LookupResult(key, blob, parser_output)
+    if isinstance(error, NotFoundError):
+        return LookupResult(key, status=LookupStatus.NOT_FOUND, error=error)
+    return LookupResult(key, status=LookupStatus.ERROR, error=error)
+
+
+def parse_many(
+    items: ParseItems,
+    processes: Optional[int] = None,
+    chunk_size: int = 256,
+    prefetch: Optional[int] = None,
+    fields: Fields = None,
+    ignore_not_found: bool = False,
+    executor: Optional[Executor] = None,
+) -> Iterator[LookupResult]:
+    """
+    Parses stored whois output without querying any server. Each item of `items`
+    is a (blob, tld) pair for a domain or a (blob, ip) pair for an ip address;
+    items are sent in chunks of `chunk_size` to a `ProcessPoolExecutor` whose
+    workers keep their parsers between chunks.
+
+    Results are yielded in the order of `items` as `LookupResult` envelopes, with
+    the tld or ip as the `search_term` and the blob as the `query_output`.
+    Exceptions raised by a single item (e.g. `NotFoundError`) are reported on the
+    envelope's `status` and `error` instead of being raised. At most `prefetch`
+    chunks are in flight, so `items` is consumed lazily and memory stays bounded;
+    by default that is two chunks per worker, which keeps every worker busy.
+
+    :param items: an iterable of (whois output, tld or ip) pairs
+    :param processes: number of worker processes; defaults to the number of CPUs
+    :param chunk_size: number of items parsed per task
+    :param prefetch: maximum number of chunks submitted ahead of the consumer;
+        twice the executor's number of workers if None
+    :param fields: only extract these keys; all keys if None
+    :param ignore_not_found: if True, blobs containing "no such domain" language
+        are parsed instead of being reported with `LookupStatus.NOT_FOUND`
+    :param executor: an optional executor to use instead of a new process pool;
+        it is not shut down when the results are exhausted
+    :return: an iterator of `LookupResult`
+    """
+    if chunk_size < 1:
+        raise ValueError("`chunk_size` must be a positive integer")
+    if prefetch is not None and prefetch < 1:
+        raise ValueError("`prefetch` must be a positive integer")
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_init_worker,
+            initargs=(ignore_not_found,),
+        )
+    if prefetch is None:
+        # the stdlib executors keep their worker count in `_max_workers`
+        workers = getattr(executor, "_max_workers", None) or os.cpu_count() or 1
+        prefetch = 2 * workers
+    items = iter(items)
+    pending: collections.deque[tuple[list, Future]] = collections.deque()
+    try:
+        while True:
+            while len(pending) < prefetch:
+                chunk = list(itertools.islice(items, chunk_size))
+                if not chunk:
+                    break
+                future = executor.submit(_parse_chunk, chunk, fields, ignore_not_found)
+                pending.append((chunk, future))
+            if not pending:
+                break
+            chunk, future = pending.popleft()
+            for (blob, key), (parser_output, error) in zip(chunk, future.result()):
+                yield _to_result(key, blob, parser_output, error)
+    finally:
+        # the consumer stopped early; drop chunks that have not started yet
+        for _, future in pending:
+            future.cancel()
+        if own_executor:
+            executor.shutdown(wait=True)
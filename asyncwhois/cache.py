@@ -0,0 +1,681 @@
+"""Caches used to avoid repeating WHOIS queries"""
+
+import asyncio
+import atexit
+import ipaddress
+import json
+import os
+import queue
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional, Union
+
+from .errors import NotFoundError
+
+IPAddress = Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
+IPNetwork = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+class ReferralCache:
+    """
+    Caches the referral answers from whois.iana.org so the IANA hop is only
+    made once per TLD (domains) or per IANA allocation block (IP addresses).
+
+    Each entry keeps the referred server and the raw IANA response, so cached
+    lookups return the same query chain as uncached ones.
+
+    :param ttl: number of seconds an entry stays valid. Default is one day.
+    :param path: optional JSON file used to persist entries across processes;
+        it is loaded on creation and written by `save` and `close`.
+    :param save_interval: when `path` is set, new entries are also written by a
+        background timer at most this many seconds after they are added; None
+        leaves saving to explicit `save`/`close` calls. Default is five seconds.
+    """
+
+    block_regex = re.compile(r"^inet6?num: *(\S+)", flags=re.IGNORECASE | re.M)
+
+    def __init__(
+        self,
+        ttl: float = 86400.0,
+        path: Optional[str] = None,
+        save_interval: Optional[float] = 5.0,
+    ):
+        self.ttl = ttl
+        self.path = path
+        self.save_interval = save_interval
+        self._lock = threading.Lock()
+        # serializes writes so an older snapshot never replaces a newer one
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
+        # tld -> (server, iana_output, expires_at)
+        self._tlds: dict[str, tuple[str, str, float]] = {}
+        # (network, server, iana_output, expires_at)
+        self._networks: list[tuple[IPNetwork, str, str, float]] = []
+        if path and os.path.exists(path):
+            self.load()
+        if path:
+            atexit.register(self.close)
+
+    @staticmethod
+    def _parse_ip(search_term: str) -> Optional[IPAddress]:
+        try:
+            return ipaddress.ip_address(search_term)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _tld(search_term: str) -> str:
+        return search_term.rstrip(".").split(".")[-1].lower()
+
+    def get(self, search_term: str) -> Optional[tuple[str, str]]:
+        """
+        Returns the cached (server, IANA response) pair for `search_term` or None.
+        """
+        now = time.time()
+        ip = self._parse_ip(search_term)
+        with self._lock:
+            if ip is None:
+                entry = self._tlds.get(self._tld(search_term))
+                if entry and entry[2] > now:
+                    return entry[0], entry[1]
+                return None
+            for network, server, iana_output, expires_at in self._networks:
+                if ip.version == network.version and ip in network:
+                    if expires_at > now:
+                        return server, iana_output
+        return None
+
+    def set(self, search_term: str, server: str, iana_output: str) -> None:
+        """
+        Stores the IANA referral for `search_term`. IP referrals are stored under the
+        allocation block named in the IANA response and skipped if there is none.
+        """
+        expires_at = time.time() + self.ttl
+        ip = self._parse_ip(search_term)
+        with self._lock:
+            if ip is None:
+                self._tlds[self._tld(search_term)] = (server, iana_output, expires_at)
+            else:
+                block = self.block_regex.search(iana_output)
+                try:
+                    network = ipaddress.ip_network(block.group(1), strict=False)
+                except (AttributeError, ValueError):
+                    return
+                self._networks = [n for n in self._networks if n[0] != network]
+                self._networks.append((network, server, iana_output, expires_at))
+                # most specific block first
+                self._networks.sort(key=lambda n: n[0].prefixlen, reverse=True)
+        if self.path:
+            self._mark_dirty()
+
+    def _mark_dirty(self) -> None:
+        with self._lock:
+            self._dirty = True
+            if self.save_interval is None or self._timer is not None:
+                return
+            self._timer = threading.Timer(self.save_interval, self._timed_save)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _timed_save(self) -> None:
+        with self._lock:
+            self._timer = None
+        self.save()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tlds.clear()
+            self._networks.clear()
+
+    def close(self) -> None:
+        """
+        Stops the save timer and writes unsaved entries to `path`.
+        """
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+        if self.path and self._dirty:
+            self.save()
+
+    async def aio_save(self) -> None:
+        """
+        `save` in a worker thread, so the event loop is not blocked.
+        """
+        await asyncio.to_thread(self.save)
+
+    def load(self) -> None:
+        """
+        Loads unexpired entries from `path`.
+        """
+        with open(self.path, encoding="utf-8") as cache_file:
+            contents = json.load(cache_file)
+        now = time.time()
+        with self._lock:
+            for tld, entry in contents.get("tlds", {}).items():
+                if entry[2] > now:
+                    self._tlds[tld] = tuple(entry)
+            for block, server, iana_output, expires_at in contents.get("networks", []):
+                if expires_at > now:
+                    network = ipaddress.ip_network(block)
+                    self._networks.append((network, server, iana_output, expires_at))
+            self._networks.sort(key=lambda n: n[0].prefixlen, reverse=True)
+
+    def save(self) -> None:
+        """
+        Atomically writes all entries to `path`.
+        """
+        with self._save_lock:
+            with self._lock:
+                contents = {
+                    "tlds": dict(self._tlds),
+                    "networks": [
+                        [str(network), server, iana_output, expires_at]
+                        for network, server, iana_output, expires_at in self._networks
+                    ],
+                }
+                self._dirty = False
+            directory = os.path.dirname(os.path.abspath(self.path))
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                    json.dump(contents, tmp_file)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                with self._lock:
+                    self._dirty = True
+                raise
+
+
+class ResultCache:
+    """
+    Thread-safe in-memory LRU cache of lookup results with a per-entry TTL.
+
+    `NotFoundError` answers are cached separately for `negative_ttl` seconds and
+    re-raised on a hit. Cached results are shared between callers, so treat them
+    as read-only.
+
+    :param maxsize: maximum number of entries kept; the least recently used entry is evicted
+    :param ttl: number of seconds a result stays valid. Default is one hour.
+    :param negative_ttl: number of seconds a `NotFoundError` stays valid. Default is five minutes.
+    """
+
+    def __init__(
+        self, maxsize: int = 10000, ttl: float = 3600.0, negative_ttl: float = 300.0
+    ):
+        if maxsize < 1:
+            raise ValueError("`maxsize` must be a positive integer")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # key -> (expires_at, result, error)
+        self._entries: OrderedDict[
+            Hashable, tuple[float, Any, Optional[NotFoundError]]
+        ] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Returns the cached result for `key` or None on a miss.
+
+        :raises NotFoundError: if `key` was cached as not found
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        expires_at, result, error = entry
+        if error is not None:
+            # drop the traceback so repeated hits do not keep growing it
+            raise error.with_traceback(None)
+        return result
+
+    def set(self, key: Hashable, result: Any) -> None:
+        self._store(key, (time.monotonic() + self.ttl, result, None))
+
+    def set_not_found(self, key: Hashable, error: NotFoundError) -> None:
+        self._store(key, (time.monotonic() + self.negative_ttl, None, error))
+
+    def _store(
+        self, key: Hashable, entry: tuple[float, Any, Optional[NotFoundError]]
+    ) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class NetworkCache:
+    """
+    In-memory cache of IP WHOIS results keyed by the network block named in the
+    response, so one query answers every later lookup for an address in that block.
+
+    Blocks are stored by prefix length and looked up by longest-prefix match, so a
+    lookup costs one dict probe per distinct prefix length in the cache.
+
+    A block is only reused as-is if it is no broader than `min_prefixlen`; broader
+    blocks are narrowed to the `min_prefixlen` subnet around the queried address,
+    because registries reassign parts of large blocks to other organizations.
+    The same subnet is used to merge concurrent async lookups: a lookup waits for an
+    in-flight query in its subnet and re-checks the cache before querying itself.
+
+    :param maxsize: maximum number of blocks kept; the least recently used block is evicted
+    :param ttl: number of seconds a result stays valid. Default is one day.
+    :param min_prefixlen: broadest reusable block for IPv4 and IPv6 addresses
+    """
+
+    range_regex = re.compile(
+        r"^(?:NetRange|CIDR|inetnum|inet6num|inetrev): *(.+)",
+        flags=re.IGNORECASE | re.M,
+    )
+
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        ttl: float = 86400.0,
+        min_prefixlen: tuple[int, int] = (24, 48),
+    ):
+        if maxsize < 1:
+            raise ValueError("`maxsize` must be a positive integer")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.min_prefixlen = {4: min_prefixlen[0], 6: min_prefixlen[1]}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # (version, prefixlen, network address >> host bits) -> (expires_at, result)
+        self._entries: OrderedDict[tuple[int, int, int], tuple[float, Any]] = (
+            OrderedDict()
+        )
+        # version -> {prefixlen: number of entries}, probed longest first
+        self._prefixlens: dict[int, dict[int, int]] = {4: {}, 6: {}}
+        # subnet -> future of the query in flight for an address in that subnet
+        self._pending: dict[IPNetwork, "asyncio.Future[None]"] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(network: IPNetwork) -> tuple[int, int, int]:
+        host_bits = network.max_prefixlen - network.prefixlen
+        return (
+            network.version,
+            network.prefixlen,
+            int(network.network_address) >> host_bits,
+        )
+
+    def get(self, ip: IPAddress) -> Any:
+        """
+        Returns the cached result for the most specific block containing `ip` or None.
+        """
+        now = time.monotonic()
+        with self._lock:
+            for prefixlen in sorted(self._prefixlens[ip.version], reverse=True):
+                host_bits = ip.max_prefixlen - prefixlen
+                key = (ip.version, prefixlen, int(ip) >> host_bits)
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                if entry[0] <= now:
+                    self._remove(key)
+                    continue
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        return None
+
+    def put(self, ip: IPAddress, result: tuple[str, dict]) -> Optional[IPNetwork]:
+        """
+        Stores `result` under the most specific block in its query output that contains `ip`.
+
+        :return: the block used as key, or None if no block was found
+        """
+        network = self._find_network(ip, result[0])
+        if network is None:
+            return None
+        key = self._key(network)
+        with self._lock:
+            if key not in self._entries:
+                counts = self._prefixlens[network.version]
+                counts[network.prefixlen] = counts.get(network.prefixlen, 0) + 1
+            self._entries[key] = (time.monotonic() + self.ttl, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+        return network
+
+    def _remove(self, key: tuple[int, int, int]) -> None:
+        del self._entries[key]
+        version, prefixlen, _ = key
+        counts = self._prefixlens[version]
+        counts[prefixlen] -= 1
+        if not counts[prefixlen]:
+            del counts[prefixlen]
+
+    def _subnet(self, ip: IPAddress) -> IPNetwork:
+        return ipaddress.ip_network(
+            f"{ip}/{self.min_prefixlen[ip.version]}", strict=False
+        )
+
+    def _find_network(self, ip: IPAddress, query_output: str) -> Optional[IPNetwork]:
+        best = None
+        for match in self.range_regex.finditer(query_output):
+            for network in self._parse_networks(match.group(1), ip.version):
+                if ip in network and (
+                    best is None or network.prefixlen > best.prefixlen
+                ):
+                    best = network
+        if best is None:
+            return None
+        if best.prefixlen < self.min_prefixlen[ip.version]:
+            return self._subnet(ip)
+        return best
+
+    @staticmethod
+    def _parse_networks(value: str, version: int) -> list[IPNetwork]:
+        """
+        Parses "a.b.c.d - e.f.g.h" ranges, CIDR lists and abbreviated
+        LACNIC-style blocks (e.g. "200.160.0/20") into networks.
+        """
+        value = value.strip()
+        try:
+            if " - " in value:
+                first, last = (
+                    ipaddress.ip_address(v.strip()) for v in value.split(" - ")
+                )
+                return list(ipaddress.summarize_address_range(first, last))
+            networks = []
+            for block in value.split(","):
+                block = block.strip()
+                if version == 4 and "/" in block:
+                    address, prefixlen = block.split("/", 1)
+                    octets = address.split(".")
+                    block = (
+                        ".".join(octets + ["0"] * (4 - len(octets))) + "/" + prefixlen
+                    )
+                networks.append(ipaddress.ip_network(block, strict=False))
+            return networks
+        except (ValueError, TypeError):
+            return []
+
+    def get_or_fetch(
+        self, ip: IPAddress, fetch: Callable[[], tuple[str, dict]]
+    ) -> tuple[str, dict]:
+        cached = self.get(ip)
+        if cached is not None:
+            return cached
+        result = fetch()
+        self.put(ip, result)
+        return result
+
+    async def aio_get_or_fetch(
+        self, ip: IPAddress, fetch: Callable[[], Awaitable[tuple[str, dict]]]
+    ) -> tuple[str, dict]:
+        subnet = self._subnet(ip)
+        while True:
+            cached = self.get(ip)
+            if cached is not None:
+                return cached
+            pending = self._pending.get(subnet)
+            if pending is None:
+                break
+            # shield so a cancelled waiter does not cancel the shared future
+            await asyncio.shield(pending)
+        pending = asyncio.get_running_loop().create_future()
+        self._pending[subnet] = pending
+        try:
+            result = await fetch()
+            self.put(ip, result)
+            return result
+        finally:
+            del self._pending[subnet]
+            pending.set_result(None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._prefixlens = {4: {}, 6: {}}
+            self.hits = 0
+            self.misses = 0
+
+
+class DiskCache:
+    """
+    Persistent cache of raw query responses (WHOIS query chains and RDAP JSON)
+    stored in a SQLite database, so cached answers survive process restarts.
+
+    `set` never touches the disk: entries are queued and committed in batches by
+    a background writer thread, which also deletes expired entries on start and
+    every `prune_interval` seconds. Entries that are still queued are served from
+    memory, so a value is readable as soon as it has been set. Call `close` (or use
+    the cache as a context manager) to commit queued entries before exiting.
+
+    :param path: path of the SQLite database; created if it does not exist
+    :param ttl: default number of seconds an entry stays valid. Default is one day.
+    :param batch_size: maximum number of entries committed in one transaction
+    :param flush_interval: maximum number of seconds an entry waits in the queue
+    :param prune_interval: number of seconds between deletions of expired entries
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = 86400.0,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        prune_interval: float = 3600.0,
+    ):
+        if batch_size < 1:
+            raise ValueError("`batch_size` must be a positive integer")
+        self.path = path
+        self.ttl = ttl
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.prune_interval = prune_interval
+        self._conn = self._connect()
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, server TEXT NOT NULL, created REAL NOT NULL, "
+                "ttl REAL NOT NULL, expires REAL NOT NULL, payload TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_expires ON responses (expires)"
+            )
+        self._read_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        # key -> (key, server, created, ttl, expires, payload) not yet committed
+        self._pending: dict[str, tuple[str, str, float, float, float, str]] = {}
+        self._queue: queue.Queue = queue.Queue()
+        self._closed = False
+        self._writer = threading.Thread(
+            target=self._write_loop, name="asyncwhois-disk-cache", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.close)
+
+    def __enter__(self) -> "DiskCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False)
+        # readers do not block the writer thread (and vice versa) in WAL mode
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Returns the cached payload for `key` or None if it is missing or expired.
+        """
+        now = time.time()
+        with self._pending_lock:
+            row = self._pending.get(key)
+        if row is None:
+            with self._read_lock:
+                row = self._conn.execute(
+                    "SELECT * FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+        if row is None or row[4] <= now:
+            return None
+        return row[5]
+
+    async def aio_get(self, key: str) -> Optional[str]:
+        """
+        Same as `get`, but reads the database in the default executor so the
+        event loop is not blocked by disk I/O.
+        """
+        with self._pending_lock:
+            row = self._pending.get(key)
+        if row is not None:
+            return row[5] if row[4] > time.time() else None
+        return await asyncio.get_running_loop().run_in_executor(None, self.get, key)
+
+    def set(
+        self, key: str, payload: str, server: str = "", ttl: Optional[float] = None
+    ) -> None:
+        """
+        Queues `payload` to be stored under `key`; returns without waiting for the write.
+
+        :param key: the cache key
+        :param payload: the raw response
+        :param server: the server that produced the response
+        :param ttl: number of seconds the entry stays valid; defaults to the cache's `ttl`
+        """
+        if self._closed:
+            return
+        ttl = self.ttl if ttl is None else ttl
+        created = time.time()
+        row = (key, server, created, ttl, created + ttl, payload)
+        with self._pending_lock:
+            self._pending[key] = row
+        self._queue.put(row)
+
+    def flush(self) -> None:
+        """
+        Blocks until every entry queued so far has been committed.
+        """
+        if self._closed:
+            return
+        flushed = threading.Event()
+        self._queue.put(flushed)
+        flushed.wait()
+
+    def prune(self) -> int:
+        """
+        Deletes expired entries and returns the number of entries deleted.
+        """
+        with self._read_lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM responses WHERE expires <= ?", (time.time(),)
+            )
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        self.flush()
+        with self._read_lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """
+        Commits queued entries, stops the writer thread and closes the database.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self._queue.put(self._STOP)
+        self._writer.join()
+        with self._read_lock:
+            self._conn.close()
+
+    def _write_loop(self) -> None:
+        conn = self._connect()
+        next_prune = 0.0  # prune on start, then every `prune_interval`
+        stopped = False
+        try:
+            while not stopped:
+                if time.monotonic() >= next_prune:
+                    try:
+                        with conn:
+                            conn.execute(
+                                "DELETE FROM responses WHERE expires <= ?",
+                                (time.time(),),
+                            )
+                    except sqlite3.Error:
+                        pass
+                    next_prune = time.monotonic() + self.prune_interval
+                try:
+                    item = self._queue.get(
+                        timeout=max(next_prune - time.monotonic(), 0.0)
+                    )
+                except queue.Empty:
+                    continue
+                batch: list[tuple] = []
+                flushed: list[threading.Event] = []
+                deadline = time.monotonic() + self.flush_interval
+                while True:
+                    if item is self._STOP:
+                        stopped = True
+                    elif isinstance(item, threading.Event):
+                        flushed.append(item)
+                    else:
+                        batch.append(item)
+                    if stopped or flushed or len(batch) >= self.batch_size:
+                        break
+                    try:
+                        item = self._queue.get(
+                            timeout=max(deadline - time.monotonic(), 0.0)
+                        )
+                    except queue.Empty:
+                        break
+                self._commit(conn, batch)
+                for event in flushed:
+                    event.set()
+        finally:
+            conn.close()
+
+    def _commit(self, conn: sqlite3.Connection, batch: list[tuple]) -> None:
+        if batch:
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                        batch,
+                    )
+            except sqlite3.Error:
+                # the cache is best effort; a failed batch is simply not persisted
+                pass
+        with self._pending_lock:
+            for row in batch:
+                if self._pending.get(row[0]) is row:
+                    del self._pending[row[0]]
@@ -1,13 +1,31 @@
+import asyncio
+import functools
 import ipaddress
-from typing import Union, Any, Optional
+from concurrent.futures import Executor, ProcessPoolExecutor
+from enum import Enum
+from typing import (
+    Union,
+    Any,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    Mapping,
+    Optional,
+)
+from urllib.parse import urlparse
 
 from tldextract.tldextract import extract, TLDExtract
 import whodap
 
-from .parse import convert_whodap_keys, IPBaseKeys, TLDBaseKeys
+from .cache import DiskCache, NetworkCache, ReferralCache, ResultCache
+from .errors import NotFoundError
+from .parse import convert_whodap_keys, Fields, IPBaseKeys, TLDBaseKeys
 from .parse_rir import NumberParser
-from .parse_tld import DomainParser
+from .parse_tld import NOT_FOUND_WINDOW, DomainParser
 from .query import DomainQuery, NumberQuery
+from .ratelimit import RateGovernor
+from .singleflight import SingleFlight
 
 
 def convert_to_ip(ip: str):
@@ -18,9 +36,209 @@ def convert_to_ip(ip: str):
         raise e
 
 
+def _rdap_server(rdap_output: whodap.response.RDAPResponse) -> str:
+    # the host in the response's "self" link is the server that answered
+    for link in getattr(rdap_output, "links", None) or []:
+        if getattr(link, "rel", None) == "self":
+            return urlparse(getattr(link, "href", "")).netloc
+    return ""
+
+
+class ParseOffload(str, Enum):
+    # parse in the coroutine, blocking the event loop while the regexes run
+    NONE = "none"
+    # parse in `parse_executor` or the event loop's default thread pool
+    THREAD = "thread"
+    # parse in `parse_executor` or a process pool shared by every client
+    PROCESS = "process"
+    # parse like PROCESS, but only responses of at least `parse_offload_threshold`
+    # characters; smaller ones are cheaper to parse than to send to another process
+    ADAPTIVE = "adaptive"
+
+    def __repr__(self):
+        return self.value
+
+    def __str__(self):
+        return self.value
+
+
+@functools.lru_cache(maxsize=None)
+def _process_pool() -> ProcessPoolExecutor:
+    return ProcessPoolExecutor()
+
+
+@functools.lru_cache(maxsize=None)
+def _domain_parser(
+    ignore_not_found: bool, not_found_window: Optional[int], compact: bool
+) -> DomainParser:
+    # one parser per configuration in each worker process, kept between parses
+    return DomainParser(
+        ignore_not_found=ignore_not_found,
+        not_found_window=not_found_window,
+        compact=compact,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _number_parser(compact: bool) -> NumberParser:
+    return NumberParser(compact=compact)
+
+
+def _parse_domain(
+    blob: str,
+    tld: str,
+    fields: Fields,
+    ignore_not_found: bool,
+    not_found_window: Optional[int],
+    compact: bool,
+) -> Mapping[TLDBaseKeys, Any]:
+    parser = _domain_parser(ignore_not_found, not_found_window, compact)
+    return parser.parse(blob, tld, fields)
+
+
+def _parse_number(
+    blob: str,
+    ip: Union[ipaddress.IPv4Address, ipaddress.IPv6Address],
+    fields: Fields,
+    compact: bool,
+) -> Mapping[IPBaseKeys, Any]:
+    return _number_parser(compact).parse(blob, ip, fields)
+
+
+def _convert_rdap_domain(rdap_json: str) -> dict:
+    rdap_output = whodap.DomainResponse.from_json(rdap_json)
+    return convert_whodap_keys(rdap_output.to_whois_dict())
+
+
 class Client:
-    def __init__(self, whodap_client):
+    def __init__(
+        self,
+        whodap_client,
+        result_cache: Optional[ResultCache] = None,
+        coalesce: bool = False,
+        disk_cache: Optional[DiskCache] = None,
+        parse_offload: Union[ParseOffload, str] = ParseOffload.NONE,
+        parse_offload_threshold: int = 32 * 1024,
+        parse_executor: Optional[Executor] = None,
+    ):
         self.whodap_client = whodap_client
+        self.result_cache = result_cache
+        self.flights = SingleFlight() if coalesce else None
+        self.disk_cache = disk_cache
+        # where `aio_whois` parses WHOIS output and `DomainClient.aio_rdap` converts
+        # RDAP output; see `ParseOffload`
+        self.parse_offload = ParseOffload(parse_offload)
+        self.parse_offload_threshold = parse_offload_threshold
+        self.parse_executor = parse_executor
+
+    async def _aio_parse(
+        self, blob: str, parse: Callable[[], Any], remote_parse: Callable[[], Any]
+    ) -> Any:
+        """
+        Runs `parse` (or `remote_parse` in a process pool) as `parse_offload` says
+        :param blob: the WHOIS output being parsed
+        :param parse: parses `blob` with this client's parser
+        :param remote_parse: picklable equivalent of `parse` for worker processes
+        """
+        # a lazy result does its work when it is read, not here
+        if getattr(self.parse_obj, "lazy", False):
+            return parse()
+        return await self._aio_offload(blob, parse, remote_parse)
+
+    async def _aio_offload(
+        self, blob: str, parse: Callable[[], Any], remote_parse: Callable[[], Any]
+    ) -> Any:
+        """
+        Runs `parse` in the coroutine, or in `parse_executor`, a thread pool or a
+        process pool, as `parse_offload` says
+        :param blob: the server output being parsed
+        :param parse: parses `blob`
+        :param remote_parse: picklable equivalent of `parse` for worker processes
+        """
+        offload = self.parse_offload
+        if offload == ParseOffload.NONE or (
+            offload == ParseOffload.ADAPTIVE
+            and len(blob) < self.parse_offload_threshold
+        ):
+            return parse()
+        loop = asyncio.get_running_loop()
+        executor = self.parse_executor
+        if offload == ParseOffload.THREAD:
+            return await loop.run_in_executor(executor, parse)
+        if executor is None:
+            executor = _process_pool()
+        if isinstance(executor, ProcessPoolExecutor):
+            return await loop.run_in_executor(executor, remote_parse)
+        return await loop.run_in_executor(executor, parse)
+
+    def _rdap_lookup(
+        self,
+        key: str,
+        response_type: type[whodap.response.RDAPResponse],
+        lookup: Callable[[], whodap.response.RDAPResponse],
+    ) -> whodap.response.RDAPResponse:
+        if self.disk_cache is None:
+            return lookup()
+        cached = self.disk_cache.get(key)
+        if cached is not None:
+            return response_type.from_json(cached)
+        rdap_output = lookup()
+        self.disk_cache.set(key, rdap_output.to_json(), _rdap_server(rdap_output))
+        return rdap_output
+
+    async def _aio_rdap_lookup(
+        self,
+        key: str,
+        response_type: type[whodap.response.RDAPResponse],
+        lookup: Callable[[], Awaitable[whodap.response.RDAPResponse]],
+    ) -> whodap.response.RDAPResponse:
+        if self.disk_cache is None:
+            return await lookup()
+        cached = await self.disk_cache.aio_get(key)
+        if cached is not None:
+            return response_type.from_json(cached)
+        rdap_output = await lookup()
+        self.disk_cache.set(key, rdap_output.to_json(), _rdap_server(rdap_output))
+        return rdap_output
+
+    async def _aio_coalesced_lookup(
+        self, key: Hashable, lookup: Callable[[], Awaitable[tuple[str, dict]]]
+    ) -> tuple[str, dict]:
+        if self.flights is None:
+            return await lookup()
+        return await self.flights.do(key, lookup)
+
+    def _cached_lookup(
+        self, key: Hashable, lookup: Callable[[], tuple[str, dict]]
+    ) -> tuple[str, dict]:
+        if self.result_cache is None:
+            return lookup()
+        cached = self.result_cache.get(key)
+        if cached is not None:
+            return cached
+        try:
+            result = lookup()
+        except NotFoundError as e:
+            self.result_cache.set_not_found(key, e)
+            raise
+        self.result_cache.set(key, result)
+        return result
+
+    async def _aio_cached_lookup(
+        self, key: Hashable, lookup: Callable[[], Awaitable[tuple[str, dict]]]
+    ) -> tuple[str, dict]:
+        if self.result_cache is None:
+            return await self._aio_coalesced_lookup(key, lookup)
+        cached = self.result_cache.get(key)
+        if cached is not None:
+            return cached
+        try:
+            result = await self._aio_coalesced_lookup(key, lookup)
+        except NotFoundError as e:
+            self.result_cache.set_not_found(key, e)
+            raise
+        self.result_cache.set(key, result)
+        return result
 
     def init_whodap_client(self, ipv4: bool = True):
         if isinstance(self, DomainClient):
@@ -55,10 +273,32 @@ class DomainClient(Client):
         whodap_client: whodap.DNSClient = None,
         timeout: int = 10,
         tldextract_obj: TLDExtract = None,
+        rate_governor: Optional[RateGovernor] = None,
+        referral_cache: Optional[ReferralCache] = None,
+        result_cache: Optional[ResultCache] = None,
+        coalesce: bool = False,
+        disk_cache: Optional[DiskCache] = None,
+        lazy_parse: bool = False,
+        fields: Optional[Iterable[Union[TLDBaseKeys, str]]] = None,
+        not_found_window: Optional[int] = NOT_FOUND_WINDOW,
+        compact: bool = False,
+        parse_offload: Union[ParseOffload, str] = ParseOffload.NONE,
+        parse_offload_threshold: int = 32 * 1024,
+        parse_executor: Optional[Executor] = None,
     ):
-        super().__init__(whodap_client)
+        super().__init__(
+            whodap_client,
+            result_cache,
+            coalesce,
+            disk_cache,
+            parse_offload,
+            parse_offload_threshold,
+            parse_executor,
+        )
         self.authoritative_only = authoritative_only
         self.ignore_not_found = ignore_not_found
+        # only these keys are parsed from WHOIS output; all of them if None
+        self.fields = None if fields is None else frozenset(map(TLDBaseKeys, fields))
         self.proxy_url = proxy_url
         self.timeout = timeout
         self.tldextract_obj = tldextract_obj
@@ -66,8 +306,17 @@ class DomainClient(Client):
             proxy_url=proxy_url,
             timeout=timeout,
             find_authoritative_server=find_authoritative_server,
+            rate_governor=rate_governor,
+            referral_cache=referral_cache,
+            disk_cache=disk_cache,
+        )
+        self.not_found_window = not_found_window
+        self.parse_obj = DomainParser(
+            ignore_not_found=ignore_not_found,
+            lazy=lazy_parse,
+            not_found_window=not_found_window,
+            compact=compact,
         )
-        self.parse_obj = DomainParser(ignore_not_found=ignore_not_found)
 
     def _get_domain_components(self, domain: str) -> tuple[str, str, str]:
         ext = (
@@ -80,20 +329,34 @@ class DomainClient(Client):
         return ext.registered_domain, domain_core, suffix
 
     def rdap(self, domain: str) -> tuple[str, dict]:
-        if self.whodap_client is None:
-            self.init_whodap_client()
-        _, domain_core, tld = self._get_domain_components(domain)
-        rdap_output = self.whodap_client.lookup(domain_core, tld)
+        registered_domain, domain_core, tld = self._get_domain_components(domain)
+
+        def lookup() -> whodap.DomainResponse:
+            if self.whodap_client is None:
+                self.init_whodap_client()
+            return self.whodap_client.lookup(domain_core, tld)
+
+        rdap_output = self._rdap_lookup(
+            f"rdap:{registered_domain.lower()}", whodap.DomainResponse, lookup
+        )
         query_string = rdap_output.to_json()
         parsed_dict = convert_whodap_keys(rdap_output.to_whois_dict())
         return query_string, parsed_dict
 
     def whois(self, domain: str) -> tuple[str, dict[TLDBaseKeys, Any]]:
         registered_domain, _, tld = self._get_domain_components(domain)
+        return self._cached_lookup(
+            ("whois", registered_domain.lower()),
+            lambda: self._whois(registered_domain, tld),
+        )
+
+    def _whois(
+        self, registered_domain: str, tld: str
+    ) -> tuple[str, dict[TLDBaseKeys, Any]]:
         query_chain: list[str] = self.query_obj.run(registered_domain)
         authoritative_answer = query_chain[-1]
         parsed_dict: dict[TLDBaseKeys, Any] = self.parse_obj.parse(
-            authoritative_answer, tld
+            authoritative_answer, tld, self.fields
         )
         query_string = (
             authoritative_answer if self.authoritative_only else "\n".join(query_chain)
@@ -101,20 +364,56 @@ class DomainClient(Client):
         return query_string, parsed_dict
 
     async def aio_rdap(self, domain: str) -> tuple[str, dict]:
-        if self.whodap_client is None:
-            await self.init_async_whodap_client()
-        _, domain_core, tld = self._get_domain_components(domain)
-        rdap_output = await self.whodap_client.aio_lookup(domain_core, tld)
+        registered_domain, domain_core, tld = self._get_domain_components(domain)
+        return await self._aio_coalesced_lookup(
+            ("rdap", registered_domain.lower()),
+            lambda: self._aio_rdap(registered_domain, domain_core, tld),
+        )
+
+    async def _aio_rdap(
+        self, registered_domain: str, domain_core: str, tld: str
+    ) -> tuple[str, dict]:
+
+        async def lookup() -> whodap.DomainResponse:
+            if self.whodap_client is None:
+                await self.init_async_whodap_client()
+            return await self.whodap_client.aio_lookup(domain_core, tld)
+
+        rdap_output = await self._aio_rdap_lookup(
+            f"rdap:{registered_domain.lower()}", whodap.DomainResponse, lookup
+        )
         query_string = rdap_output.to_json()
-        parsed_dict = convert_whodap_keys(rdap_output.to_whois_dict())
+        parsed_dict = await self._aio_offload(
+            query_string,
+            lambda: convert_whodap_keys(rdap_output.to_whois_dict()),
+            functools.partial(_convert_rdap_domain, query_string),
+        )
         return query_string, parsed_dict
 
     async def aio_whois(self, domain: str) -> tuple[str, dict[TLDBaseKeys, Any]]:
         registered_domain, _, tld = self._get_domain_components(domain)
+        return await self._aio_cached_lookup(
+            ("whois", registered_domain.lower()),
+            lambda: self._aio_whois(registered_domain, tld),
+        )
+
+    async def _aio_whois(
+        self, registered_domain: str, tld: str
+    ) -> tuple[str, dict[TLDBaseKeys, Any]]:
         query_chain: list[str] = await self.query_obj.aio_run(registered_domain)
         authoritative_answer = query_chain[-1]
-        parsed_dict: dict[TLDBaseKeys, Any] = self.parse_obj.parse(
-            authoritative_answer, tld
+        parsed_dict: dict[TLDBaseKeys, Any] = await self._aio_parse(
+            authoritative_answer,
+            lambda: self.parse_obj.parse(authoritative_answer, tld, self.fields),
+            functools.partial(
+                _parse_domain,
+                authoritative_answer,
+                tld,
+                self.fields,
+                self.ignore_not_found,
+                self.not_found_window,
+                self.parse_obj.compact,
+            ),
         )
         query_string = (
             authoritative_answer if self.authoritative_only else "\n".join(query_chain)
@@ -129,23 +428,67 @@ class NumberClient(Client):
         proxy_url: Optional[str] = None,
         whodap_client: Union[whodap.IPv4Client, whodap.IPv6Client] = None,
         timeout: int = 10,
+        rate_governor: Optional[RateGovernor] = None,
+        referral_cache: Optional[ReferralCache] = None,
+        result_cache: Optional[ResultCache] = None,
+        network_cache: Optional[NetworkCache] = None,
+        coalesce: bool = False,
+        disk_cache: Optional[DiskCache] = None,
+        lazy_parse: bool = False,
+        fields: Optional[Iterable[Union[IPBaseKeys, str]]] = None,
+        compact: bool = False,
+        parse_offload: Union[ParseOffload, str] = ParseOffload.NONE,
+        parse_offload_threshold: int = 32 * 1024,
+        parse_executor: Optional[Executor] = None,
     ):
-        super().__init__(whodap_client)
+        super().__init__(
+            whodap_client,
+            result_cache,
+            coalesce,
+            disk_cache,
+            parse_offload,
+            parse_offload_threshold,
+            parse_executor,
+        )
         self.authoritative_only = authoritative_only
+        # only these keys are parsed from WHOIS output; all of them if None
+        self.fields = None if fields is None else frozenset(map(IPBaseKeys, fields))
         self.proxy_url = proxy_url
         self.timeout = timeout
         self.whodap_client = whodap_client
-        self.query_obj = NumberQuery(proxy_url=proxy_url, timeout=timeout)
-        self.parse_obj = NumberParser()
+        self.network_cache = network_cache
+        self.query_obj = NumberQuery(
+            proxy_url=proxy_url,
+            timeout=timeout,
+            rate_governor=rate_governor,
+            referral_cache=referral_cache,
+            disk_cache=disk_cache,
+        )
+        self.parse_obj = NumberParser(lazy=lazy_parse, compact=compact)
+
+    @staticmethod
+    def _rdap_response_type(
+        ip: Union[ipaddress.IPv4Address, ipaddress.IPv6Address],
+    ) -> type[whodap.response.RDAPResponse]:
+        if ip.version == 4:
+            return whodap.response.IPv4Response
+        return whodap.response.IPv6Response
 
     def rdap(
         self, ip: Union[ipaddress.IPv4Address, ipaddress.IPv6Address, str]
     ) -> tuple[str, dict]:
         if not isinstance(ip, (ipaddress.IPv4Address, ipaddress.IPv6Address)):
             ip = convert_to_ip(ip)
-        if self.whodap_client is None:
-            self.init_whodap_client(ipv4=(ip.version == 4))
-        query_string = self.whodap_client.lookup(ip).to_json()
+
+        def lookup() -> whodap.response.RDAPResponse:
+            if self.whodap_client is None:
+                self.init_whodap_client(ipv4=(ip.version == 4))
+            return self.whodap_client.lookup(ip)
+
+        query_resp = self._rdap_lookup(
+            f"rdap:{ip}", self._rdap_response_type(ip), lookup
+        )
+        query_string = query_resp.to_json()
         return query_string, {}  # no parsed output available
 
     def whois(
@@ -153,11 +496,21 @@ class NumberClient(Client):
     ) -> tuple[str, dict[IPBaseKeys, Any]]:
         if not isinstance(ip, (ipaddress.IPv4Address, ipaddress.IPv6Address)):
             ip = convert_to_ip(ip)
+        return self._cached_lookup(("whois", ip), lambda: self._whois(ip))
+
+    def _whois(
+        self, ip: Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
+    ) -> tuple[str, dict[IPBaseKeys, Any]]:
+        if self.network_cache is not None:
+            return self.network_cache.get_or_fetch(ip, lambda: self._query_whois(ip))
+        return self._query_whois(ip)
+
+    def _query_whois(
+        self, ip: Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
+    ) -> tuple[str, dict[IPBaseKeys, Any]]:
         query_chain: list[str] = self.query_obj.run(ip)
         authoritative_answer = query_chain[-1]
-        parsed_dict: dict[IPBaseKeys, Any] = {}
-        if isinstance(ip, ipaddress.IPv4Address):
-            parsed_dict = self.parse_obj.parse(authoritative_answer, ip)
+        parsed_dict = self.parse_obj.parse(authoritative_answer, ip, self.fields)
         query_string = (
             authoritative_answer if self.authoritative_only else "\n".join(query_chain)
         )
@@ -168,22 +521,58 @@ class NumberClient(Client):
     ) -> tuple[str, dict]:
         if not isinstance(ip, (ipaddress.IPv4Address, ipaddress.IPv6Address)):
             ip = convert_to_ip(ip)
-        if self.whodap_client is None:
-            await self.init_async_whodap_client(ipv4=(ip.version == 4))
-        query_resp = await self.whodap_client.aio_lookup(ip)
+        return await self._aio_coalesced_lookup(
+            ("rdap", ip), lambda: self._aio_rdap(ip)
+        )
+
+    async def _aio_rdap(
+        self, ip: Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
+    ) -> tuple[str, dict]:
+
+        async def lookup() -> whodap.response.RDAPResponse:
+            if self.whodap_client is None:
+                await self.init_async_whodap_client(ipv4=(ip.version == 4))
+            return await self.whodap_client.aio_lookup(ip)
+
+        query_resp = await self._aio_rdap_lookup(
+            f"rdap:{ip}", self._rdap_response_type(ip), lookup
+        )
         query_string = query_resp.to_json()
-        return query_string, {}  # no parsed output available
+        # no parsed output available, so nothing goes through `parse_offload`
+        return query_string, {}
 
     async def aio_whois(
         self, ip: Union[ipaddress.IPv4Address, ipaddress.IPv6Address, str]
     ) -> tuple[str, dict[IPBaseKeys, Any]]:
         if not isinstance(ip, (ipaddress.IPv4Address, ipaddress.IPv6Address)):
             ip = convert_to_ip(ip)
+        return await self._aio_cached_lookup(("whois", ip), lambda: self._aio_whois(ip))
+
+    async def _aio_whois(
+        self, ip: Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
+    ) -> tuple[str, dict[IPBaseKeys, Any]]:
+        if self.network_cache is not None:
+            return await self.network_cache.aio_get_or_fetch(
+                ip, lambda: self._aio_query_whois(ip)
+            )
+        return await self._aio_query_whois(ip)
+
+    async def _aio_query_whois(
+        self, ip: Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
+    ) -> tuple[str, dict[IPBaseKeys, Any]]:
         query_chain: list[str] = await self.query_obj.aio_run(ip)
         authoritative_answer = query_chain[-1]
-        parsed_dict: dict[IPBaseKeys, Any] = {}
-        if isinstance(ip, ipaddress.IPv4Address):
-            parsed_dict = self.parse_obj.parse(authoritative_answer, ip)
+        parsed_dict = await self._aio_parse(
+            authoritative_answer,
+            lambda: self.parse_obj.parse(authoritative_answer, ip, self.fields),
+            functools.partial(
+                _parse_number,
+                authoritative_answer,
+                ip,
+                self.fields,
+                self.parse_obj.compact,
+            ),
+        )
         query_string = (
             authoritative_answer if self.authoritative_only else "\n".join(query_chain)
         )
@@ -195,20 +584,40 @@ class ASNClient(Client):
         self,
         whodap_client: whodap.ASNClient = None,
         timeout: int = 10,
+        coalesce: bool = False,
+        disk_cache: Optional[DiskCache] = None,
     ):
-        super().__init__(whodap_client)
+        super().__init__(whodap_client, coalesce=coalesce, disk_cache=disk_cache)
         self.timeout = timeout
 
     def rdap(self, asn: int) -> tuple[str, dict]:
-        if self.whodap_client is None:
-            self.init_whodap_client()
-        query_resp = self.whodap_client.lookup(asn)
+
+        def lookup() -> whodap.response.ASNResponse:
+            if self.whodap_client is None:
+                self.init_whodap_client()
+            return self.whodap_client.lookup(asn)
+
+        query_resp = self._rdap_lookup(
+            f"rdap:as{asn}", whodap.response.ASNResponse, lookup
+        )
         query_string = query_resp.to_json()
         return query_string, {}
 
     async def aio_rdap(self, asn: int) -> tuple[str, dict]:
-        if self.whodap_client is None:
-            await self.init_async_whodap_client()
-        query_resp = await self.whodap_client.aio_lookup(asn)
+        return await self._aio_coalesced_lookup(
+            ("rdap", asn), lambda: self._aio_rdap(asn)
+        )
+
+    async def _aio_rdap(self, asn: int) -> tuple[str, dict]:
+
+        async def lookup() -> whodap.response.ASNResponse:
+            if self.whodap_client is None:
+                await self.init_async_whodap_client()
+            return await self.whodap_client.aio_lookup(asn)
+
+        query_resp = await self._aio_rdap_lookup(
+            f"rdap:as{asn}", whodap.response.ASNResponse, lookup
+        )
         query_string = query_resp.to_json()
+        # no parsed output available, so nothing goes through `parse_offload`
         return query_string, {}
@@ -0,0 +1,215 @@
+"""Column-oriented export of parsed WHOIS output in fixed-size row groups"""
+
+import csv
+import datetime
+from enum import Enum
+from typing import IO, Any, Iterable, List, Mapping, Union
+
+from .bulk import LookupResult, LookupStatus
+from .parse import Fields, IPBaseKeys, TLDBaseKeys
+from .parse_rir import RIRParser
+from .tldparsers import TLDParser
+
+# (date keys, list keys) of each kind of parser output
+_COLUMN_KINDS = {
+    TLDBaseKeys: (TLDParser.date_keys, TLDParser.multiple_match_keys),
+    IPBaseKeys: (RIRParser.date_keys, RIRParser.multiple_match_keys),
+}
+
+
+class ColumnFormat(str, Enum):
+    # one parquet row group per flush; needs pyarrow
+    PARQUET = "parquet"
+    # Arrow IPC file with one record batch per flush; needs pyarrow
+    ARROW = "arrow"
+    # header plus one line per row; list values are joined with ";"
+    CSV = "csv"
+
+    def __repr__(self):
+        return self.value
+
+    def __str__(self):
+        return self.value
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "pyarrow is required for parquet and arrow output; "
+            "install it with `pip install asyncwhois[arrow]`"
+        ) from None
+    return pyarrow
+
+
+def _has_pyarrow() -> bool:
+    try:
+        _import_pyarrow()
+    except ImportError:
+        return False
+    return True
+
+
+class ColumnarWriter:
+    """
+    Accumulates parsed output in one column per `TLDBaseKeys` (or `IPBaseKeys`)
+    field, plus `search_term` and `lookup_status` columns, and writes every
+    `row_group_size` rows as one row group, so memory stays bounded however many
+    rows are appended.
+
+    With pyarrow, date fields are UTC timestamp columns (naive datetimes are
+    taken as UTC and unparsed date strings become null), `name_servers` and
+    `status` are list<string> columns and every other field is a string column.
+    """
+
+    def __init__(
+        self,
+        file: Union[str, IO],
+        key_type: type[Enum] = TLDBaseKeys,
+        fields: Fields = None,
+        output_format: Union[ColumnFormat, str, None] = None,
+        row_group_size: int = 10_000,
+    ):
+        """
+        :param file: path or binary file object (text file object for CSV) to write to
+        :param key_type: `TLDBaseKeys` for domain output or `IPBaseKeys` for ip output
+        :param fields: only write these keys; all keys of `key_type` if None
+        :param output_format: parquet, arrow or csv; parquet if pyarrow is installed,
+            otherwise csv
+        :param row_group_size: number of rows buffered before they are written
+        """
+        if row_group_size < 1:
+            raise ValueError("`row_group_size` must be a positive integer")
+        if output_format is None:
+            output_format = ColumnFormat.PARQUET if _has_pyarrow() else ColumnFormat.CSV
+        self.output_format = ColumnFormat(output_format)
+        self.pyarrow = None
+        if self.output_format != ColumnFormat.CSV:
+            self.pyarrow = _import_pyarrow()
+        self.row_group_size = row_group_size
+        self.keys = [k for k in key_type if fields is None or k in fields]
+        date_keys, list_keys = _COLUMN_KINDS[key_type]
+        self.date_keys = frozenset(date_keys)
+        self.list_keys = frozenset(list_keys)
+        self.names = ["search_term", "lookup_status", *(k.value for k in self.keys)]
+        self.columns: List[List[Any]] = [[] for _ in self.names]
+        self.rows_written = 0
+        self._owns_file = isinstance(file, str)
+        if self._owns_file:
+            mode = "w" if self.output_format == ColumnFormat.CSV else "wb"
+            newline = "" if self.output_format == ColumnFormat.CSV else None
+            file = open(file, mode, newline=newline)
+        self.file = file
+        self._writer: Any = None
+
+    def __enter__(self) -> "ColumnarWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        # rows appended, including the ones that are still buffered
+        return self.rows_written + len(self.columns[0])
+
+    def append(
+        self,
+        parser_output: Mapping[Any, Any],
+        search_term: Any = None,
+        status: Union[LookupStatus, str] = LookupStatus.OK,
+    ) -> None:
+        """
+        Adds one row; keys of `parser_output` outside the writer's fields are ignored
+        :param parser_output: the dict (or `LazyParseResult`, or record) from a parser
+        :param search_term: the domain or ip the output belongs to
+        :param status: the `LookupStatus` of the lookup
+        """
+        columns = self.columns
+        columns[0].append(None if search_term is None else str(search_term))
+        columns[1].append(str(status))
+        for column, key in zip(columns[2:], self.keys):
+            column.append(parser_output.get(key))
+        if len(columns[0]) >= self.row_group_size:
+            self.flush()
+
+    def extend(self, results: Iterable[LookupResult]) -> None:
+        """
+        Adds one row per `LookupResult`, e.g. from `parse_many` or `aio_whois_many`
+        :param results: lookup results; failed lookups are written with empty fields
+        """
+        for result in results:
+            self.append(result.parser_output, result.search_term, result.status)
+
+    def flush(self) -> None:
+        """Writes the buffered rows as one row group"""
+        rows = len(self.columns[0])
+        if not rows:
+            return
+        if self.output_format == ColumnFormat.CSV:
+            self._write_csv()
+        else:
+            self._write_arrow()
+        self.rows_written += rows
+        self.columns = [[] for _ in self.names]
+
+    def close(self) -> None:
+        """Writes the buffered rows and finishes the file"""
+        if self.file is None:
+            return
+        try:
+            self.flush()
+            if self._writer is not None and self.output_format != ColumnFormat.CSV:
+                self._writer.close()
+        finally:
+            if self._owns_file:
+                self.file.close()
+            self.file = None
+
+    def _write_csv(self) -> None:
+        if self._writer is None:
+            self._writer = csv.writer(self.file)
+            self._writer.writerow(self.names)
+        columns = self.columns[:2]
+        for column in self.columns[2:]:
+            columns.append([_csv_value(value) for value in column])
+        self._writer.writerows(zip(*columns))
+
+    def _write_arrow(self) -> None:
+        pa = self.pyarrow
+        arrays = [pa.array(self.columns[0], pa.string())]
+        arrays.append(pa.array(self.columns[1], pa.string()))
+        for column, key in zip(self.columns[2:], self.keys):
+            if key in self.date_keys:
+                values = [
+                    v if isinstance(v, datetime.datetime) else None for v in column
+                ]
+                arrays.append(pa.array(values, pa.timestamp("us", tz="UTC")))
+            elif key in self.list_keys:
+                values = [[v] if isinstance(v, str) else v or None for v in column]
+                arrays.append(pa.array(values, pa.list_(pa.string())))
+            else:
+                values = [None if v is None else str(v) for v in column]
+                arrays.append(pa.array(values, pa.string()))
+        batch = pa.RecordBatch.from_arrays(arrays, names=self.names)
+        if self._writer is None:
+            if self.output_format == ColumnFormat.PARQUET:
+                import pyarrow.parquet
+
+                self._writer = pyarrow.parquet.ParquetWriter(self.file, batch.schema)
+            else:
+                import pyarrow.ipc
+
+                self._writer = pyarrow.ipc.new_file(self.file, batch.schema)
+        if self.output_format == ColumnFormat.PARQUET:
+            self._writer.write_table(pa.Table.from_batches([batch]))
+        else:
+            self._writer.write_batch(batch)
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    if isinstance(value, list):
+        return ";".join(map(str, value))
+    return value
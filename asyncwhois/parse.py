@@ -1,7 +1,22 @@
 import re
+import time
+from collections import abc
 from enum import Enum
 from datetime import datetime
-from typing import Dict, List, Any, Union
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Any,
+    Mapping,
+    NamedTuple,
+)
+from typing import Optional, Pattern, Tuple, Union
 
 from dateutil.parser import parse, ParserError
 from dateutil import tz
@@ -190,14 +205,270 @@ def convert_whodap_keys(parser_output: dict) -> dict:
     return parser_output
 
 
+ExpressionTable = Mapping[Union[IPBaseKeys, TLDBaseKeys], Optional[Pattern[str]]]
+# keys a caller wants parsed; None means every key
+Fields = Optional[Collection[Union[IPBaseKeys, TLDBaseKeys, str]]]
+
+
+@lru_cache(maxsize=2048)
+def _compile(regex: str, flags: int) -> Pattern[str]:
+    # dedicated cache for the ad-hoc patterns used in `parse` overrides; unlike
+    # the `re` module's internal cache it is not shared with the rest of the program
+    return re.compile(regex, flags)
+
+
+# the ISO 8601 shapes most registries use, e.g. ICANN's "2024-01-31T23:59:59Z"
+_iso_date = re.compile(
+    r"(\d{4})-(\d\d)-(\d\d)"
+    r"(?:[T ](\d\d):(\d\d):(\d\d)(?:\.(\d+))?(Z|[+-]\d\d(?::?\d\d)?)?)?"
+)
+
+
+def _parse_iso_date(date_string: str, tzinfos: Mapping) -> Optional[datetime]:
+    """
+    Converts an `_iso_date` string to exactly what `dateutil.parser.parse` returns
+    for it, tzinfo included, or None if the string has to go through dateutil
+    :param date_string: a date string
+    :param tzinfos: the `timezone_info` passed to dateutil
+    """
+    match = _iso_date.fullmatch(date_string)
+    if not match:
+        return None
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    try:
+        naive = datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour or 0),
+            int(minute or 0),
+            int(second or 0),
+            # dateutil keeps the first six digits of the fraction
+            int(fraction.ljust(6, "0")[:6]) if fraction else 0,
+        )
+    except ValueError:
+        return None
+    if offset is None:
+        return naive
+    digits = offset[1:].replace(":", "")
+    seconds = int(digits[:2] or 0) * 3600 + int(digits[2:] or 0) * 60
+    if seconds:
+        sign = -1 if offset[0] == "-" else 1
+        return naive.replace(tzinfo=tz.tzoffset(None, sign * seconds))
+    # dateutil names a zero offset "UTC" and looks that name up before using tzutc
+    if "UTC" in tzinfos:
+        return None
+    if "UTC" in time.tzname:
+        aware = naive.replace(tzinfo=tz.tzlocal())
+        return aware if aware.tzname() == "UTC" else None
+    return naive.replace(tzinfo=tz.UTC)
+
+
+@lru_cache(maxsize=4096)
+def _cached_date(parser_class: type, date_string: str) -> Union[datetime, str]:
+    # registries repeat the same few timestamps across records, and the values
+    # (datetimes or the input string) are immutable, so they can be shared
+    return parser_class._convert_date(date_string)
+
+
+class ParseEngine(str, Enum):
+    # run every expression in `reg_expressions` over the whole blob
+    REGEX = "regex"
+    # split the blob into "label: value" lines once and look the labels up
+    LINES = "lines"
+
+    def __repr__(self):
+        return self.value
+
+    def __str__(self):
+        return self.value
+
+
+# (line number, text after a label's colon) found by `LineTable.scan`
+LineHit = Tuple[int, str]
+
+
+class LineField(NamedTuple):
+    """
+    An expression of the form `<label phrase>: *(.+)` (or `: (.+)`, `: (.*)`, `: *(.*)`)
+    that the line engine can answer without running it.
+    """
+
+    phrase: str  # lowercase label phrase, matched against the end of a line's label
+    single_space: bool  # exactly one space must follow the colon (`: (`)
+    empty: bool  # the value may be empty (`(.*)`)
+
+    def captures(self, hits: Iterable[LineHit]) -> Iterator[str]:
+        """
+        Yields what the expression captures from each line, in blob order. Lines
+        the expression does not match are skipped; like `re.search`, only the
+        leftmost match in a line counts.
+        """
+        matched_line = -1
+        for line_number, rest in hits:
+            if line_number == matched_line:
+                continue
+            if self.single_space:
+                if rest[:1] != " ":
+                    continue
+                captured = rest[1:]
+            else:
+                captured = rest.lstrip(" ")
+                if not captured and not self.empty:
+                    # " *" gives its last space back to "(.+)"
+                    captured = rest[-1:]
+            if captured or self.empty:
+                matched_line = line_number
+                yield captured
+
+
+class LineTable:
+    """
+    Label table used by the line engine, built from a parser's `reg_expressions`.
+
+    Expressions that are a literal label phrase followed by a colon and the
+    rest of the line become `LineField`s. A line matches a field when the text
+    before its first colon ends with the field's phrase (case-insensitively),
+    which is where `re.search` would find that expression, so the line engine
+    returns the same values as the regex engine. Every other expression is
+    left to the regex engine.
+    """
+
+    simple_expression = re.compile(
+        r"(?P<phrase>[\w /'-]+): (?P<star>\*?)\((?P<value>\.[+*])\)"
+    )
+
+    def __init__(self, expressions: Mapping[Any, str], flags: int):
+        self.fields: Dict[Any, LineField] = {}
+        # other flags change what "." or the phrase match
+        if flags & re.IGNORECASE and not flags & (re.DOTALL | re.VERBOSE):
+            for key, regex in expressions.items():
+                match = self.simple_expression.fullmatch(regex or "")
+                if match:
+                    self.fields[key] = LineField(
+                        phrase=match.group("phrase").lower(),
+                        single_space=not match.group("star"),
+                        empty=match.group("value") == ".*",
+                    )
+        self.phrases = frozenset(field.phrase for field in self.fields.values())
+        self.phrase_lengths = tuple(sorted({len(phrase) for phrase in self.phrases}))
+
+    def scan(
+        self, blob: str, phrases: Optional[Collection[str]] = None
+    ) -> Dict[str, List[LineHit]]:
+        """
+        Splits `blob` into lines once and returns {phrase: [(line number, text
+        after the colon), ...]} for every colon in `blob` directly preceded by a
+        known label phrase, in blob order.
+
+        :param phrases: only look for these phrases; all of `phrases` if None
+        """
+        hits: Dict[str, List[LineHit]] = {}
+        if phrases is None:
+            phrases, lengths = self.phrases, self.phrase_lengths
+        else:
+            phrases = frozenset(phrases)
+            lengths = sorted({len(phrase) for phrase in phrases})
+        if not phrases:
+            return hits
+        for line_number, line in enumerate(blob.split("\n")):
+            if ":" not in line:
+                continue
+            parts = line.split(":")
+            # a phrase never contains a colon, so it must end `parts[i]`
+            for i in range(len(parts) - 1):
+                part = parts[i]
+                for length in lengths:
+                    if length > len(part):
+                        break
+                    phrase = part[-length:].lower()
+                    if phrase in phrases:
+                        rest = ":".join(parts[i + 1 :])
+                        hits.setdefault(phrase, []).append((line_number, rest))
+        return hits
+
+
+class SectionTable:
+    """
+    Table for the section engine, built from a parser's `section_headers` and
+    `section_expressions`.
+
+    One pass over the blob finds every section header. A section is the text
+    after its header up to the next header or blank line, and each section
+    expression is only searched inside its own section, so a field missing from
+    one contact block is not read from the next one.
+    """
+
+    end = re.compile(r"\n[ \t\r]*\n")
+
+    def __init__(
+        self,
+        headers: Mapping[str, str],
+        expressions: Mapping[Any, Tuple[str, str]],
+        flags: int,
+    ):
+        self.names = list(headers)
+        self.header_pattern: Optional[Pattern[str]] = None
+        if headers:
+            self.header_pattern = _compile(
+                "|".join(
+                    f"(?P<_{i}>{regex})" for i, regex in enumerate(headers.values())
+                ),
+                flags | re.MULTILINE,
+            )
+        self.expressions: Dict[Any, Tuple[str, Pattern[str]]] = {
+            key: (section, _compile(regex, flags))
+            for key, (section, regex) in expressions.items()
+        }
+
+    def split(self, blob: str) -> Dict[str, str]:
+        """
+        Returns {section name: section text} for the first header of each section
+        :param blob: the whois server output
+        """
+        sections: Dict[str, str] = {}
+        if self.header_pattern is None:
+            return sections
+        headers = list(self.header_pattern.finditer(blob))
+        for i, header in enumerate(headers):
+            name = self.names[int(header.lastgroup[1:])]
+            if name in sections:
+                continue
+            end = headers[i + 1].start() if i + 1 < len(headers) else len(blob)
+            blank_line = self.end.search(blob, header.end(), end)
+            if blank_line:
+                end = blank_line.start()
+            sections[name] = blob[header.end() : end]
+        return sections
+
+
 class BaseParser:
-    reg_expressions = {}
+    # read-only once the class is created; see `update_reg_expressions`
+    reg_expressions: Mapping[Any, str] = MappingProxyType({})
+    # flags used to compile every pattern in `reg_expressions`
+    reg_flags: re.RegexFlag = re.IGNORECASE
+    # `reg_expressions` compiled once per class when the class is created;
+    # keys without an expression map to None
+    compiled_expressions: ExpressionTable = MappingProxyType({})
+    # how `parse` extracts the values of `reg_expressions`
+    parse_engine: ParseEngine = ParseEngine.REGEX
+    # label table for `ParseEngine.LINES`, built with `compiled_expressions`
+    line_table: LineTable = LineTable({}, re.IGNORECASE)
+    # {section name: regex matching the header line that opens the section}
+    section_headers: Mapping[str, str] = {}
+    # {key: (section name, regex)} for values read from inside one section only;
+    # these keys take precedence over `reg_expressions`
+    section_expressions: Mapping[Any, Tuple[str, str]] = {}
+    # section engine table, built with `compiled_expressions`
+    section_table: SectionTable = SectionTable({}, {}, re.IGNORECASE)
 
     date_keys = ()
     multiple_match_keys = ()
 
     # For handling special cases in TLD parser classes
     known_date_formats = []
+    # the known format that matched most recently, tried first by `_parse_date`
+    _last_date_format: Optional[str] = None
     # Extra formats that dateutil might not figure out
     extra_date_formats = [
         "%Y-%m-%dT%H:%M:%SZ[%Z]",  # 2007-01-26T19:10:31Z[UTC]
@@ -214,39 +485,177 @@ class BaseParser:
         "EEST": tz.gettz("Europe/Athens"),  # Eastern European Summertime UTC+3
     }
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        expressions = cls._build_reg_expressions()
+        # the values of section keys come from `section_table` instead
+        expressions.update({key: "" for key in cls.section_expressions})
+        cls.reg_expressions = MappingProxyType(expressions)
+        cls.compiled_expressions = cls.compile_expressions(cls.reg_expressions)
+        cls.line_table = LineTable(cls.reg_expressions, cls.reg_flags)
+        cls.section_table = SectionTable(
+            cls.section_headers, cls.section_expressions, cls.reg_flags
+        )
+
+    @classmethod
+    def _build_reg_expressions(cls) -> Dict[Any, str]:
+        """
+        Returns the `reg_expressions` table of the class being created. Subclasses
+        that layer several tables (e.g. base and TLD specific expressions) merge them here.
+        """
+        return dict(cls.reg_expressions)
+
+    @classmethod
+    def compile_expressions(cls, expressions: Mapping[Any, str]) -> ExpressionTable:
+        """
+        Compiles every regex in `expressions` with `reg_flags` into a read-only table
+        :param expressions: dict of keys/regexes
+        """
+        return MappingProxyType(
+            {
+                key: _compile(regex, cls.reg_flags) if regex else None
+                for key, regex in expressions.items()
+            }
+        )
+
     def update_reg_expressions(self, expressions_update: Dict[str, Any]) -> None:
         """
-        Updates the `reg_expressions` dictionary
+        Updates the `reg_expressions` dictionary of this instance; the class
+        tables shared by other instances are left untouched
         :param expressions_update: dict of keys/regexes to update
         """
-        self.reg_expressions.update(expressions_update)
-
-    def parse(self, blob: str) -> Dict[Union[IPBaseKeys, TLDBaseKeys], Any]:
+        self.reg_expressions = MappingProxyType(
+            {**self.reg_expressions, **expressions_update}
+        )
+        self.compiled_expressions = self.compile_expressions(self.reg_expressions)
+        self.line_table = LineTable(self.reg_expressions, self.reg_flags)
+
+    def parse(
+        self, blob: str, fields: Fields = None
+    ) -> Dict[Union[IPBaseKeys, TLDBaseKeys], Any]:
         """
-        Iterates over the `reg_expressions` dictionary attempting to use each regex to extract values
+        Iterates over the `compiled_expressions` table attempting to use each regex to extract values
         from `blob`, the output from the whois server.
 
         Assumes that the keys and regular expressions are formatted in the output `blob` such
         that a re.findall operation will work correctly. If this is not the case, you should implement
         your own version of this function in the appropriate BaseParser child class.
 
+        Subclasses that override this function should only do the work needed for `fields`
+        (see `wanted` and `project`).
+
         :param blob: the output from the whois server
+        :param fields: the keys to parse; all keys if None
         :return: dictionary of parsed key/value pairs
         """
-        parsed_output = {}
-        for key, regex in self.reg_expressions.items():
-            if not regex:
-                parsed_output[key] = None
+        extract = self.extractor(blob, fields)
+        return {
+            key: extract(key)
+            for key in self.compiled_expressions
+            if fields is None or key in fields
+        }
+
+    def parse_lazy(self, blob: str, fields: Fields = None) -> "LazyParseResult":
+        """
+        Same as `parse`, but returns a read-only mapping that extracts each value
+        the first time it is read.
+
+        :param blob: the output from the whois server
+        :param fields: the keys to parse; all keys if None
+        :return: mapping of parsed key/value pairs
+        """
+        return LazyParseResult(self, blob, fields)
+
+    @staticmethod
+    def wanted(fields: Fields, *keys: Union[IPBaseKeys, TLDBaseKeys]) -> bool:
+        """
+        Returns True if any of `keys` is in `fields`, i.e. if the `parse` work that
+        fills `keys` has to run
+        :param fields: the `fields` passed to `parse`
+        """
+        return fields is None or any(key in fields for key in keys)
+
+    @staticmethod
+    def project(parsed_output: Dict[Any, Any], fields: Fields) -> Dict[Any, Any]:
+        """
+        Drops the keys of `parsed_output` that are not in `fields`, e.g. keys a
+        `parse` override only extracted because other keys depend on them
+        :param parsed_output: output of `parse`
+        :param fields: the `fields` passed to `parse`
+        """
+        if fields is None:
+            return parsed_output
+        return {key: value for key, value in parsed_output.items() if key in fields}
+
+    def extractor(self, blob: str, fields: Fields = None) -> Callable[[Any], Any]:
+        """
+        Returns a function that extracts the value of one `compiled_expressions` key
+        from `blob`, the same value `parse` returns for it. Work shared by every key
+        (e.g. splitting `blob` into lines) is done once, here.
+
+        :param blob: the output from the whois server
+        :param fields: the keys that will be extracted, if known; all keys if None
+        """
+        if self.parse_engine == ParseEngine.LINES:
+            find = self._line_finder(blob, fields)
+        else:
+            find = self._regex_finder(blob)
+
+        section_expressions = self.section_table.expressions
+        sections = self.section_table.split(blob) if section_expressions else {}
+
+        def extract(key: Any) -> Any:
+            many = key in self.multiple_match_keys
+            if key in section_expressions:
+                name, pattern = section_expressions[key]
+                if name not in sections:
+                    return [] if many else None
+                value = self.find_match(pattern, sections[name], many=many)
             else:
-                many = key in self.multiple_match_keys
-                parsed_output[key] = self.find_match(regex, blob, many=many)
-                if key in self.date_keys and parsed_output.get(key, None):
-                    parsed_output[key] = self._parse_date(parsed_output.get(key))
-        return parsed_output
+                pattern = self.compiled_expressions[key]
+                if pattern is None:
+                    return None
+                value = find(key, pattern, many)
+            if value and key in self.date_keys:
+                value = self._parse_date(value)
+            return value
+
+        return extract
+
+    def _regex_finder(self, blob: str) -> Callable[[Any, Pattern[str], bool], Any]:
+        def find(key: Any, pattern: Pattern[str], many: bool) -> Any:
+            return self.find_match(pattern, blob, many=many)
+
+        return find
+
+    def _line_finder(
+        self, blob: str, fields: Fields = None
+    ) -> Callable[[Any, Pattern[str], bool], Any]:
+        """
+        `ParseEngine.LINES`: scans `blob` once for every label in `line_table`
+        (or every label of `fields`) and only runs the expressions it cannot answer.
+        """
+        line_fields = self.line_table.fields
+        phrases = None
+        if fields is not None:
+            phrases = {line_fields[k].phrase for k in fields if k in line_fields}
+        hits = self.line_table.scan(blob, phrases)
+
+        def find(key: Any, pattern: Pattern[str], many: bool) -> Any:
+            field = line_fields.get(key)
+            if field is None:
+                return self.find_match(pattern, blob, many=many)
+            captures = field.captures(hits.get(field.phrase, ()))
+            if many:
+                return [self._process(c) for c in captures if c]
+            captured = next(captures, None)
+            return None if captured is None else self._process(captured)
+
+        return find
 
     def find_match(
         self,
-        regex: str,
+        regex: Union[str, Pattern[str]],
         blob: str,
         flags: re.RegexFlag = re.IGNORECASE,
         many: bool = False,
@@ -254,16 +663,18 @@ class BaseParser:
         """
         Performs the given regex operation on the raw output `blob`
 
-        :param regex: the regex to use against blob
+        :param regex: the regex (or compiled pattern) to use against blob
         :param blob: the raw output from the whois server
-        :param flags: the optional flags to pass to the `re` method
+        :param flags: the optional flags used to compile `regex`; ignored for compiled patterns
         :param many: if True this function will use re.findall for many matches else re.search for single match
         """
+        if isinstance(regex, str):
+            regex = _compile(regex, flags)
         if many:
-            matches = re.findall(regex, blob, flags=flags)
+            matches = regex.findall(blob)
             return [self._process(m) for m in matches if m]
         else:
-            match = re.search(regex, blob, flags=flags)
+            match = regex.search(blob)
             if match:
                 return self._process(match.group(1))
             return None
@@ -294,7 +705,7 @@ class BaseParser:
         """
         matches = []
         regex_string = start + r"\s+([A-Za-z0-9\.\s]+\n\n)"
-        multiline_match = re.search(regex_string, blob, re.DOTALL | re.IGNORECASE)
+        multiline_match = _compile(regex_string, re.DOTALL | re.IGNORECASE).search(blob)
         if multiline_match:
             matches = self._process_many(multiline_match.group(1))
         return matches
@@ -302,10 +713,20 @@ class BaseParser:
     def _parse_date(self, date_string: str) -> Union[datetime, str]:
         """
         Attempts to convert the given date string to a datetime.datetime object
-        otherwise returns the input `date_string`
+        otherwise returns the input `date_string`. Conversions are memoized per
+        parser class, so the date formats and `timezone_info` are read from the class
         :param date_string: a date string
         :return: a datetime.datetime object
         """
+        return _cached_date(type(self), date_string)
+
+    @classmethod
+    def _convert_date(cls, date_string: str) -> Union[datetime, str]:
+        """
+        Uncached conversion behind `_parse_date`
+        :param date_string: a date string
+        :return: a datetime.datetime object or the input `date_string`
+        """
 
         def _datetime_or_none(dt_string: str, dt_format: str) -> Union[datetime, None]:
             try:
@@ -313,18 +734,30 @@ class BaseParser:
             except ValueError:
                 return None
 
-        # first, try the known formats
-        for date_format in self.known_date_formats:
+        # first, try the known formats; they never overlap, so the format that
+        # matched last time can be tried before the others
+        known_formats = cls.known_date_formats
+        if cls._last_date_format in known_formats:
+            known_formats = [cls._last_date_format] + [
+                date_format
+                for date_format in known_formats
+                if date_format != cls._last_date_format
+            ]
+        for date_format in known_formats:
             if date := _datetime_or_none(date_string, date_format):
+                cls._last_date_format = date_format
                 return date
+        # next, the common ISO 8601 shapes without going through dateutil
+        if date := _parse_iso_date(date_string, cls.timezone_info):
+            return date
         # next, try dateutil.parse
         try:
             clean_date_string = re.sub(r"\(([^)]+)\)", r"\1", date_string).strip()
-            return parse(clean_date_string, tzinfos=self.timezone_info)
+            return parse(clean_date_string, tzinfos=cls.timezone_info)
         except ParserError:
             pass
         # finally, try extra formats
-        for date_format in self.extra_date_formats:
+        for date_format in cls.extra_date_formats:
             if date := _datetime_or_none(date_string, date_format):
                 return date
         # no luck parsing
@@ -343,3 +776,67 @@ class BaseParser:
     def _process(match: str) -> str:
         if match:
             return match.rstrip("\r").rstrip("\n").lstrip("\t").lstrip().rstrip()
+
+
+class LazyParseResult(abc.Mapping):
+    """
+    Read-only mapping with the keys and values `parser.parse(blob, fields)`
+    returns, and equal to that dict. Each value is extracted the first time it is
+    read and kept. Parsers that override `parse` are run in full on the first
+    read, since their `parse` can change any value.
+    """
+
+    def __init__(self, parser: BaseParser, blob: str, fields: Fields = None):
+        self.parser = parser
+        self.blob = blob
+        self.fields = fields
+        self._values: Dict[Any, Any] = {}
+        self._extract: Optional[Callable[[Any], Any]] = None
+        self._per_key = type(parser).parse is BaseParser.parse
+        self._complete = False
+        if fields is None:
+            self._keys: Collection[Any] = parser.compiled_expressions
+        else:
+            self._keys = {k: None for k in parser.compiled_expressions if k in fields}
+
+    def _load(self) -> Dict[Any, Any]:
+        """Extracts every value that has not been read yet"""
+        if not self._complete:
+            if self._per_key:
+                for key in self._keys:
+                    self[key]
+            else:
+                self._values = self.parser.parse(self.blob, self.fields)
+            self._complete = True
+        return self._values
+
+    def __getitem__(self, key: Any) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            if not self._per_key:
+                return self._load()[key]
+            if key not in self._keys:
+                raise
+        if self._extract is None:
+            self._extract = self.parser.extractor(self.blob, self.fields)
+        value = self._values[key] = self._extract(key)
+        return value
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._per_key:
+            return iter(self._keys)
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        if self._per_key:
+            return len(self._keys)
+        return len(self._load())
+
+    def __contains__(self, key: Any) -> bool:
+        if self._per_key:
+            return key in self._keys
+        return key in self._load()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
@@ -1,9 +1,120 @@
 import ipaddress
 import re
-from typing import Dict, Any, Union
-
-from .parse import BaseParser, IPBaseKeys
-from .servers import IPv4Allocations
+from bisect import bisect_right
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, NamedTuple, Optional, Pattern, Tuple, Union
+
+from .errors import GeneralError
+from .parse import BaseParser, Fields, IPBaseKeys
+from .records import IPRecord
+from .servers import IPv4Allocations, IPv6Allocations
+
+
+class RPSLObject(NamedTuple):
+    # lower-cased name of the first attribute, e.g. "inetnum" or "role"
+    object_class: str
+    # (lower-cased name, value) of every attribute, in order
+    attributes: Tuple[Tuple[str, str], ...]
+    # the object as it appears in the response
+    text: str
+
+    def get(self, name: str) -> Optional[str]:
+        """
+        Returns the value of the first `name` attribute, or None
+        :param name: a lower-cased attribute name
+        """
+        for attribute, value in self.attributes:
+            if attribute == name:
+                return value
+        return None
+
+
+class RPSLIndex:
+    """
+    The objects of an RPSL response (RIPE, APNIC, AFRINIC and LACNIC whois output),
+    split on blank lines once and indexed by class and by handle, so contacts are
+    resolved with dict lookups instead of a search of the whole response per handle.
+    Objects are only broken into attributes when they are looked up.
+
+    :param blob: the whois server output
+    """
+
+    # attributes whose value other objects refer to, e.g. from "abuse-c" or "org"
+    handle_attributes = ("nic-hdl", "nic-hdl-br", "irt", "organisation")
+    _blank_lines = re.compile(r"\n[ \t\r]*\n(?:[ \t\r]*\n)*")
+    # "name: value" lines; comments and continuation lines do not start with a name
+    _attribute = re.compile(r"^([\w-]+):[ \t]*(.*?)[ \t\r]*$", re.M)
+    # a leading "\n" is much faster to search for than "^"
+    _handle = re.compile(r"\n(?:nic-hdl|nic-hdl-br|irt|organisation):[ \t]*(\S*)")
+
+    def __init__(self, blob: str):
+        self.blob = blob
+        # (start, end) of every blank line separated block, in order
+        self.spans: List[Tuple[int, int]] = []
+        start = 0
+        for blank_lines in self._blank_lines.finditer(blob):
+            self.spans.append((start, blank_lines.start()))
+            start = blank_lines.end()
+        self.spans.append((start, len(blob)))
+        # lower-cased handle -> index of the first block with it
+        self.by_handle: Dict[str, int] = {}
+        starts = [span_start for span_start, _ in self.spans]
+        # with the "\n" prepended, a match starts where its line starts in `blob`
+        for handle in self._handle.finditer("\n" + blob):
+            self.by_handle.setdefault(
+                handle.group(1).lower(), bisect_right(starts, handle.start()) - 1
+            )
+        self._objects: Dict[int, Optional[RPSLObject]] = {}
+        self._by_class: Optional[Dict[str, List[RPSLObject]]] = None
+
+    @property
+    def by_class(self) -> Dict[str, List[RPSLObject]]:
+        """
+        The objects grouped by lower-cased class, in order
+        """
+        if self._by_class is None:
+            self._by_class = {}
+            for i in range(len(self.spans)):
+                rpsl_object = self._object(i)
+                if rpsl_object is not None:
+                    self._by_class.setdefault(rpsl_object.object_class, []).append(
+                        rpsl_object
+                    )
+        return self._by_class
+
+    def get(self, handle: str) -> Optional[RPSLObject]:
+        """
+        Returns the object registered under `handle` (e.g. a "nic-hdl"), or None
+        :param handle: the handle, in any case
+        """
+        i = self.by_handle.get(handle.strip().lower())
+        return None if i is None else self._object(i)
+
+    def first(self, *object_classes: str) -> Optional[RPSLObject]:
+        """
+        Returns the first object of any of `object_classes`, or None
+        :param object_classes: lower-cased object classes, e.g. "inetnum"
+        """
+        for i, (start, end) in enumerate(self.spans):
+            match = self._attribute.search(self.blob, start, end)
+            if match and match.group(1).lower() in object_classes:
+                return self._object(i)
+        return None
+
+    def _object(self, i: int) -> Optional[RPSLObject]:
+        if i not in self._objects:
+            start, end = self.spans[i]
+            attributes = tuple(
+                (match.group(1).lower(), match.group(2))
+                for match in self._attribute.finditer(self.blob, start, end)
+            )
+            self._objects[i] = (
+                RPSLObject(attributes[0][0], attributes, self.blob[start:end])
+                if attributes
+                else None
+            )
+        return self._objects[i]
 
 
 class RIRParser(BaseParser):
@@ -15,7 +126,7 @@ class RIRParser(BaseParser):
     )
 
     # ARIN is used as "base" expression list
-    reg_expressions = {
+    base_expressions = {
         IPBaseKeys.NET_RANGE: r"NetRange: *(.+)",
         IPBaseKeys.CIDR: r"CIDR: *(.+)",
         IPBaseKeys.NET_NAME: r"NetName: *(.+)",
@@ -56,42 +167,168 @@ class RIRParser(BaseParser):
         IPBaseKeys.TECH_EMAIL: r"OrgTechEmail: *(.+)",
     }
 
+    rir_specific_expressions = {}
+
+    # {field: regex} read from each "nic-hdl" contact block by `parse` overrides
+    _contact_fields: Dict[str, str] = {}
+    # `_contact_fields` compiled once per class when the class is created
+    _contact_expressions: Mapping[str, Pattern[str]] = MappingProxyType({})
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._contact_expressions = cls.compile_expressions(cls._contact_fields)
+
+    @classmethod
+    def _build_reg_expressions(cls) -> Dict[IPBaseKeys, str]:
+        return {**cls.base_expressions, **cls.rir_specific_expressions}
+
+    @staticmethod
+    def _with_handles(fields: Fields) -> Fields:
+        """
+        Returns `fields` plus the contact handles that `parse` overrides need to
+        find the contact blocks
+        """
+        if fields is None:
+            return None
+        return {
+            *fields,
+            IPBaseKeys.ABUSE_HANDLE,
+            IPBaseKeys.TECH_HANDLE,
+            IPBaseKeys.ROUTING_HANDLE,
+        }
+
+    @classmethod
+    def _contact_keys(cls, prefix: str) -> list[IPBaseKeys]:
+        return [
+            getattr(IPBaseKeys, f"{prefix}_{field}".upper())
+            for field in cls._contact_fields
+        ]
+
+
+class RPSLParser(RIRParser):
+    """
+    Base class of the RIRs that answer with RPSL objects. Contacts are looked up by
+    handle in an `RPSLIndex`, and values the expressions miss (e.g. the range of an
+    IPv6 "inet6num" object) are taken from the network object via `rpsl_keys`.
+    """
+
+    # generic network object attribute -> key table
+    rpsl_keys: Mapping[str, IPBaseKeys] = MappingProxyType(
+        {
+            "inetnum": IPBaseKeys.NET_RANGE,
+            "inet6num": IPBaseKeys.NET_RANGE,
+            "netname": IPBaseKeys.NET_NAME,
+            "status": IPBaseKeys.NET_TYPE,
+            "descr": IPBaseKeys.ORGANIZATION,
+            "country": IPBaseKeys.ORG_COUNTRY,
+            "created": IPBaseKeys.REG_DATE,
+            "last-modified": IPBaseKeys.UPDATED,
+            "abuse-c": IPBaseKeys.ABUSE_HANDLE,
+            "admin-c": IPBaseKeys.ROUTING_HANDLE,
+            "tech-c": IPBaseKeys.TECH_HANDLE,
+        }
+    )
+    # contact fields that join every match with ", " instead of keeping the first
+    _joined_contact_fields: Tuple[str, ...] = ("address",)
+
+    def parse(self, blob: str, fields: Fields = None) -> Dict[IPBaseKeys, Any]:
+        internal_fields = self._with_handles(fields)
+        parser_output = super().parse(blob, internal_fields)
+        index = RPSLIndex(blob)
+        network = index.first("inetnum", "inet6num")
+        if network is not None:
+            for attribute, value in network.attributes:
+                key = self.rpsl_keys.get(attribute)
+                if key is None or parser_output.get(key) is not None or not value:
+                    continue
+                if self.wanted(internal_fields, key):
+                    if key in self.date_keys:
+                        value = self._parse_date(value)
+                    parser_output[key] = value
+        contact_field_fills = (
+            ("abuse", parser_output.get(IPBaseKeys.ABUSE_HANDLE)),
+            ("tech", parser_output.get(IPBaseKeys.TECH_HANDLE)),
+            ("routing", parser_output.get(IPBaseKeys.ROUTING_HANDLE)),
+        )
+        # parse the contact info from the object of each handle
+        for prefix, handle in contact_field_fills:
+            if not handle or not self.wanted(fields, *self._contact_keys(prefix)):
+                continue
+            contact = index.get(handle)
+            if contact is None:
+                continue
+            for field, field_regex in self._contact_expressions.items():
+                key = getattr(IPBaseKeys, f"{prefix}_{field}".upper())
+                if not self.wanted(fields, key):
+                    continue
+                if field in self._joined_contact_fields:
+                    values = self.find_match(field_regex, contact.text, many=True)
+                    parser_output[key] = ", ".join(values) if values else ""
+                else:
+                    parser_output[key] = self.find_match(field_regex, contact.text)
+        return self.project(parser_output, fields)
+
 
 class NumberParser:
-    def __init__(self):
+    def __init__(self, lazy: bool = False, compact: bool = False):
         self.servers = IPv4Allocations()
+        self.ipv6_servers = IPv6Allocations()
+        # return a `LazyParseResult` that extracts each value when it is first read
+        self.lazy = lazy
+        # return a slotted `IPRecord` instead of a dict (ignored if `lazy`)
+        self.compact = compact
 
     def parse(
         self,
         blob: str,
-        ip: Union[ipaddress.IPv4Address],
-    ) -> dict[IPBaseKeys, Any]:
-        _, server = self.servers.get_servers(ip)
+        ip: Union[ipaddress.IPv4Address, ipaddress.IPv6Address],
+        fields: Fields = None,
+    ) -> Mapping[IPBaseKeys, Any]:
+        if isinstance(ip, ipaddress.IPv6Address):
+            try:
+                _, server = self.ipv6_servers.get_servers(ip)
+            except GeneralError:
+                # not allocated to an RIR
+                server = None
+        else:
+            _, server = self.servers.get_servers(ip)
         parser = self._init_parser(server)
-        return parser.parse(blob)
+        if self.lazy:
+            return parser.parse_lazy(blob, fields)
+        if self.compact:
+            return IPRecord(parser.parse(blob, fields))
+        return parser.parse(blob, fields)
 
     @staticmethod
-    def _init_parser(rir_server: str) -> RIRParser:
-        if rir_server == "whois.arin.net":
-            return ARINParser()
-        elif rir_server == "whois.afrinic.net":
-            return AFRINICParser()
-        elif rir_server == "whois.apnic.net":
-            return APNICParser()
-        elif rir_server == "whois.lacnic.net":
-            return LACNICParser()
-        elif rir_server == "whois.ripe.net":
-            return RIPEParser()
-        else:
-            return ARINParser()  # default
+    def _init_parser(rir_server: Optional[str]) -> RIRParser:
+        """
+        Returns the shared parser instance for `rir_server`; ARIN's by default
+        :param rir_server: the whois server of the RIR
+        """
+        parsers = _rir_parsers()
+        return parsers.get(rir_server) or parsers["whois.arin.net"]
+
+
+@lru_cache(maxsize=None)
+def _rir_parsers() -> Mapping[str, RIRParser]:
+    # RIR whois server -> shared parser instance; parsers keep no state between parses
+    return MappingProxyType(
+        {
+            "whois.arin.net": ARINParser(),
+            "whois.afrinic.net": AFRINICParser(),
+            "whois.apnic.net": APNICParser(),
+            "whois.lacnic.net": LACNICParser(),
+            "whois.ripe.net": RIPEParser(),
+        }
+    )
 
 
 class ARINParser(RIRParser):  # default
-    def __init__(self): ...
+    pass
 
 
-class AFRINICParser(RIRParser):
-    _afrinic = {
+class AFRINICParser(RPSLParser):
+    rir_specific_expressions = {
         IPBaseKeys.NET_RANGE: r"inetnum: *(.+)",
         IPBaseKeys.NET_NAME: r"netname: *(.+)",
         IPBaseKeys.NET_TYPE: r"status: *(.+)",
@@ -123,38 +360,12 @@ class AFRINICParser(RIRParser):
         "name": r"(?:role|person): *(.+)",
         "address": r"address: *(.+)",
     }
+    # AFRINIC keeps the first address line
+    _joined_contact_fields = ()
 
-    def __init__(self):
-        self.update_reg_expressions(self._afrinic)
 
-    def parse(self, blob: str) -> Dict[IPBaseKeys, Any]:
-        parser_output = super().parse(blob)
-        contact_field_fills = (
-            ("abuse", parser_output.get(IPBaseKeys.ABUSE_HANDLE)),
-            ("tech", parser_output.get(IPBaseKeys.TECH_HANDLE)),
-            ("routing", parser_output.get(IPBaseKeys.ROUTING_HANDLE)),
-        )
-        # parse the contact info by looking up each "nic-hdl"
-        for prefix, handle in contact_field_fills:
-            if handle:
-                pattern = re.compile(
-                    r"(?:role|person):.+\n(?:.+\n){{1,}}nic-hdl: *{nic_hdl}\n(?:.+\n){{1,}}".format(
-                        nic_hdl=handle
-                    ),
-                    flags=re.I,
-                )
-                contact_blob = pattern.search(blob)
-                if contact_blob:
-                    for field, field_regex in self._contact_fields.items():
-                        key = getattr(IPBaseKeys, f"{prefix}_{field}".upper())
-                        parser_output[key] = self.find_match(
-                            field_regex, contact_blob.group()
-                        )
-        return parser_output
-
-
-class APNICParser(RIRParser):
-    _apnic = {
+class APNICParser(RPSLParser):
+    rir_specific_expressions = {
         IPBaseKeys.NET_RANGE: r"inetnum: *(.+)",
         IPBaseKeys.NET_NAME: r"netname: *(.+)",
         IPBaseKeys.NET_TYPE: r"status: *(.+)",
@@ -185,46 +396,9 @@ class APNICParser(RIRParser):
         "address": r"address: *(.+)",
     }
 
-    def __init__(self):
-        self.update_reg_expressions(self._apnic)
 
-    def parse(self, blob: str) -> Dict[IPBaseKeys, Any]:
-        parser_output = super().parse(blob)
-        contact_field_fills = (
-            ("abuse", parser_output.get(IPBaseKeys.ABUSE_HANDLE)),
-            ("tech", parser_output.get(IPBaseKeys.TECH_HANDLE)),
-            ("routing", parser_output.get(IPBaseKeys.ROUTING_HANDLE)),
-        )
-        # parse the contact info by looking up each "nic-hdl"
-        for prefix, handle in contact_field_fills:
-            if handle:
-                pattern = re.compile(
-                    r"(?:role|person):.+\n(?:.+\n){{0,}}nic-hdl: *{nic_hdl}\n(?:.+\n){{1,}}".format(
-                        nic_hdl=handle
-                    ),
-                    flags=re.I,
-                )
-                contact_blob = pattern.search(blob)
-                if contact_blob:
-                    for field, field_regex in self._contact_fields.items():
-                        key = getattr(IPBaseKeys, f"{prefix}_{field}".upper())
-                        if field == "address":
-                            addresses = self.find_match(
-                                field_regex, contact_blob.group(), many=True
-                            )
-                            parser_output[key] = (
-                                ", ".join(addresses) if addresses else ""
-                            )
-                        else:
-                            parser_output[key] = self.find_match(
-                                field_regex, contact_blob.group()
-                            )
-
-        return parser_output
-
-
-class LACNICParser(RIRParser):
-    _lacnic = {
+class LACNICParser(RPSLParser):
+    rir_specific_expressions = {
         IPBaseKeys.NET_RANGE: r"inetnum: *(.+)",
         IPBaseKeys.CIDR: r"inetrev: *(.+)",
         IPBaseKeys.NET_HANDLE: r"ownerid: *(.+)",
@@ -259,41 +433,9 @@ class LACNICParser(RIRParser):
         "address": r"address: *(.+)",
     }
 
-    def __init__(self):
-        self.update_reg_expressions(self._lacnic)
 
-    def parse(self, blob: str) -> Dict[IPBaseKeys, Any]:
-        parser_output = super().parse(blob)
-        contact_field_fills = (
-            ("abuse", parser_output.get(IPBaseKeys.ABUSE_HANDLE)),
-            ("tech", parser_output.get(IPBaseKeys.TECH_HANDLE)),
-            ("routing", parser_output.get(IPBaseKeys.ROUTING_HANDLE)),
-        )
-        # parse contact info using each "nic-hdl"
-        for prefix, handle in contact_field_fills:
-            pattern = re.compile(
-                r"nic-hdl(?:.){{0,}}:*{nic_hdl}\n(?:.+\n){{1,}}".format(nic_hdl=handle),
-                flags=re.I,
-            )
-            contact_blob = pattern.search(blob)
-            if contact_blob:
-                for field, field_regex in self._contact_fields.items():
-                    key = getattr(IPBaseKeys, f"{prefix}_{field}".upper())
-                    if field == "address":
-                        addresses = self.find_match(
-                            field_regex, contact_blob.group(), many=True
-                        )
-                        parser_output[key] = ", ".join(addresses) if addresses else ""
-                    else:
-                        parser_output[key] = self.find_match(
-                            field_regex, contact_blob.group()
-                        )
-
-        return parser_output
-
-
-class RIPEParser(RIRParser):
-    _ripe = {
+class RIPEParser(RPSLParser):
+    rir_specific_expressions = {
         IPBaseKeys.NET_RANGE: r"inetnum: *(.+)",
         IPBaseKeys.NET_NAME: r"netname: *(.+)",
         IPBaseKeys.NET_TYPE: r"status: *(.+)",
@@ -321,40 +463,3 @@ class RIPEParser(RIRParser):
         "name": r"(?:role|person): *(.+)",
         "address": r"address: *(.+)",
     }
-
-    def __init__(self):
-        self.update_reg_expressions(self._ripe)
-
-    def parse(self, blob: str) -> Dict[IPBaseKeys, Any]:
-        parser_output = super().parse(blob)
-        contact_field_fills = (
-            ("abuse", parser_output.get(IPBaseKeys.ABUSE_HANDLE)),
-            ("tech", parser_output.get(IPBaseKeys.TECH_HANDLE)),
-            ("routing", parser_output.get(IPBaseKeys.ROUTING_HANDLE)),
-        )
-        # parse the contact info by looking up each "nic-hdl"
-        for prefix, handle in contact_field_fills:
-            if handle:
-                pattern = re.compile(
-                    r"(?:role|person):.+\n(?:.+\n){{1,}}nic-hdl: *{nic_hdl}\n(?:.+\n){{1,}}".format(
-                        nic_hdl=handle
-                    ),
-                    flags=re.I,
-                )
-                contact_blob = pattern.search(blob)
-                if contact_blob:
-                    for field, field_regex in self._contact_fields.items():
-                        key = getattr(IPBaseKeys, f"{prefix}_{field}".upper())
-                        if field == "address":
-                            addresses = self.find_match(
-                                field_regex, contact_blob.group(), many=True
-                            )
-                            parser_output[key] = (
-                                ", ".join(addresses) if addresses else ""
-                            )
-                        else:
-                            parser_output[key] = self.find_match(
-                                field_regex, contact_blob.group()
-                            )
-
-        return parser_output
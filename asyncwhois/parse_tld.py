@@ -1,9 +1,61 @@
-from typing import Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional
 
-from .parse import TLDBaseKeys
+from .parse import Fields, TLDBaseKeys
 from .errors import NotFoundError
+from .records import DomainRecord
 from . import tldparsers
 
+# characters at the start of a response searched for not-found phrases by default;
+# registries print them in the first few lines, after at most a short banner
+NOT_FOUND_WINDOW = 4096
+
+
+@lru_cache(maxsize=None)
+def _tld_parsers() -> Mapping[str, tldparsers.TLDParser]:
+    """
+    Maps each upper-cased TLD with a `Regex<TLD>` class in `tldparsers` to one shared
+    instance of that class, and "" to the shared `TLDParser`. Parsers keep no state
+    between parses, so the instances are safe to share across lookups and threads.
+    """
+    parsers = {
+        name[len("Regex") :]: cls()
+        for name, cls in vars(tldparsers).items()
+        if name.startswith("Regex")
+    }
+    parsers[""] = tldparsers.TLDParser()
+    return MappingProxyType(parsers)
+
+
+class NotFoundMatcher:
+    """
+    Precompiled, case-insensitive check for "no such domain" phrases.
+
+    Only the searched window is lowercased, once; the phrases are then looked up
+    with plain substring searches, which in CPython are much faster than a single
+    case-insensitive alternation regex over the original text.
+
+    :param phrases: the not-found phrases
+    :param window: search only the first `window` characters of a response;
+        the whole response if None
+    """
+
+    def __init__(self, phrases: Iterable[str], window: Optional[int] = None):
+        self.phrases = tuple(dict.fromkeys(phrase.lower() for phrase in phrases))
+        self.window = window
+
+    def search(self, blob: str) -> Optional[str]:
+        """
+        Returns the first phrase found in `blob`, or None
+        :param blob: the whois server output
+        """
+        low_blob = (blob if self.window is None else blob[: self.window]).lower()
+        for phrase in self.phrases:
+            if phrase in low_blob:
+                return phrase
+        return None
+
 
 class DomainParser:
     _no_match_checks = [
@@ -18,34 +70,62 @@ class DomainParser:
         "domain you requested is not known",
     ]
 
-    def __init__(self, ignore_not_found: bool = False) -> None:
+    def __init__(
+        self,
+        ignore_not_found: bool = False,
+        lazy: bool = False,
+        not_found_window: Optional[int] = NOT_FOUND_WINDOW,
+        compact: bool = False,
+    ) -> None:
         self.ignore_not_found = ignore_not_found
+        # return a `LazyParseResult` that extracts each value when it is first read
+        self.lazy = lazy
+        # return a slotted `DomainRecord` instead of a dict (ignored if `lazy`)
+        self.compact = compact
+        # only the first `not_found_window` characters are searched for not-found
+        # phrases; the whole response if None
+        self.not_found_window = not_found_window
+        self._matchers: Dict[type, NotFoundMatcher] = {}
 
-    def parse(self, blob: str, tld: str) -> dict[TLDBaseKeys, Any]:
-        low_blob = blob.lower()
-        if not self.ignore_not_found and any(
-            n in low_blob for n in self._no_match_checks
-        ):
-            raise NotFoundError("Domain not found!")
+    def parse(
+        self, blob: str, tld: str, fields: Fields = None
+    ) -> Mapping[TLDBaseKeys, Any]:
         parser = self._init_parser(tld)
-        return parser.parse(blob)
+        if not self.ignore_not_found and self._not_found_matcher(parser).search(blob):
+            raise NotFoundError("Domain not found!")
+        if self.lazy:
+            return parser.parse_lazy(blob, fields)
+        if self.compact:
+            return DomainRecord(parser.parse(blob, fields))
+        return parser.parse(blob, fields)
+
+    def _not_found_matcher(self, parser: tldparsers.TLDParser) -> NotFoundMatcher:
+        """
+        Returns the matcher for the not-found phrases of the `parser` class:
+        `_no_match_checks` plus the TLD specific `no_match_checks`
+        """
+        matcher = self._matchers.get(type(parser))
+        if matcher is None:
+            matcher = NotFoundMatcher(
+                [*self._no_match_checks, *parser.no_match_checks],
+                self.not_found_window,
+            )
+            self._matchers[type(parser)] = matcher
+        return matcher
 
     @staticmethod
     def _init_parser(tld: str) -> tldparsers.TLDParser:
         """
         Retrieves the parser instance which can most accurately extract
         key/value pairs from the whois server output for the given `tld`.
+        The instances are shared, so treat them as read-only.
 
         :param tld: the top level domain
         :return: instance of TLDParser or a TLDParser subclass
         """
-
-        try:
-            cls_ = getattr(tldparsers, f"Regex{tld.upper()}")
-        except AttributeError:
-            # The TLDParser can handle all "Generic" and some "Country-Code"
-            # TLDs.  If the parsed output of lookup is not what you expect or
-            # even incorrect, check and modify the existing Regex subclass or
-            # create a new one.
-            cls_ = tldparsers.TLDParser
-        return cls_()
+        parsers = _tld_parsers()
+        # The TLDParser can handle all "Generic" and some "Country-Code"
+        # TLDs.  If the parsed output of lookup is not what you expect or
+        # even incorrect, check and modify the existing Regex subclass or
+        # create a new one.
+        return parsers.get(tld.upper()) or parsers[""]
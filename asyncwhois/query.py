@@ -1,14 +1,24 @@
 import asyncio
 import ipaddress
+import json
 import re
 import socket
-from typing import Tuple, Generator, Union, Optional
+from typing import Tuple, Generator, AsyncGenerator, Union, Optional
 from contextlib import contextmanager, asynccontextmanager
 
 from python_socks.sync import Proxy
 from python_socks.async_.asyncio import Proxy as AsyncProxy
 
-from .servers import IPv4Allocations, CountryCodeTLD, GenericTLD, SponsoredTLD
+from .cache import DiskCache, ReferralCache
+from .ratelimit import RateGovernor
+from .errors import GeneralError
+from .servers import (
+    IPv4Allocations,
+    IPv6Allocations,
+    CountryCodeTLD,
+    GenericTLD,
+    SponsoredTLD,
+)
 
 BLOCKSIZE = 1500
 
@@ -24,10 +34,16 @@ class Query:
         proxy_url: Optional[str] = None,
         timeout: int = 10,
         find_authoritative_server: bool = True,
+        rate_governor: Optional[RateGovernor] = None,
+        referral_cache: Optional[ReferralCache] = None,
+        disk_cache: Optional[DiskCache] = None,
     ):
         self.proxy_url = proxy_url
         self.timeout = timeout
         self.find_authoritative_server = find_authoritative_server
+        self.rate_governor = rate_governor
+        self.referral_cache = referral_cache
+        self.disk_cache = disk_cache
 
     @staticmethod
     def _find_match(regex: str, blob: str) -> str:
@@ -111,17 +127,66 @@ class Query:
         """
         Submits the `search_term` to the WHOIS server and returns a list of query responses.
         """
+        if self.disk_cache is None:
+            return self._run(search_term, server)
+        key = self._disk_cache_key(search_term)
+        cached = self.disk_cache.get(key)
+        if cached is not None:
+            return json.loads(cached)
+        chain = self._run(search_term, server)
+        self.disk_cache.set(key, json.dumps(chain), server or self.iana_server)
+        return chain
+
+    async def aio_run(
+        self, search_term: str, server: Optional[str] = None
+    ) -> list[str]:
+        if self.disk_cache is None:
+            return await self._aio_run(search_term, server)
+        key = self._disk_cache_key(search_term)
+        cached = await self.disk_cache.aio_get(key)
+        if cached is not None:
+            return json.loads(cached)
+        chain = await self._aio_run(search_term, server)
+        self.disk_cache.set(key, json.dumps(chain), server or self.iana_server)
+        return chain
+
+    def _disk_cache_key(self, search_term: str) -> str:
+        # chains that stop at the first server must not be served to callers
+        # that follow referrals (and vice versa)
+        prefix = "whois" if self.find_authoritative_server else "whois-first-hop"
+        return f"{prefix}:{search_term.lower()}"
+
+    def _run(self, search_term: str, server: Optional[str] = None) -> list[str]:
         data = search_term + "\r\n"
         if not server:
-            # TODO: think about moving this to subclass
-            if ":" in data:  # ipv6
-                server_regex = r"whois: *(.+)"
-            else:
-                server_regex = self.refer_regex
-            server = self.iana_server
-        else:
-            server_regex = self.whois_server_regex
-        return self._do_query(server, data, server_regex, [])
+            server_regex = self._iana_server_regex(search_term)
+            if self.referral_cache is None:
+                return self._do_query(self.iana_server, data, server_regex, [])
+            referral = self.referral_cache.get(search_term)
+            if referral is None:
+                iana_output = self._query_server(self.iana_server, data)
+                referral = (self._find_match(server_regex, iana_output), iana_output)
+                self.referral_cache.set(search_term, *referral)
+            whois_server, iana_output = referral
+            chain = [iana_output]
+            if self._follow_referral(whois_server):
+                chain = self._do_query(
+                    whois_server, data, self.whois_server_regex, chain
+                )
+            return chain
+        return self._do_query(server, data, self.whois_server_regex, [])
+
+    @staticmethod
+    def _iana_server_regex(search_term: str) -> str:
+        # TODO: think about moving this to subclass
+        if ":" in search_term:  # ipv6
+            return r"whois: *(.+)"
+        return Query.refer_regex
+
+    def _follow_referral(self, whois_server: str) -> bool:
+        return self.find_authoritative_server and self._continue_querying(
+            self.iana_server, whois_server
+        )
 
     @staticmethod
     def _continue_querying(current_server: str, next_server: str) -> bool:
@@ -133,19 +198,70 @@ class Query:
             and not next_server.startswith("www.")
         )
 
-    async def aio_run(
+    async def _aio_run(
         self, search_term: str, server: Optional[str] = None
     ) -> list[str]:
         data = search_term + "\r\n"
         if not server:
-            if ":" in data:  # ipv6
-                server_regex = r"whois: *(.+)"
-            else:
-                server_regex = self.refer_regex
-            server = self.iana_server
+            server_regex = self._iana_server_regex(search_term)
+            if self.referral_cache is None:
+                return await self._aio_do_query(
+                    self.iana_server, data, server_regex, []
+                )
+            referral = self.referral_cache.get(search_term)
+            if referral is None:
+                iana_output = await self._aio_query_server(self.iana_server, data)
+                referral = (self._find_match(server_regex, iana_output), iana_output)
+                self.referral_cache.set(search_term, *referral)
+            whois_server, iana_output = referral
+            chain = [iana_output]
+            if self._follow_referral(whois_server):
+                chain = await self._aio_do_query(
+                    whois_server, data, self.whois_server_regex, chain
+                )
+            return chain
+        return await self._aio_do_query(server, data, self.whois_server_regex, [])
+
+    @contextmanager
+    def _rate_limit(self, server: str) -> Generator[None, None, None]:
+        if self.rate_governor is None:
+            yield
+        else:
+            with self.rate_governor.limit(server):
+                yield
+
+    @asynccontextmanager
+    async def _aio_rate_limit(self, server: str) -> AsyncGenerator[None, None]:
+        if self.rate_governor is None:
+            yield
         else:
-            server_regex = self.whois_server_regex
-        return await self._aio_do_query(server, data, server_regex, [])
+            async with self.rate_governor.aio_limit(server):
+                yield
+
+    def _query_server(self, server: str, data: str) -> str:
+        """
+        Submits `data` to a single WHOIS server and returns the raw response.
+        """
+        with self._rate_limit(server):
+            # connect to whois://<server>:43
+            with self._create_connection(
+                (server, self.whois_port), self.proxy_url
+            ) as conn:
+                # submit domain and receive raw query output
+                return self._send_and_recv(conn, data)
+
+    async def _aio_query_server(self, server: str, data: str) -> str:
+        async with self._aio_rate_limit(server):
+            # connect to whois://<server>:43
+            async with self._aio_create_connection(
+                (server, self.whois_port), self.proxy_url
+            ) as r_and_w:
+                # socket reader and writer
+                reader, writer = r_and_w
+                # submit domain and receive raw query output
+                return await asyncio.wait_for(
+                    self._aio_send_and_recv(reader, writer, data), self.timeout
+                )
 
     def _do_query(
         self, server: str, data: str, regex: str, chain: list[str]
@@ -153,49 +269,37 @@ class Query:
         """
         Recursively submits WHOIS queries until it reaches the Authoritative Server.
         """
-        # connect to whois://<server>:43
-        with self._create_connection((server, self.whois_port), self.proxy_url) as conn:
-            # submit domain and receive raw query output
-            query_output = self._send_and_recv(conn, data)
-            # save query chain
-            chain.append(query_output)
-            # if we should find the authoritative response,
-            # then parse the response for the next server
-            if self.find_authoritative_server:
-                # parse response for the referred WHOIS server name
-                whois_server = self._find_match(regex, query_output)
-                if self._continue_querying(server, whois_server):
-                    # recursive call to find more authoritative server
-                    chain = self._do_query(
-                        whois_server, data, self.whois_server_regex, chain
-                    )
+        query_output = self._query_server(server, data)
+        # save query chain
+        chain.append(query_output)
+        # if we should find the authoritative response,
+        # then parse the response for the next server
+        if self.find_authoritative_server:
+            # parse response for the referred WHOIS server name
+            whois_server = self._find_match(regex, query_output)
+            if self._continue_querying(server, whois_server):
+                # recursive call to find more authoritative server
+                chain = self._do_query(
+                    whois_server, data, self.whois_server_regex, chain
+                )
         # return the WHOIS query chain
         return chain
 
     async def _aio_do_query(
         self, server: str, data: str, regex: str, chain: list[str]
     ) -> list[str]:
-        # connect to whois://<server>:43
-        async with self._aio_create_connection(
-            (server, self.whois_port), self.proxy_url
-        ) as r_and_w:
-            # socket reader and writer
-            reader, writer = r_and_w
-            # submit domain and receive raw query output
-            query_output = await asyncio.wait_for(
-                self._aio_send_and_recv(reader, writer, data), self.timeout
-            )
-            chain.append(query_output)
-            # if we should find the authoritative response,
-            # then parse the response for the next server
-            if self.find_authoritative_server:
-                # parse response for the referred WHOIS server name
-                whois_server = self._find_match(regex, query_output)
-                if self._continue_querying(server, whois_server):
-                    # recursive call to find more authoritative server
-                    chain = await self._aio_do_query(
-                        whois_server, data, self.whois_server_regex, chain
-                    )
+        query_output = await self._aio_query_server(server, data)
+        chain.append(query_output)
+        # if we should find the authoritative response,
+        # then parse the response for the next server
+        if self.find_authoritative_server:
+            # parse response for the referred WHOIS server name
+            whois_server = self._find_match(regex, query_output)
+            if self._continue_querying(server, whois_server):
+                # recursive call to find more authoritative server
+                chain = await self._aio_do_query(
+                    whois_server, data, self.whois_server_regex, chain
+                )
         # return the WHOIS query chain
         return chain
 
@@ -207,8 +311,18 @@ class DomainQuery(Query):
         proxy_url: Optional[str] = None,
         timeout: int = 10,
         find_authoritative_server: bool = True,
+        rate_governor: Optional[RateGovernor] = None,
+        referral_cache: Optional[ReferralCache] = None,
+        disk_cache: Optional[DiskCache] = None,
     ):
-        super().__init__(proxy_url, timeout, find_authoritative_server)
+        super().__init__(
+            proxy_url,
+            timeout,
+            find_authoritative_server,
+            rate_governor,
+            referral_cache,
+            disk_cache,
+        )
         self.server = server
 
     @staticmethod
@@ -240,8 +354,17 @@ class NumberQuery(Query):
         server: Optional[str] = None,
         proxy_url: Optional[str] = None,
         timeout: int = 10,
+        rate_governor: Optional[RateGovernor] = None,
+        referral_cache: Optional[ReferralCache] = None,
+        disk_cache: Optional[DiskCache] = None,
     ):
-        super().__init__(proxy_url, timeout)
+        super().__init__(
+            proxy_url,
+            timeout,
+            rate_governor=rate_governor,
+            referral_cache=referral_cache,
+            disk_cache=disk_cache,
+        )
         self.server = server
         self.whois_server_regex = r"ReferralServer: *whois://(.+)"
 
@@ -251,7 +374,12 @@ class NumberQuery(Query):
             _, server = IPv4Allocations().get_servers(ip)
             return server
         elif isinstance(ip, ipaddress.IPv6Address):
-            return None
+            try:
+                _, server = IPv6Allocations().get_servers(ip)
+            except GeneralError:
+                # not allocated to an RIR; let whois.iana.org refer the query
+                return None
+            return server
 
     def run(
         self,
@@ -0,0 +1,172 @@
+"""Per-server concurrency limits and rate limiting for WHOIS queries"""
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import AsyncGenerator, Generator, Mapping, Optional
+
+
+@dataclass(frozen=True)
+class ServerPolicy:
+    """
+    Limits applied to a single WHOIS server.
+
+    :param max_concurrency: maximum number of open connections to the server (None is unlimited)
+    :param rate: sustained number of queries per second (None is unlimited)
+    :param burst: number of queries that may be sent back-to-back before `rate` applies
+    """
+
+    max_concurrency: Optional[int] = None
+    rate: Optional[float] = None
+    burst: int = 1
+
+
+# Conservative limits for registries that are known to throttle or ban
+# clients sending bulk traffic; servers not listed use `default_policy`.
+DEFAULT_SERVER_POLICIES: dict[str, ServerPolicy] = {
+    "whois.iana.org": ServerPolicy(max_concurrency=8, rate=4.0, burst=8),
+    "whois.verisign-grs.com": ServerPolicy(max_concurrency=32, rate=50.0, burst=50),
+    "whois.denic.de": ServerPolicy(max_concurrency=2, rate=1.0, burst=2),
+    "whois.jprs.jp": ServerPolicy(max_concurrency=2, rate=1.0, burst=2),
+    "whois.nic.uk": ServerPolicy(max_concurrency=4, rate=2.0, burst=4),
+    "whois.eu": ServerPolicy(max_concurrency=2, rate=1.0, burst=2),
+    "whois.nic.it": ServerPolicy(max_concurrency=2, rate=1.0, burst=2),
+    "whois.arin.net": ServerPolicy(max_concurrency=8, rate=5.0, burst=10),
+    "whois.ripe.net": ServerPolicy(max_concurrency=8, rate=5.0, burst=10),
+    "whois.apnic.net": ServerPolicy(max_concurrency=4, rate=2.0, burst=4),
+    "whois.afrinic.net": ServerPolicy(max_concurrency=4, rate=2.0, burst=4),
+    "whois.lacnic.net": ServerPolicy(max_concurrency=2, rate=1.0, burst=2),
+}
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. Callers reserve a token and are told how long
+    to wait before using it, so the same bucket serves sync and async callers.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("`rate` must be a positive number")
+        self.rate = rate
+        self.capacity = max(burst, 1)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes one token from the bucket.
+
+        :return: number of seconds the caller must wait before proceeding
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class RateGovernor:
+    """
+    Applies a `ServerPolicy` to every query sent to a WHOIS server, keyed by the
+    server's hostname. A single governor can be shared by many clients, but its
+    async limits belong to the event loop that first used them.
+
+    :param policies: per-server policies; these override `DEFAULT_SERVER_POLICIES`
+    :param default_policy: the policy for servers without an explicit entry
+    :param use_default_policies: if False, `DEFAULT_SERVER_POLICIES` are not applied
+    """
+
+    def __init__(
+        self,
+        policies: Optional[Mapping[str, ServerPolicy]] = None,
+        default_policy: ServerPolicy = ServerPolicy(),
+        use_default_policies: bool = True,
+    ):
+        self.policies: dict[str, ServerPolicy] = {}
+        if use_default_policies:
+            self.policies.update(DEFAULT_SERVER_POLICIES)
+        for server, policy in (policies or {}).items():
+            self.policies[server.lower()] = policy
+        self.default_policy = default_policy
+        self._lock = threading.Lock()
+        self._buckets: dict[str, Optional[TokenBucket]] = {}
+        self._semaphores: dict[str, Optional[threading.Semaphore]] = {}
+        self._aio_semaphores: dict[str, Optional[asyncio.Semaphore]] = {}
+
+    def policy(self, server: str) -> ServerPolicy:
+        return self.policies.get(server.lower(), self.default_policy)
+
+    def _get_bucket(self, server: str) -> Optional[TokenBucket]:
+        try:
+            return self._buckets[server]
+        except KeyError:
+            with self._lock:
+                if server not in self._buckets:
+                    policy = self.policy(server)
+                    self._buckets[server] = (
+                        TokenBucket(policy.rate, policy.burst) if policy.rate else None
+                    )
+                return self._buckets[server]
+
+    def _get_semaphore(self, server: str) -> Optional[threading.Semaphore]:
+        try:
+            return self._semaphores[server]
+        except KeyError:
+            with self._lock:
+                if server not in self._semaphores:
+                    limit = self.policy(server).max_concurrency
+                    self._semaphores[server] = (
+                        threading.BoundedSemaphore(limit) if limit else None
+                    )
+                return self._semaphores[server]
+
+    def _get_aio_semaphore(self, server: str) -> Optional[asyncio.Semaphore]:
+        # only ever touched from the event loop thread; no lock needed
+        if server not in self._aio_semaphores:
+            limit = self.policy(server).max_concurrency
+            self._aio_semaphores[server] = asyncio.Semaphore(limit) if limit else None
+        return self._aio_semaphores[server]
+
+    @contextmanager
+    def limit(self, server: str) -> Generator[None, None, None]:
+        """
+        Blocks until a query to `server` is allowed by its policy.
+        """
+        server = server.lower()
+        semaphore = self._get_semaphore(server)
+        if semaphore:
+            semaphore.acquire()
+        try:
+            bucket = self._get_bucket(server)
+            if bucket and (delay := bucket.reserve()):
+                time.sleep(delay)
+            yield
+        finally:
+            if semaphore:
+                semaphore.release()
+
+    @asynccontextmanager
+    async def aio_limit(self, server: str) -> AsyncGenerator[None, None]:
+        """
+        Waits (without blocking the event loop) until a query to `server` is allowed by its policy.
+        """
+        server = server.lower()
+        semaphore = self._get_aio_semaphore(server)
+        if semaphore:
+            await semaphore.acquire()
+        try:
+            bucket = self._get_bucket(server)
+            if bucket and (delay := bucket.reserve()):
+                await asyncio.sleep(delay)
+            yield
+        finally:
+            if semaphore:
+                semaphore.release()
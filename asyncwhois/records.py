@@ -0,0 +1,66 @@
+"""Compact records for parsed WHOIS output"""
+
+from collections import abc
+from enum import Enum
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+from .parse import IPBaseKeys, TLDBaseKeys
+
+
+class Record(abc.Mapping):
+    """
+    Read-only mapping with one slot per key of `key_type`, equal to the dict the
+    parsers return. Keys missing from the parsed output (e.g. when only some
+    `fields` were parsed) stay unset, and keys outside `key_type` are kept in a
+    dict that is only created when there is one.
+    """
+
+    __slots__ = ("_extra",)
+    key_type: type[Enum]
+
+    def __init__(self, values: Optional[Mapping[Any, Any]] = None):
+        self._extra: Optional[Dict[Any, Any]] = None
+        for key, value in (values or {}).items():
+            try:
+                key = self.key_type(key)
+            except ValueError:
+                if self._extra is None:
+                    self._extra = {}
+                self._extra[key] = value
+            else:
+                setattr(self, key.value, value)
+
+    def __getitem__(self, key: Any) -> Any:
+        try:
+            return getattr(self, self.key_type(key).value)
+        except (AttributeError, ValueError):
+            if self._extra is None:
+                raise KeyError(key) from None
+            return self._extra[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        for key in self.key_type:
+            if hasattr(self, key.value):
+                yield key
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict[Any, Any]:
+        """Returns the parsed output as the dict the parsers return"""
+        return dict(self.items())
+
+
+class DomainRecord(Record):
+    __slots__ = tuple(key.value for key in TLDBaseKeys)
+    key_type = TLDBaseKeys
+
+
+class IPRecord(Record):
+    __slots__ = tuple(key.value for key in IPBaseKeys)
+    key_type = IPBaseKeys
@@ -1,8 +1,10 @@
+from bisect import bisect_right
 from typing import Tuple
-from ipaddress import IPv4Address
+from ipaddress import IPv4Address, IPv6Address, IPv6Network
 
 from ..errors import GeneralError
-from .ipv4 import IPV4_ALLOCATIONS, AllocationsT
+from .ipv4 import IPV4_ALLOCATION_RANGES, IPV4_SERVERS, AllocationRangesT, ServersT
+from .ipv6 import IPV6_ALLOCATION_PREFIXES, IPV6_SERVERS, AllocationPrefixesT
 from .domains import CountryCodeTLD, GenericTLD, SponsoredTLD
 
 
@@ -12,14 +14,57 @@ class IPv4Allocations:
     and https://data.iana.org/rdap/ipv4.json
     """
 
-    _allocations: AllocationsT = IPV4_ALLOCATIONS
+    _servers: ServersT = IPV4_SERVERS
+    _ranges: AllocationRangesT = IPV4_ALLOCATION_RANGES
+    # first address of every range, searched with `bisect`
+    _starts: tuple[int, ...] = tuple(first for first, _, _ in IPV4_ALLOCATION_RANGES)
 
     def get_servers(self, ipv4: IPv4Address) -> Tuple[str, str]:
         """
         Retrieves the WHOIS and RDAP servers for the given IPv4 address.
         """
-        for network, servers in self._allocations.items():
-            if ipv4 in network:
-                return servers["rdap"], servers["whois"]
+        address = int(ipv4)
+        i = bisect_right(self._starts, address) - 1
+        if i >= 0:
+            _, last, server = self._ranges[i]
+            if address <= last:
+                rdap, whois = self._servers[server]
+                return rdap, whois
         # no match
         raise GeneralError(f"No WHOIS or RDAP server for: {ipv4}")
+
+
+def _index_prefixes(prefixes: AllocationPrefixesT) -> dict[int, dict[int, int]]:
+    """
+    Groups `prefixes` by prefix length, longest first, into
+    {prefix length: {network address >> host bits: server index}}.
+    """
+    index: dict[int, dict[int, int]] = {}
+    for prefix, server in prefixes:
+        network = IPv6Network(prefix)
+        networks = index.setdefault(network.prefixlen, {})
+        networks[int(network.network_address) >> (128 - network.prefixlen)] = server
+    return dict(sorted(index.items(), reverse=True))
+
+
+class IPv6Allocations:
+    """Regional Internet Registry IPv6 Allocations:
+    https://www.iana.org/assignments/ipv6-unicast-address-assignments/ipv6-unicast-address-assignments.xhtml
+    """
+
+    _servers: ServersT = IPV6_SERVERS
+    _prefixes: dict[int, dict[int, int]] = _index_prefixes(IPV6_ALLOCATION_PREFIXES)
+
+    def get_servers(self, ipv6: IPv6Address) -> Tuple[str, str]:
+        """
+        Retrieves the WHOIS and RDAP servers for the given IPv6 address
+        using the longest matching allocated prefix.
+        """
+        address = int(ipv6)
+        for prefixlen, networks in self._prefixes.items():
+            server = networks.get(address >> (128 - prefixlen))
+            if server is not None:
+                rdap, whois = self._servers[server]
+                return rdap, whois
+        # no match
+        raise GeneralError(f"No WHOIS or RDAP server for: {ipv6}")
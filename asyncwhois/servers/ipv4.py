@@ -1,509 +1,113 @@
 """
-This file has been generated by ipv4-allocations-update.py program.
+This file has been generated by ipv4-allocations-update.py program on 2026:10:17 03:40:49 UTC
 
 If you need it updated, override this file content with ipv4-allocations-update.py output.
 """
 
-from ipaddress import IPv4Network
+ServersT = tuple[tuple[str, str], ...]
+AllocationRangesT = tuple[tuple[int, int, int], ...]
 
 
-AllocationsT = dict[IPv4Network, dict[str, str]]
+# (rdap, whois) server pairs
+IPV4_SERVERS: ServersT = (
+    ("https://rdap.apnic.net/", "whois.apnic.net"),  # 0
+    ("https://rdap.db.ripe.net/", "whois.ripe.net"),  # 1
+    ("https://rdap.arin.net/registry", "whois.arin.net"),  # 2
+    ("https://rdap.afrinic.net/rdap/", "whois.afrinic.net"),  # 3
+    ("https://rdap.lacnic.net/rdap/", "whois.lacnic.net"),  # 4
+)
 
 
-IPV4_ALLOCATIONS: AllocationsT = {
-    IPv4Network("1.0.0.0/8"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("14.0.0.0/8"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("27.0.0.0/8"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("36.0.0.0/8"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("39.0.0.0/8"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("42.0.0.0/7"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("49.0.0.0/8"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("58.0.0.0/7"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("60.0.0.0/7"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("101.0.0.0/8"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("103.0.0.0/8"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("106.0.0.0/8"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("110.0.0.0/7"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("112.0.0.0/5"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("120.0.0.0/6"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("124.0.0.0/7"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("126.0.0.0/8"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("133.0.0.0/8"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("150.0.0.0/8"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("153.0.0.0/8"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("163.0.0.0/8"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("171.0.0.0/8"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("175.0.0.0/8"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("180.0.0.0/8"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("182.0.0.0/7"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("202.0.0.0/7"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("210.0.0.0/7"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("218.0.0.0/7"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("220.0.0.0/6"): {
-        "rdap": "https://rdap.apnic.net/",
-        "whois": "whois.apnic.net",
-    },
-    IPv4Network("2.0.0.0/8"): {
-        "rdap": "https://rdap.db.ripe.net/",
-        "whois": "whois.ripe.net",
-    },
-    IPv4Network("5.0.0.0/8"): {
-        "rdap": "https://rdap.db.ripe.net/",
-        "whois": "whois.ripe.net",
-    },
-    IPv4Network("25.0.0.0/8"): {
-        "rdap": "https://rdap.db.ripe.net/",
-        "whois": "whois.ripe.net",
-    },
-    IPv4Network("31.0.0.0/8"): {
-        "rdap": "https://rdap.db.ripe.net/",
-        "whois": "whois.ripe.net",
-    },
-    IPv4Network("37.0.0.0/8"): {
-        "rdap": "https://rdap.db.ripe.net/",
-        "whois": "whois.ripe.net",
-    },
-    IPv4Network("46.0.0.0/8"): {
-        "rdap": "https://rdap.db.ripe.net/",
-        "whois": "whois.ripe.net",
-    },
-    IPv4Network("51.0.0.0/8"): {
-        "rdap": "https://rdap.db.ripe.net/",
-        "whois": "whois.ripe.net",
-    },
-    IPv4Network("53.0.0.0/8"): {
-        "rdap": "https://rdap.db.ripe.net/",
-        "whois": "whois.ripe.net",
-    },
-    IPv4Network("57.0.0.0/8"): {
-        "rdap": "https://rdap.db.ripe.net/",
-        "whois": "whois.ripe.net",
-    },
-    IPv4Network("62.0.0.0/8"): {
-        "rdap": "https://rdap.db.ripe.net/",
-        "whois": "whois.ripe.net",
-    },
-    IPv4Network("77.0.0.0/8"): {
-        "rdap": "https://rdap.db.ripe.net/",
-        "whois": "whois.ripe.net",
-    },
-    IPv4Network("78.0.0.0/7"): {
-        "rdap": "https://rdap.db.ripe.net/",
-        "whois": "whois.ripe.net",
-    },
-    IPv4Network("80.0.0.0/4"): {
-        "rdap": "https://rdap.db.ripe.net/",
-        "whois": "whois.ripe.net",
-    },
-    IPv4Network("109.0.0.0/8"): {
-        "rdap": "https://rdap.db.ripe.net/",
-        "whois": "whois.ripe.net",
-    },
-    IPv4Network("141.0.0.0/8"): {
-        "rdap": "https://rdap.db.ripe.net/",
-        "whois": "whois.ripe.net",
-    },
-    IPv4Network("145.0.0.0/8"): {
-        "rdap": "https://rdap.db.ripe.net/",
-        "whois": "whois.ripe.net",
-    },
-    IPv4Network("151.0.0.0/8"): {
-        "rdap": "https://rdap.db.ripe.net/",
-        "whois": "whois.ripe.net",
-    },
-    IPv4Network("176.0.0.0/8"): {
-        "rdap": "https://rdap.db.ripe.net/",
-        "whois": "whois.ripe.net",
-    },
-    IPv4Network("178.0.0.0/8"): {
-        "rdap": "https://rdap.db.ripe.net/",
-        "whois": "whois.ripe.net",
-    },
-    IPv4Network("185.0.0.0/8"): {
-        "rdap": "https://rdap.db.ripe.net/",
-        "whois": "whois.ripe.net",
-    },
-    IPv4Network("188.0.0.0/8"): {
-        "rdap": "https://rdap.db.ripe.net/",
-        "whois": "whois.ripe.net",
-    },
-    IPv4Network("193.0.0.0/8"): {
-        "rdap": "https://rdap.db.ripe.net/",
-        "whois": "whois.ripe.net",
-    },
-    IPv4Network("194.0.0.0/7"): {
-        "rdap": "https://rdap.db.ripe.net/",
-        "whois": "whois.ripe.net",
-    },
-    IPv4Network("212.0.0.0/7"): {
-        "rdap": "https://rdap.db.ripe.net/",
-        "whois": "whois.ripe.net",
-    },
-    IPv4Network("217.0.0.0/8"): {
-        "rdap": "https://rdap.db.ripe.net/",
-        "whois": "whois.ripe.net",
-    },
-    IPv4Network("3.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("4.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("6.0.0.0/7"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("8.0.0.0/7"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("11.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("12.0.0.0/7"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("15.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("16.0.0.0/5"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("24.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("26.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("28.0.0.0/7"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("30.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("32.0.0.0/6"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("38.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("40.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("44.0.0.0/7"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("47.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("48.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("50.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("52.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("54.0.0.0/7"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("56.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("63.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("64.0.0.0/5"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("72.0.0.0/6"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("76.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("96.0.0.0/6"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("100.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("104.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("107.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("108.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("128.0.0.0/6"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("132.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("134.0.0.0/7"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("136.0.0.0/6"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("140.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("142.0.0.0/7"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("144.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("146.0.0.0/7"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("148.0.0.0/7"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("152.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("155.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("156.0.0.0/6"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("160.0.0.0/7"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("162.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("164.0.0.0/6"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("168.0.0.0/7"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("170.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("172.0.0.0/7"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("174.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("184.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("192.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("198.0.0.0/7"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("204.0.0.0/6"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("208.0.0.0/7"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("214.0.0.0/7"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("216.0.0.0/8"): {
-        "rdap": "https://rdap.arin.net/registry",
-        "whois": "whois.arin.net",
-    },
-    IPv4Network("41.0.0.0/8"): {
-        "rdap": "https://rdap.afrinic.net/rdap/",
-        "whois": "whois.afrinic.net",
-    },
-    IPv4Network("102.0.0.0/8"): {
-        "rdap": "https://rdap.afrinic.net/rdap/",
-        "whois": "whois.afrinic.net",
-    },
-    IPv4Network("105.0.0.0/8"): {
-        "rdap": "https://rdap.afrinic.net/rdap/",
-        "whois": "whois.afrinic.net",
-    },
-    IPv4Network("154.0.0.0/8"): {
-        "rdap": "https://rdap.afrinic.net/rdap/",
-        "whois": "whois.afrinic.net",
-    },
-    IPv4Network("196.0.0.0/7"): {
-        "rdap": "https://rdap.afrinic.net/rdap/",
-        "whois": "whois.afrinic.net",
-    },
-    IPv4Network("177.0.0.0/8"): {
-        "rdap": "https://rdap.lacnic.net/rdap/",
-        "whois": "whois.lacnic.net",
-    },
-    IPv4Network("179.0.0.0/8"): {
-        "rdap": "https://rdap.lacnic.net/rdap/",
-        "whois": "whois.lacnic.net",
-    },
-    IPv4Network("181.0.0.0/8"): {
-        "rdap": "https://rdap.lacnic.net/rdap/",
-        "whois": "whois.lacnic.net",
-    },
-    IPv4Network("186.0.0.0/7"): {
-        "rdap": "https://rdap.lacnic.net/rdap/",
-        "whois": "whois.lacnic.net",
-    },
-    IPv4Network("189.0.0.0/8"): {
-        "rdap": "https://rdap.lacnic.net/rdap/",
-        "whois": "whois.lacnic.net",
-    },
-    IPv4Network("190.0.0.0/7"): {
-        "rdap": "https://rdap.lacnic.net/rdap/",
-        "whois": "whois.lacnic.net",
-    },
-    IPv4Network("200.0.0.0/7"): {
-        "rdap": "https://rdap.lacnic.net/rdap/",
-        "whois": "whois.lacnic.net",
-    },
-}
+# sorted, non-overlapping (first address, last address, index into IPV4_SERVERS)
+IPV4_ALLOCATION_RANGES: AllocationRangesT = (
+    (0x01000000, 0x01FFFFFF, 0),  # 1.0.0.0 - 1.255.255.255
+    (0x02000000, 0x02FFFFFF, 1),  # 2.0.0.0 - 2.255.255.255
+    (0x03000000, 0x04FFFFFF, 2),  # 3.0.0.0 - 4.255.255.255
+    (0x05000000, 0x05FFFFFF, 1),  # 5.0.0.0 - 5.255.255.255
+    (0x06000000, 0x09FFFFFF, 2),  # 6.0.0.0 - 9.255.255.255
+    (0x0B000000, 0x0DFFFFFF, 2),  # 11.0.0.0 - 13.255.255.255
+    (0x0E000000, 0x0EFFFFFF, 0),  # 14.0.0.0 - 14.255.255.255
+    (0x0F000000, 0x18FFFFFF, 2),  # 15.0.0.0 - 24.255.255.255
+    (0x19000000, 0x19FFFFFF, 1),  # 25.0.0.0 - 25.255.255.255
+    (0x1A000000, 0x1AFFFFFF, 2),  # 26.0.0.0 - 26.255.255.255
+    (0x1B000000, 0x1BFFFFFF, 0),  # 27.0.0.0 - 27.255.255.255
+    (0x1C000000, 0x1EFFFFFF, 2),  # 28.0.0.0 - 30.255.255.255
+    (0x1F000000, 0x1FFFFFFF, 1),  # 31.0.0.0 - 31.255.255.255
+    (0x20000000, 0x23FFFFFF, 2),  # 32.0.0.0 - 35.255.255.255
+    (0x24000000, 0x24FFFFFF, 0),  # 36.0.0.0 - 36.255.255.255
+    (0x25000000, 0x25FFFFFF, 1),  # 37.0.0.0 - 37.255.255.255
+    (0x26000000, 0x26FFFFFF, 2),  # 38.0.0.0 - 38.255.255.255
+    (0x27000000, 0x27FFFFFF, 0),  # 39.0.0.0 - 39.255.255.255
+    (0x28000000, 0x28FFFFFF, 2),  # 40.0.0.0 - 40.255.255.255
+    (0x29000000, 0x29FFFFFF, 3),  # 41.0.0.0 - 41.255.255.255
+    (0x2A000000, 0x2BFFFFFF, 0),  # 42.0.0.0 - 43.255.255.255
+    (0x2C000000, 0x2DFFFFFF, 2),  # 44.0.0.0 - 45.255.255.255
+    (0x2E000000, 0x2EFFFFFF, 1),  # 46.0.0.0 - 46.255.255.255
+    (0x2F000000, 0x30FFFFFF, 2),  # 47.0.0.0 - 48.255.255.255
+    (0x31000000, 0x31FFFFFF, 0),  # 49.0.0.0 - 49.255.255.255
+    (0x32000000, 0x32FFFFFF, 2),  # 50.0.0.0 - 50.255.255.255
+    (0x33000000, 0x33FFFFFF, 1),  # 51.0.0.0 - 51.255.255.255
+    (0x34000000, 0x34FFFFFF, 2),  # 52.0.0.0 - 52.255.255.255
+    (0x35000000, 0x35FFFFFF, 1),  # 53.0.0.0 - 53.255.255.255
+    (0x36000000, 0x38FFFFFF, 2),  # 54.0.0.0 - 56.255.255.255
+    (0x39000000, 0x39FFFFFF, 1),  # 57.0.0.0 - 57.255.255.255
+    (0x3A000000, 0x3DFFFFFF, 0),  # 58.0.0.0 - 61.255.255.255
+    (0x3E000000, 0x3EFFFFFF, 1),  # 62.0.0.0 - 62.255.255.255
+    (0x3F000000, 0x4CFFFFFF, 2),  # 63.0.0.0 - 76.255.255.255
+    (0x4D000000, 0x5FFFFFFF, 1),  # 77.0.0.0 - 95.255.255.255
+    (0x60000000, 0x64FFFFFF, 2),  # 96.0.0.0 - 100.255.255.255
+    (0x65000000, 0x65FFFFFF, 0),  # 101.0.0.0 - 101.255.255.255
+    (0x66000000, 0x66FFFFFF, 3),  # 102.0.0.0 - 102.255.255.255
+    (0x67000000, 0x67FFFFFF, 0),  # 103.0.0.0 - 103.255.255.255
+    (0x68000000, 0x68FFFFFF, 2),  # 104.0.0.0 - 104.255.255.255
+    (0x69000000, 0x69FFFFFF, 3),  # 105.0.0.0 - 105.255.255.255
+    (0x6A000000, 0x6AFFFFFF, 0),  # 106.0.0.0 - 106.255.255.255
+    (0x6B000000, 0x6CFFFFFF, 2),  # 107.0.0.0 - 108.255.255.255
+    (0x6D000000, 0x6DFFFFFF, 1),  # 109.0.0.0 - 109.255.255.255
+    (0x6E000000, 0x7EFFFFFF, 0),  # 110.0.0.0 - 126.255.255.255
+    (0x80000000, 0x84FFFFFF, 2),  # 128.0.0.0 - 132.255.255.255
+    (0x85000000, 0x85FFFFFF, 0),  # 133.0.0.0 - 133.255.255.255
+    (0x86000000, 0x8CFFFFFF, 2),  # 134.0.0.0 - 140.255.255.255
+    (0x8D000000, 0x8DFFFFFF, 1),  # 141.0.0.0 - 141.255.255.255
+    (0x8E000000, 0x90FFFFFF, 2),  # 142.0.0.0 - 144.255.255.255
+    (0x91000000, 0x91FFFFFF, 1),  # 145.0.0.0 - 145.255.255.255
+    (0x92000000, 0x95FFFFFF, 2),  # 146.0.0.0 - 149.255.255.255
+    (0x96000000, 0x96FFFFFF, 0),  # 150.0.0.0 - 150.255.255.255
+    (0x97000000, 0x97FFFFFF, 1),  # 151.0.0.0 - 151.255.255.255
+    (0x98000000, 0x98FFFFFF, 2),  # 152.0.0.0 - 152.255.255.255
+    (0x99000000, 0x99FFFFFF, 0),  # 153.0.0.0 - 153.255.255.255
+    (0x9A000000, 0x9AFFFFFF, 3),  # 154.0.0.0 - 154.255.255.255
+    (0x9B000000, 0xA2FFFFFF, 2),  # 155.0.0.0 - 162.255.255.255
+    (0xA3000000, 0xA3FFFFFF, 0),  # 163.0.0.0 - 163.255.255.255
+    (0xA4000000, 0xAAFFFFFF, 2),  # 164.0.0.0 - 170.255.255.255
+    (0xAB000000, 0xABFFFFFF, 0),  # 171.0.0.0 - 171.255.255.255
+    (0xAC000000, 0xAEFFFFFF, 2),  # 172.0.0.0 - 174.255.255.255
+    (0xAF000000, 0xAFFFFFFF, 0),  # 175.0.0.0 - 175.255.255.255
+    (0xB0000000, 0xB0FFFFFF, 1),  # 176.0.0.0 - 176.255.255.255
+    (0xB1000000, 0xB1FFFFFF, 4),  # 177.0.0.0 - 177.255.255.255
+    (0xB2000000, 0xB2FFFFFF, 1),  # 178.0.0.0 - 178.255.255.255
+    (0xB3000000, 0xB3FFFFFF, 4),  # 179.0.0.0 - 179.255.255.255
+    (0xB4000000, 0xB4FFFFFF, 0),  # 180.0.0.0 - 180.255.255.255
+    (0xB5000000, 0xB5FFFFFF, 4),  # 181.0.0.0 - 181.255.255.255
+    (0xB6000000, 0xB7FFFFFF, 0),  # 182.0.0.0 - 183.255.255.255
+    (0xB8000000, 0xB8FFFFFF, 2),  # 184.0.0.0 - 184.255.255.255
+    (0xB9000000, 0xB9FFFFFF, 1),  # 185.0.0.0 - 185.255.255.255
+    (0xBA000000, 0xBBFFFFFF, 4),  # 186.0.0.0 - 187.255.255.255
+    (0xBC000000, 0xBCFFFFFF, 1),  # 188.0.0.0 - 188.255.255.255
+    (0xBD000000, 0xBFFFFFFF, 4),  # 189.0.0.0 - 191.255.255.255
+    (0xC0000000, 0xC0FFFFFF, 2),  # 192.0.0.0 - 192.255.255.255
+    (0xC1000000, 0xC3FFFFFF, 1),  # 193.0.0.0 - 195.255.255.255
+    (0xC4000000, 0xC5FFFFFF, 3),  # 196.0.0.0 - 197.255.255.255
+    (0xC6000000, 0xC7FFFFFF, 2),  # 198.0.0.0 - 199.255.255.255
+    (0xC8000000, 0xC9FFFFFF, 4),  # 200.0.0.0 - 201.255.255.255
+    (0xCA000000, 0xCBFFFFFF, 0),  # 202.0.0.0 - 203.255.255.255
+    (0xCC000000, 0xD1FFFFFF, 2),  # 204.0.0.0 - 209.255.255.255
+    (0xD2000000, 0xD3FFFFFF, 0),  # 210.0.0.0 - 211.255.255.255
+    (0xD4000000, 0xD5FFFFFF, 1),  # 212.0.0.0 - 213.255.255.255
+    (0xD6000000, 0xD8FFFFFF, 2),  # 214.0.0.0 - 216.255.255.255
+    (0xD9000000, 0xD9FFFFFF, 1),  # 217.0.0.0 - 217.255.255.255
+    (0xDA000000, 0xDFFFFFFF, 0),  # 218.0.0.0 - 223.255.255.255
+)
 
 
-__all__ = ("IPV4_ALLOCATIONS", "AllocationsT")
+__all__ = ("IPV4_SERVERS", "IPV4_ALLOCATION_RANGES", "ServersT", "AllocationRangesT")
@@ -0,0 +1,60 @@
+"""
+This file has been generated by ipv6-allocations-update.py program on 2026:10:17 03:42:11 UTC
+
+If you need it updated, override this file content with ipv6-allocations-update.py output.
+"""
+
+ServersT = tuple[tuple[str, str], ...]
+AllocationPrefixesT = tuple[tuple[str, int], ...]
+
+
+# (rdap, whois) server pairs
+IPV6_SERVERS: ServersT = (
+    ("https://rdap.apnic.net/", "whois.apnic.net"),  # 0
+    ("https://rdap.arin.net/registry", "whois.arin.net"),  # 1
+    ("https://rdap.db.ripe.net/", "whois.ripe.net"),  # 2
+    ("https://rdap.lacnic.net/rdap/", "whois.lacnic.net"),  # 3
+    ("https://rdap.afrinic.net/rdap/", "whois.afrinic.net"),  # 4
+)
+
+
+# (prefix, index into IPV6_SERVERS), sorted by prefix
+IPV6_ALLOCATION_PREFIXES: AllocationPrefixesT = (
+    ("2001:200::/23", 0),
+    ("2001:400::/23", 1),
+    ("2001:600::/23", 2),
+    ("2001:800::/22", 2),
+    ("2001:c00::/22", 0),
+    ("2001:1200::/23", 3),
+    ("2001:1400::/22", 2),
+    ("2001:1800::/23", 1),
+    ("2001:1a00::/23", 2),
+    ("2001:1c00::/22", 2),
+    ("2001:2000::/19", 2),
+    ("2001:4000::/23", 2),
+    ("2001:4200::/23", 4),
+    ("2001:4400::/23", 0),
+    ("2001:4600::/23", 2),
+    ("2001:4800::/23", 1),
+    ("2001:4a00::/23", 2),
+    ("2001:4c00::/23", 2),
+    ("2001:5000::/20", 2),
+    ("2001:8000::/18", 0),
+    ("2003::/18", 2),
+    ("2400::/12", 0),
+    ("2600::/12", 1),
+    ("2610::/23", 1),
+    ("2620::/23", 1),
+    ("2630::/12", 1),
+    ("2800::/12", 3),
+    ("2a00::/11", 2),
+    ("2c00::/12", 4),
+)
+
+
+__all__ = (
+    "IPV6_SERVERS",
+    "IPV6_ALLOCATION_PREFIXES",
+    "ServersT",
+    "AllocationPrefixesT",
+)
@@ -0,0 +1,39 @@
+"""Coalescing of identical in-flight async calls"""
+
+import asyncio
+from functools import partial
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time. Callers that arrive with a key whose
+    call is still in flight await that call's result (or exception) instead of
+    starting their own.
+
+    The shared call runs in its own task and every caller awaits it through
+    `asyncio.shield`, so cancelling one caller never cancels the call for the rest.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            task.add_done_callback(partial(self._forget, key))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # mark the exception as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,271 @@
+"""Batched, size-rotated JSONL and CSV writers for lookup results"""
+
+import abc
+import asyncio
+import csv
+import datetime
+import io
+import json
+import os
+import sys
+from enum import Enum
+from typing import IO, Any, AsyncIterable, Iterable, List, Mapping, Optional, Union
+
+from .bulk import LookupResult
+from .columnar import _csv_value
+from .parse import Fields, TLDBaseKeys
+
+# a `LookupResult` envelope, or a bare parser output mapping
+SinkItem = Union[LookupResult, Mapping[Any, Any]]
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, Mapping):
+        # `LazyParseResult` and records
+        return dict(value)
+    return str(value)
+
+
+class Sink(abc.ABC):
+    """
+    Base class of the result sinks. Items are buffered and serialized and written
+    `batch_size` at a time with a single `write` call. When `path` is given, the
+    output moves on to `<name>.1<ext>`, `<name>.2<ext>`, ... once the current file
+    has reached `max_bytes`; without `path` the output goes to stdout.
+
+    `aio_write` and `aio_extend` run the serialization and the file writes in a
+    worker thread, so a sink can be fed from the event loop.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        batch_size: int = 1000,
+        max_bytes: Optional[int] = None,
+    ):
+        """
+        :param path: file to write to; stdout if None
+        :param batch_size: number of items serialized and written at once
+        :param max_bytes: start a new file once the current one is this large
+        """
+        if batch_size < 1:
+            raise ValueError("`batch_size` must be a positive integer")
+        self.path = path
+        self.batch_size = batch_size
+        self.max_bytes = max_bytes
+        self.paths: List[str] = []
+        self._batch: List[SinkItem] = []
+        self._file: Optional[IO] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self.closed = False
+
+    def __enter__(self) -> "Sink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "Sink":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aio_close()
+
+    def write(self, item: SinkItem) -> None:
+        """
+        Adds one item, writing the batch once it is full
+        :param item: a `LookupResult` or a parser output mapping
+        """
+        self._batch.append(item)
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def extend(self, items: Iterable[SinkItem]) -> None:
+        """
+        Adds every item of `items`, e.g. the results of `parse_many`
+        :param items: `LookupResult`s or parser output mappings
+        """
+        for item in items:
+            self.write(item)
+
+    def flush(self) -> None:
+        """Serializes and writes the buffered items"""
+        batch, self._batch = self._batch, []
+        self._flush_batch(batch)
+
+    def close(self) -> None:
+        """Writes the buffered items and closes the current file"""
+        if self.closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self.closed = True
+            if self._file is not None and self._file is not sys.stdout:
+                self._file.close()
+            self._file = None
+
+    async def aio_write(self, item: SinkItem) -> None:
+        """
+        `write` for coroutines: full batches are written in a worker thread
+        :param item: a `LookupResult` or a parser output mapping
+        """
+        self._batch.append(item)
+        if len(self._batch) >= self.batch_size:
+            await self.aio_flush()
+
+    async def aio_extend(
+        self, items: Union[Iterable[SinkItem], AsyncIterable[SinkItem]]
+    ) -> None:
+        """
+        Adds every item of `items`, e.g. the results of `aio_whois_many`
+        :param items: an iterable or async iterable of results
+        """
+        if hasattr(items, "__aiter__"):
+            async for item in items:
+                await self.aio_write(item)
+        else:
+            for item in items:
+                await self.aio_write(item)
+
+    async def aio_flush(self) -> None:
+        """`flush` in a worker thread; batches are written in the order they fill"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        batch, self._batch = self._batch, []
+        async with self._lock:
+            await asyncio.to_thread(self._flush_batch, batch)
+
+    async def aio_close(self) -> None:
+        """`close` in a worker thread"""
+        await self.aio_flush()
+        await asyncio.to_thread(self.close)
+
+    def _flush_batch(self, batch: List[SinkItem]) -> None:
+        if batch:
+            self._write_batch(batch)
+        if self._file is not None:
+            self._file.flush()
+
+    def _write_batch(self, batch: List[SinkItem]) -> None:
+        if self.closed:
+            raise ValueError("the sink is closed")
+        data = self._serialize(batch)
+        file = self._current_file()
+        file.write(data)
+        if self.max_bytes is not None and self.path is not None:
+            if file.tell() >= self.max_bytes:
+                file.close()
+                self._file = None
+
+    def _current_file(self) -> IO:
+        if self._file is not None:
+            return self._file
+        if self.path is None:
+            self._file = sys.stdout
+        else:
+            path = self.path
+            if self.paths:
+                name, ext = os.path.splitext(self.path)
+                path = f"{name}.{len(self.paths)}{ext}"
+            self.paths.append(path)
+            self._file = open(path, "w", encoding="utf-8", newline="")
+        self._file.write(self._header())
+        return self._file
+
+    def _header(self) -> str:
+        """Text written at the start of every file"""
+        return ""
+
+    @abc.abstractmethod
+    def _serialize(self, batch: List[SinkItem]) -> str:
+        """Returns the text written for `batch`"""
+
+
+class JSONLSink(Sink):
+    """
+    Writes one JSON object per line: the parser output for mappings, and
+    {"search_term", "status", "parser_output", "error"} for `LookupResult`s
+    (plus "query_output" with `include_query_output`). Keys are the plain field
+    names and dates are ISO 8601 strings.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        batch_size: int = 1000,
+        max_bytes: Optional[int] = None,
+        include_query_output: bool = False,
+    ):
+        super().__init__(path, batch_size, max_bytes)
+        self.include_query_output = include_query_output
+        # one encoder for every item; `json.dumps` builds one per call with `default`
+        self._encode = json.JSONEncoder(
+            default=_json_default, ensure_ascii=False
+        ).encode
+
+    def _to_object(self, item: SinkItem) -> Any:
+        if not isinstance(item, LookupResult):
+            return item
+        obj = {
+            "search_term": item.search_term,
+            "status": item.status,
+            "parser_output": item.parser_output,
+            "error": None if item.error is None else str(item.error),
+        }
+        if self.include_query_output:
+            obj["query_output"] = item.query_output
+        return obj
+
+    def _serialize(self, batch: List[SinkItem]) -> str:
+        encode = self._encode
+        to_object = self._to_object
+        return "".join([encode(to_object(item)) + "\n" for item in batch])
+
+
+class CSVSink(Sink):
+    """
+    Writes a header and one line per item with a `search_term` and a
+    `lookup_status` column and one column per field; dates are ISO 8601 strings
+    and lists are joined with ";". Every rotated file starts with the header.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        batch_size: int = 1000,
+        max_bytes: Optional[int] = None,
+        key_type: type[Enum] = TLDBaseKeys,
+        fields: Fields = None,
+    ):
+        """
+        :param key_type: `TLDBaseKeys` for domain output or `IPBaseKeys` for ip output
+        :param fields: only write these keys; all keys of `key_type` if None
+        """
+        super().__init__(path, batch_size, max_bytes)
+        self.keys = [k for k in key_type if fields is None or k in fields]
+        self.names = ["search_term", "lookup_status", *(k.value for k in self.keys)]
+
+    def _header(self) -> str:
+        return self._serialize_rows([self.names])
+
+    def _serialize(self, batch: List[SinkItem]) -> str:
+        rows = []
+        for item in batch:
+            if isinstance(item, LookupResult):
+                row = [item.search_term, str(item.status)]
+                parser_output = item.parser_output
+            else:
+                row = [None, None]
+                parser_output = item
+            row.extend(_csv_value(parser_output.get(key)) for key in self.keys)
+            rows.append(row)
+        return self._serialize_rows(rows)
+
+    @staticmethod
+    def _serialize_rows(rows: List[List[Any]]) -> str:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue()
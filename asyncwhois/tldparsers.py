@@ -4,7 +4,7 @@ from datetime import datetime
 import re
 from typing import Any, Union
 
-from .parse import BaseParser, TLDBaseKeys
+from .parse import BaseParser, Fields, ParseEngine, TLDBaseKeys
 
 
 ExpressionDict = dict[str, str]
@@ -73,10 +73,13 @@ class TLDParser(BaseParser):
 
     multiple_match_keys = (TLDBaseKeys.NAME_SERVERS, TLDBaseKeys.STATUS)
     date_keys = (TLDBaseKeys.CREATED, TLDBaseKeys.UPDATED, TLDBaseKeys.EXPIRES)
+    parse_engine = ParseEngine.LINES
+    # "no such domain" phrases this TLD's servers use on top of `DomainParser`'s
+    no_match_checks: tuple[str, ...] = ()
 
-    def __init__(self) -> None:
-        self.reg_expressions = self.base_expressions.copy()
-        self.update_reg_expressions(self.tld_specific_expressions)
+    @classmethod
+    def _build_reg_expressions(cls) -> ExpressionDict:
+        return {**cls.base_expressions, **cls.tld_specific_expressions}
 
 
 # ==============================
@@ -117,8 +120,10 @@ class RegexPL(TLDParser):
         TLDBaseKeys.DNSSEC: r"dnssec: *(.+)",
     }
 
-    def parse(self, blob: str) -> dict[str, Any]:
-        parsed_output = super().parse(blob)
+    def parse(self, blob: str, fields: Fields = None) -> dict[str, Any]:
+        parsed_output = super().parse(blob, fields)
+        if not self.wanted(fields, TLDBaseKeys.NAME_SERVERS):
+            return parsed_output
         nameservers_match = self.find_match(
             r"nameservers:*(.+)\ncreated:\s", blob, flags=re.DOTALL | re.IGNORECASE
         )
@@ -158,12 +163,15 @@ class RegexEE(TLDParser):
         TLDBaseKeys.CREATED: r"registered: *([^\n\r]+)",
         TLDBaseKeys.UPDATED: r"changed: *([^\n\r]+)",
         TLDBaseKeys.EXPIRES: r"expire: *([^\n\r]+)",
-        TLDBaseKeys.REGISTRAR: r"(?<=Registrar)[\s\S]*?name: *(.+)",
-        TLDBaseKeys.REGISTRAR_URL: r"(?<=Registrar)[\s\S]*?url: *(.+)",
-        TLDBaseKeys.REGISTRAR_ABUSE_PHONE: r"(?<=Registrar)[\s\S]*?phone: *(.+)",
         TLDBaseKeys.NAME_SERVERS: r"nserver: *(.*)",
         TLDBaseKeys.REGISTRANT_COUNTRY: r"country: *(.+)",
     }
+    section_headers = {"registrar": r"^Registrar:"}
+    section_expressions = {
+        TLDBaseKeys.REGISTRAR: ("registrar", r"name: *(.+)"),
+        TLDBaseKeys.REGISTRAR_URL: ("registrar", r"url: *(.+)"),
+        TLDBaseKeys.REGISTRAR_ABUSE_PHONE: ("registrar", r"phone: *(.+)"),
+    }
 
 
 class RegexFR(TLDParser):
@@ -215,12 +223,13 @@ class RegexEU(TLDParser):
         TLDBaseKeys.REGISTRAR_URL: r"Registrar:\n.*Name:.+\n.*Website: *(.+)",
     }
 
-    def parse(self, blob: str) -> dict[str, Any]:
-        parsed_output = super().parse(blob)
+    def parse(self, blob: str, fields: Fields = None) -> dict[str, Any]:
+        parsed_output = super().parse(blob, fields)
         # find name servers
-        parsed_output[TLDBaseKeys.NAME_SERVERS] = self.find_multiline_match(
-            "Name servers:", blob
-        )
+        if self.wanted(fields, TLDBaseKeys.NAME_SERVERS):
+            parsed_output[TLDBaseKeys.NAME_SERVERS] = self.find_multiline_match(
+                "Name servers:", blob
+            )
         return parsed_output
 
 
@@ -247,26 +256,33 @@ class RegexUK(TLDParser):
         TLDBaseKeys.UPDATED: r"Last updated:\s*(\d{2}-\w{3}-\d{4})",
         TLDBaseKeys.EXPIRES: r"Expiry date:\s*(\d{2}-\w{3}-\d{4})",
         TLDBaseKeys.REGISTRAR: r"Registrar:\s*(.+)",
-        TLDBaseKeys.REGISTRAR_URL: r"(?<=Registrar)[\s\S]*?URL: *(.+)",
         TLDBaseKeys.REGISTRANT_NAME: r"Registrant:\n *(.+)",
         TLDBaseKeys.STATUS: r"Registration status:\n *(.+)",
     }
+    section_headers = {"registrar": r"^[ \t]*Registrar:"}
+    section_expressions = {
+        TLDBaseKeys.REGISTRAR_URL: ("registrar", r"URL: *(.+)"),
+    }
 
-    def parse(self, blob: str) -> dict[str, Any]:
-        parsed_output = super().parse(blob)
+    def parse(self, blob: str, fields: Fields = None) -> dict[str, Any]:
+        parsed_output = super().parse(blob, fields)
         # handle registrant address
-        address_match = re.search(
-            r"Registrant's address: *(.+)Data valid", blob, re.DOTALL
-        )
-        if address_match:
-            address_pieces = [
-                m.strip() for m in address_match.group(1).split("\n") if m.strip()
-            ]
-            parsed_output[TLDBaseKeys.REGISTRANT_ADDRESS] = ", ".join(address_pieces)
+        if self.wanted(fields, TLDBaseKeys.REGISTRANT_ADDRESS):
+            address_match = re.search(
+                r"Registrant's address: *(.+)Data valid", blob, re.DOTALL
+            )
+            if address_match:
+                address_pieces = [
+                    m.strip() for m in address_match.group(1).split("\n") if m.strip()
+                ]
+                parsed_output[TLDBaseKeys.REGISTRANT_ADDRESS] = ", ".join(
+                    address_pieces
+                )
         # find name servers
-        parsed_output[TLDBaseKeys.NAME_SERVERS] = self.find_multiline_match(
-            "Name servers:", blob
-        )
+        if self.wanted(fields, TLDBaseKeys.NAME_SERVERS):
+            parsed_output[TLDBaseKeys.NAME_SERVERS] = self.find_multiline_match(
+                "Name servers:", blob
+            )
         return parsed_output
 
 
@@ -282,27 +298,34 @@ class RegexJP(TLDParser):
         TLDBaseKeys.NAME_SERVERS: r"\[Name Server\] *(.+)",
     }
 
-    def parse(self, blob: str) -> dict[str, Any]:
-        parsed_output = super().parse(blob)
+    def parse(self, blob: str, fields: Fields = None) -> dict[str, Any]:
+        parsed_output = super().parse(blob, fields)
         # check for domain in japanese
-        if not parsed_output.get(TLDBaseKeys.DOMAIN_NAME):
+        if self.wanted(fields, TLDBaseKeys.DOMAIN_NAME) and not parsed_output.get(
+            TLDBaseKeys.DOMAIN_NAME
+        ):
             parsed_output[TLDBaseKeys.DOMAIN_NAME] = self.find_match(
                 r"\[ドメイン名\] *(.+)", blob
             )
         # check for name servers in japanese
-        if not parsed_output.get(TLDBaseKeys.NAME_SERVERS):
+        if self.wanted(fields, TLDBaseKeys.NAME_SERVERS) and not parsed_output.get(
+            TLDBaseKeys.NAME_SERVERS
+        ):
             parsed_output[TLDBaseKeys.NAME_SERVERS] = self.find_match(
                 r"\[ネームサーバ\] *(.+)", blob, many=True
             )
         # check for address
-        address_match = re.search(
-            r"\[Postal Address\]([^\[|.]+)\[\w+\](.+)", blob, re.DOTALL
-        )
-        if address_match:
-            address_pieces = [
-                m.strip() for m in address_match.group(1).split("\n") if m.strip()
-            ]
-            parsed_output[TLDBaseKeys.REGISTRANT_ADDRESS] = ", ".join(address_pieces)
+        if self.wanted(fields, TLDBaseKeys.REGISTRANT_ADDRESS):
+            address_match = re.search(
+                r"\[Postal Address\]([^\[|.]+)\[\w+\](.+)", blob, re.DOTALL
+            )
+            if address_match:
+                address_pieces = [
+                    m.strip() for m in address_match.group(1).split("\n") if m.strip()
+                ]
+                parsed_output[TLDBaseKeys.REGISTRANT_ADDRESS] = ", ".join(
+                    address_pieces
+                )
         return parsed_output
 
 
@@ -335,8 +358,8 @@ class RegexAT(TLDParser):
         "fax": "fax-no: *(.+)",
     }
 
-    def parse(self, blob: str) -> dict[str, Any]:
-        parser_output = super().parse(blob)
+    def parse(self, blob: str, fields: Fields = None) -> dict[str, Any]:
+        parser_output = super().parse(blob, fields)
         contact_field_fills = [
             ["registrant", r"registrant: *(.+)"],
             ["admin", r"admin-c"],
@@ -347,6 +370,12 @@ class RegexAT(TLDParser):
             field[1] = self.find_match(field[1], blob) or ""
         # parse contact info using each "nic-hdl"
         for prefix, handle in contact_field_fills:
+            keys = [
+                getattr(TLDBaseKeys, f"{prefix}_{field}".upper())
+                for field in self._contact_fields
+            ]
+            if not self.wanted(fields, *keys):
+                continue
             pattern = re.compile(
                 r"(?:personname):.+\n(?:.+\n){{1,}}nic-hdl: *{nic_hdl}\n(?:.+\n){{1,}}".format(
                     nic_hdl=handle
@@ -355,11 +384,11 @@ class RegexAT(TLDParser):
             )
             contact_blob = pattern.search(blob)
             if contact_blob:
-                for field, field_regex in self._contact_fields.items():
-                    key = getattr(TLDBaseKeys, f"{prefix}_{field}".upper())
-                    parser_output[key] = self.find_match(
-                        field_regex, contact_blob.group()
-                    )
+                for key, field_regex in zip(keys, self._contact_fields.values()):
+                    if self.wanted(fields, key):
+                        parser_output[key] = self.find_match(
+                            field_regex, contact_blob.group()
+                        )
 
         return parser_output
 
@@ -373,11 +402,12 @@ class RegexBE(TLDParser):
         TLDBaseKeys.REGISTRANT_NAME: r"Registrant:\n *(.+)",
     }
 
-    def parse(self, blob: str) -> dict[str, Any]:
-        parsed_output = super().parse(blob)
-        parsed_output[TLDBaseKeys.NAME_SERVERS] = self.find_multiline_match(
-            "Name servers:", blob
-        )
+    def parse(self, blob: str, fields: Fields = None) -> dict[str, Any]:
+        parsed_output = super().parse(blob, fields)
+        if self.wanted(fields, TLDBaseKeys.NAME_SERVERS):
+            parsed_output[TLDBaseKeys.NAME_SERVERS] = self.find_multiline_match(
+                "Name servers:", blob
+            )
         return parsed_output
 
 
@@ -400,11 +430,12 @@ class RegexKG(TLDParser):
         TLDBaseKeys.UPDATED: r"Record last updated on: *(.+)",
     }
 
-    def parse(self, blob: str) -> dict[str, Any]:
-        parsed_output = super().parse(blob)
-        parsed_output[TLDBaseKeys.NAME_SERVERS] = self.find_multiline_match(
-            "Name servers in the listed order:", blob
-        )
+    def parse(self, blob: str, fields: Fields = None) -> dict[str, Any]:
+        parsed_output = super().parse(blob, fields)
+        if self.wanted(fields, TLDBaseKeys.NAME_SERVERS):
+            parsed_output[TLDBaseKeys.NAME_SERVERS] = self.find_multiline_match(
+                "Name servers in the listed order:", blob
+            )
         return parsed_output
 
 
@@ -459,10 +490,16 @@ class RegexIT(TLDParser):
         TLDBaseKeys.UPDATED: r"(?<! )Last Update: *(.+)",
         TLDBaseKeys.EXPIRES: r"(?<! )Expire Date: *(.+)",
         TLDBaseKeys.STATUS: r"Status: *(.+)",
-        TLDBaseKeys.REGISTRANT_NAME: r"(?<=Registrant)[\s\S]*?Organization:(.*)",
-        TLDBaseKeys.REGISTRANT_ADDRESS: r"(?<=Registrant)[\s\S]*?Address:(.*)",
-        TLDBaseKeys.REGISTRAR: r"(?<=Registrar)[\s\S]*?Name: *(.*)",
-        TLDBaseKeys.REGISTRAR_URL: r"(?<=Registrar)[\s\S]*?Web: *(.*)",
+    }
+    section_headers = {
+        "registrant": r"^Registrant[ \t\r]*$",
+        "registrar": r"^Registrar[ \t\r]*$",
+    }
+    section_expressions = {
+        TLDBaseKeys.REGISTRANT_NAME: ("registrant", r"Organization:(.*)"),
+        TLDBaseKeys.REGISTRANT_ADDRESS: ("registrant", r"Address:(.*)"),
+        TLDBaseKeys.REGISTRAR: ("registrar", r"Name: *(.*)"),
+        TLDBaseKeys.REGISTRAR_URL: ("registrar", r"Web: *(.*)"),
     }
 
 
@@ -471,24 +508,35 @@ class RegexSA(TLDParser):
         TLDBaseKeys.CREATED: r"Created on: *(.+)",
         TLDBaseKeys.UPDATED: r"Last Updated on: *(.+)",
         TLDBaseKeys.REGISTRANT_NAME: r"Registrant:\s*(.+)",
-        TLDBaseKeys.REGISTRANT_ADDRESS: r"(?<=Registrant)[\s\S]*?Address:((?:.+\n)*)",
+    }
+    section_headers = {"registrant": r"^[ \t]*Registrant:"}
+    section_expressions = {
+        TLDBaseKeys.REGISTRANT_ADDRESS: ("registrant", r"Address:(.*(?:\n.+)*)"),
     }
 
 
 class RegexSK(TLDParser):
     tld_specific_expressions: ExpressionDict = {
         TLDBaseKeys.DOMAIN_NAME: r"Domain: *(.+)",
-        TLDBaseKeys.CREATED: r"(?<=Domain:)[\s\w\W]*?Created: *(.+)",
-        TLDBaseKeys.UPDATED: r"(?<=Domain:)[\s\w\W]*?Updated: *(.+)",
         TLDBaseKeys.EXPIRES: r"Valid Until: *(.+)",
         TLDBaseKeys.REGISTRANT_NAME: r"Name:\s*(.+)",
         TLDBaseKeys.REGISTRANT_ADDRESS: r"Street:\s*(.+)",
-        TLDBaseKeys.REGISTRAR: r"(?<=Registrar)[\s\S]*?Organization:(.*)",
-        TLDBaseKeys.REGISTRAR_ABUSE_EMAIL: r"(?<=Registrar)[\s\S]*?Email: *(.*)",
-        TLDBaseKeys.REGISTRAR_ABUSE_PHONE: r"(?<=Registrar)[\s\S]*?Phone: *(.*)",
-        TLDBaseKeys.REGISTRANT_CITY: r"(?<=^Contact)[\s\S]*?City:(.*)",
-        TLDBaseKeys.REGISTRANT_ZIPCODE: r"(?<=^Contact)[\s\S]*?Postal Code:(.*)",
-        TLDBaseKeys.REGISTRANT_COUNTRY: r"(?<=^Contact)[\s\S]*?Country Code:(.*)",
+    }
+    section_headers = {
+        "domain": r"^Domain:",
+        # the registrar block, not the "Registrar:" line of the domain block
+        "registrar": r"\n[ \t\r]*\nRegistrar:",
+        "contact": r"^Contact:",
+    }
+    section_expressions = {
+        TLDBaseKeys.CREATED: ("domain", r"Created: *(.+)"),
+        TLDBaseKeys.UPDATED: ("domain", r"Updated: *(.+)"),
+        TLDBaseKeys.REGISTRAR: ("registrar", r"Organization:(.*)"),
+        TLDBaseKeys.REGISTRAR_ABUSE_EMAIL: ("registrar", r"Email: *(.*)"),
+        TLDBaseKeys.REGISTRAR_ABUSE_PHONE: ("registrar", r"Phone: *(.*)"),
+        TLDBaseKeys.REGISTRANT_CITY: ("contact", r"City:(.*)"),
+        TLDBaseKeys.REGISTRANT_ZIPCODE: ("contact", r"Postal Code:(.*)"),
+        TLDBaseKeys.REGISTRANT_COUNTRY: ("contact", r"Country Code:(.*)"),
     }
 
 
@@ -499,10 +547,13 @@ class RegexMX(TLDParser):
         TLDBaseKeys.EXPIRES: r"Expiration Date: *(.+)",
         TLDBaseKeys.REGISTRAR: r"Registrar:\s*(.+)",
         TLDBaseKeys.REGISTRAR_URL: r"URL: *(.+)",
-        TLDBaseKeys.REGISTRANT_NAME: r"(?<=Registrant)[\s\S]*?Name:(.*)",
-        TLDBaseKeys.REGISTRANT_CITY: r"(?<=Registrant)[\s\S]*?City:(.*)",
-        TLDBaseKeys.REGISTRANT_STATE: r"(?<=Registrant)[\s\S]*?State:(.*)",
-        TLDBaseKeys.REGISTRANT_COUNTRY: r"(?<=Registrant)[\s\S]*?Country:(.*)",
+    }
+    section_headers = {"registrant": r"^[ \t]*Registrant:"}
+    section_expressions = {
+        TLDBaseKeys.REGISTRANT_NAME: ("registrant", r"Name:(.*)"),
+        TLDBaseKeys.REGISTRANT_CITY: ("registrant", r"City:(.*)"),
+        TLDBaseKeys.REGISTRANT_STATE: ("registrant", r"State:(.*)"),
+        TLDBaseKeys.REGISTRANT_COUNTRY: ("registrant", r"Country:(.*)"),
     }
 
 
@@ -512,11 +563,15 @@ class RegexTW(TLDParser):
         TLDBaseKeys.EXPIRES: r"Record expires on (.+) ",
         TLDBaseKeys.REGISTRAR: r"Registration Service Provider: *(.+)",
         TLDBaseKeys.REGISTRAR_URL: r"Registration Service URL: *(.+)",
-        TLDBaseKeys.REGISTRANT_NAME: r"(?<=Registrant:)\s+(.*)",
-        TLDBaseKeys.REGISTRANT_CITY: r"(?<=Registrant:)\s*(?:.*\n){5}\s+(.*),",
-        TLDBaseKeys.REGISTRANT_ADDRESS: r"(?<=Registrant:)\s*(?:.*\n){4}\s+(.*)",
-        TLDBaseKeys.REGISTRANT_STATE: r"(?<=Registrant:)\s*(?:.*\n){5}.*, (.*)",
-        TLDBaseKeys.REGISTRANT_COUNTRY: r"(?<=Registrant:)\s*(?:.*\n){6}\s+(.*)",
+    }
+    section_headers = {"registrant": r"^[ \t]*Registrant:"}
+    # the registrant block has no labels, so its values are read by line position
+    section_expressions = {
+        TLDBaseKeys.REGISTRANT_NAME: ("registrant", r"\A\s+(.*)"),
+        TLDBaseKeys.REGISTRANT_CITY: ("registrant", r"\A\s*(?:.*\n){5}\s+(.*),"),
+        TLDBaseKeys.REGISTRANT_ADDRESS: ("registrant", r"\A\s*(?:.*\n){4}\s+(.*)"),
+        TLDBaseKeys.REGISTRANT_STATE: ("registrant", r"\A\s*(?:.*\n){5}.*, (.*)"),
+        TLDBaseKeys.REGISTRANT_COUNTRY: ("registrant", r"\A\s*(?:.*\n){6}\s+(.*)"),
     }
 
 
@@ -524,8 +579,14 @@ class RegexTR(TLDParser):
     tld_specific_expressions: ExpressionDict = {
         TLDBaseKeys.CREATED: r"Created on.*: *(.+)",
         TLDBaseKeys.EXPIRES: r"Expires on.*: *(.+)",
-        TLDBaseKeys.REGISTRANT_NAME: r"(?<=[**] Registrant:)[\s\S]((?:\s.+)*)",
-        TLDBaseKeys.REGISTRANT_ADDRESS: r"(?<=[**] Administrative Contact)[\s\S]*?Address\s+: (.*)",
+    }
+    section_headers = {
+        "registrant": r"^\*\* Registrant:",
+        "admin": r"^\*\* Administrative Contact",
+    }
+    section_expressions = {
+        TLDBaseKeys.REGISTRANT_NAME: ("registrant", r"\A[\s\S]((?:\s.+)*)"),
+        TLDBaseKeys.REGISTRANT_ADDRESS: ("admin", r"Address\s+: (.*)"),
     }
 
 
@@ -538,8 +599,11 @@ class RegexIS(TLDParser):
         TLDBaseKeys.NAME_SERVERS: r"nserver\.*: *(.+)",
     }
 
-    def parse(self, blob: str) -> dict[str, Any]:
-        parsed_output = super().parse(blob)
+    def parse(self, blob: str, fields: Fields = None) -> dict[str, Any]:
+        parsed_output = super().parse(blob, fields)
+        registrant_keys = (TLDBaseKeys.REGISTRANT_NAME, TLDBaseKeys.REGISTRANT_ADDRESS)
+        if not self.wanted(fields, *registrant_keys):
+            return parsed_output
         # find first instance of person/role (registrant)
         registrant_block = False
         registrant_name = None
@@ -558,7 +622,7 @@ class RegexIS(TLDParser):
         parsed_output[TLDBaseKeys.REGISTRANT_NAME] = registrant_name
         # join the address lines together and save
         parsed_output[TLDBaseKeys.REGISTRANT_ADDRESS] = ", ".join(addresses)
-        return parsed_output
+        return self.project(parsed_output, fields)
 
 
 class RegexDK(TLDParser):
@@ -694,8 +758,10 @@ class RegexCZ(TLDParser):
     }
     known_date_formats = ["%d.%m.%Y %H:%M:%S", "%d.%m.%Y"]
 
-    def parse(self, blob: str) -> dict[str, Any]:
-        parsed_output = super().parse(blob)
+    def parse(self, blob: str, fields: Fields = None) -> dict[str, Any]:
+        parsed_output = super().parse(blob, fields)
+        if not self.wanted(fields, TLDBaseKeys.REGISTRANT_ADDRESS):
+            return parsed_output
         addresses = []
         seen_contact = False
         # extract address from registrant info block
@@ -737,35 +803,47 @@ class RegexHK(TLDParser):
         TLDBaseKeys.REGISTRAR_ABUSE_EMAIL: r"Registrar Contact Information: *(.+)",
         TLDBaseKeys.REGISTRAR_ABUSE_PHONE: r"Registrar Contact Information: *(.+)",
         TLDBaseKeys.REGISTRANT_NAME: r"Registrant Contact Information:\s*Company English Name.*:(.+)",
-        TLDBaseKeys.REGISTRANT_ADDRESS: r"(?<=Registrant Contact Information:)[\s\S]*?Address: (.*)",
-        TLDBaseKeys.REGISTRANT_COUNTRY: r"[Registrant Contact Information\w\W]+Country: ([\S\ ]+)",
         # 'registrant_email': r'[Registrant Contact Information\w\W]+Email: ([\S\ ]+)',
         TLDBaseKeys.UPDATED: r"Updated Date: *(.+)",
         TLDBaseKeys.CREATED: r"[Registrant Contact Information\w\W]+Domain Name Commencement Date: (.+)",
         TLDBaseKeys.EXPIRES: r"[Registrant Contact Information\w\W]+Expiry Date: (.+)",
         TLDBaseKeys.NAME_SERVERS: r"Name Servers Information:\s+((?:.+\n)*)",
     }
+    # the header is followed by a blank line, which is part of the header here
+    section_headers = {"registrant": r"^Registrant Contact Information:\s*"}
+    section_expressions = {
+        TLDBaseKeys.REGISTRANT_ADDRESS: ("registrant", r"Address: (.*)"),
+        TLDBaseKeys.REGISTRANT_COUNTRY: ("registrant", r"Country: ([\S\ ]+)"),
+    }
 
 
 class RegexUA(TLDParser):
     tld_specific_expressions: ExpressionDict = {
         TLDBaseKeys.DOMAIN_NAME: r"domain: *(.+)",
         TLDBaseKeys.STATUS: r"status: *(.+)",
-        TLDBaseKeys.REGISTRAR: r"(?:Registrar: |(?<=Registrar:)[\s\W\w]*?organization-loc: )(.*)",
-        TLDBaseKeys.REGISTRAR_URL: r"(?<=Registrar)[\s\S]*?url: *(.+)",
-        TLDBaseKeys.REGISTRAR_ABUSE_PHONE: r"(?<=Registrar)[\s\S]*?abuse-phone: *(.+)",
-        TLDBaseKeys.REGISTRAR_ABUSE_EMAIL: r"(?<=Registrar)[\s\S]*?abuse-email: *(.+)",
-        TLDBaseKeys.REGISTRANT_NAME: r"(?<=Registrant:)[\s\W\w]*?organization-loc:(.*)",
-        TLDBaseKeys.REGISTRANT_COUNTRY: r"(?<=Registrant:)[\s\W\w]*?country-loc:(.*)",
-        TLDBaseKeys.REGISTRANT_CITY: r"(?<=Registrant:)[\s\W\w]*?(?:address\-loc:\s+.*\n){2}address-loc:\s+(.*)\n",
-        TLDBaseKeys.REGISTRANT_STATE: r"(?<=Registrant:)[\s\W\w]*?(?:address\-loc:\s+.*\n){1}address-loc:\s+(.*)\n",
-        TLDBaseKeys.REGISTRANT_ADDRESS: r"(?<=Registrant:)[\s\W\w]*?address-loc:\s+(.*)\n",
-        TLDBaseKeys.REGISTRANT_ZIPCODE: r"(?<=Registrant:)[\s\W\w]*?postal-code-loc:(.*)",
         TLDBaseKeys.UPDATED: "(?:Updated Date: |modified: )(.+)",
         TLDBaseKeys.CREATED: "(?:Creation Date: |created: )(.+)",
         TLDBaseKeys.EXPIRES: "(?:Registry Expiry Date: |expires: )(.+)",
         TLDBaseKeys.NAME_SERVERS: "nserver: *(.+)",
     }
+    section_headers = {
+        # "% Registrar:" blocks, or the "Registrar:" line of redirected
+        # ICANN-style output (the keys inside the blocks are lower case)
+        "registrar": r"^% Registrar:|^(?-i:Registrar):",
+        "registrant": r"^% Registrant:",
+    }
+    section_expressions = {
+        TLDBaseKeys.REGISTRAR: ("registrar", r"(?:\A|organization-loc:)[ \t]*(\S.*)"),
+        TLDBaseKeys.REGISTRAR_URL: ("registrar", r"url: *(.+)"),
+        TLDBaseKeys.REGISTRAR_ABUSE_PHONE: ("registrar", r"abuse-phone: *(.+)"),
+        TLDBaseKeys.REGISTRAR_ABUSE_EMAIL: ("registrar", r"abuse-email: *(.+)"),
+        TLDBaseKeys.REGISTRANT_NAME: ("registrant", r"organization-loc:(.*)"),
+        TLDBaseKeys.REGISTRANT_COUNTRY: ("registrant", r"country-loc:(.*)"),
+        TLDBaseKeys.REGISTRANT_CITY: ("registrant", r"(?:address\-loc:\s+.*\n){2}address-loc:\s+(.*)"),
+        TLDBaseKeys.REGISTRANT_STATE: ("registrant", r"(?:address\-loc:\s+.*\n){1}address-loc:\s+(.*)"),
+        TLDBaseKeys.REGISTRANT_ADDRESS: ("registrant", r"address-loc:\s+(.*)"),
+        TLDBaseKeys.REGISTRANT_ZIPCODE: ("registrant", r"postal-code-loc:(.*)"),
+    }
 
 
 class RegexCN(TLDParser):
@@ -913,71 +991,83 @@ class RegexTK(TLDParser):
     tld_specific_expressions: ExpressionDict = {
         TLDBaseKeys.CREATED: r"Domain registered: *(.+)",
         TLDBaseKeys.EXPIRES: r"Record will expire on: *(.+)",
-        TLDBaseKeys.REGISTRANT_ORGANIZATION: r"(?<=Owner contact)[\s\S]*?Organization:(.*)",
-        TLDBaseKeys.REGISTRANT_NAME: r"(?<=Owner contact)[\s\S]*?Name:(.*)",
-        TLDBaseKeys.REGISTRANT_ADDRESS: r"(?<=Owner contact)[\s\S]*?Address:(.*)",
-        TLDBaseKeys.REGISTRANT_STATE: r"(?<=Owner contact)[\s\S]*?State:(.*)",
-        TLDBaseKeys.REGISTRANT_CITY: r"(?<=Owner contact)[\s\S]*?City:(.*)",
-        TLDBaseKeys.REGISTRANT_COUNTRY: r"(?<=Owner contact)[\s\S]*?Country:(.*)",
-        TLDBaseKeys.REGISTRANT_EMAIL: r"(?<=Owner contact)[\s\S]*?E-mail:(.*)",
-        TLDBaseKeys.REGISTRANT_FAX: r"(?<=Owner contact)[\s\S]*?Fax:(.*)",
-        TLDBaseKeys.REGISTRANT_PHONE: r"(?<=Owner contact)[\s\S]*?Phone:(.*)",
-        TLDBaseKeys.ADMIN_ORGANIZATION: r"(?<=Admin contact)[\s\S]*?Organization:(.*)",
-        TLDBaseKeys.ADMIN_NAME: r"(?<=Admin contact)[\s\S]*?Name:(.*)",
-        TLDBaseKeys.ADMIN_ADDRESS: r"(?<=Admin contact)[\s\S]*?Address:(.*)",
-        TLDBaseKeys.ADMIN_STATE: r"(?<=Admin contact)[\s\S]*?State:(.*)",
-        TLDBaseKeys.ADMIN_CITY: r"(?<=Admin contact)[\s\S]*?City:(.*)",
-        TLDBaseKeys.ADMIN_COUNTRY: r"(?<=Admin contact)[\s\S]*?Country:(.*)",
-        TLDBaseKeys.ADMIN_EMAIL: r"(?<=Admin contact)[\s\S]*?E-mail:(.*)",
-        TLDBaseKeys.ADMIN_FAX: r"(?<=Admin contact)[\s\S]*?Fax:(.*)",
-        TLDBaseKeys.ADMIN_PHONE: r"(?<=Admin contact)[\s\S]*?Phone:(.*)",
-        TLDBaseKeys.BILLING_ORGANIZATION: r"(?<=Billing contact)[\s\S]*?Organization:(.*)",
-        TLDBaseKeys.BILLING_NAME: r"(?<=Billing contact)[\s\S]*?Name:(.*)",
-        TLDBaseKeys.BILLING_ADDRESS: r"(?<=Billing contact)[\s\S]*?Address:(.*)",
-        TLDBaseKeys.BILLING_STATE: r"(?<=Billing contact)[\s\S]*?State:(.*)",
-        TLDBaseKeys.BILLING_CITY: r"(?<=Billing contact)[\s\S]*?City:(.*)",
-        TLDBaseKeys.BILLING_COUNTRY: r"(?<=Billing contact)[\s\S]*?Country:(.*)",
-        TLDBaseKeys.BILLING_EMAIL: r"(?<=Billing contact)[\s\S]*?E-mail:(.*)",
-        TLDBaseKeys.BILLING_FAX: r"(?<=Billing contact)[\s\S]*?Fax:(.*)",
-        TLDBaseKeys.BILLING_PHONE: r"(?<=Billing contact)[\s\S]*?Phone:(.*)",
-        TLDBaseKeys.TECH_ORGANIZATION: r"(?<=Tech contact)[\s\S]*?Organization:(.*)",
-        TLDBaseKeys.TECH_NAME: r"(?<=Tech contact)[\s\S]*?Name:(.*)",
-        TLDBaseKeys.TECH_ADDRESS: r"(?<=Tech contact)[\s\S]*?Address:(.*)",
-        TLDBaseKeys.TECH_STATE: r"(?<=Tech contact)[\s\S]*?State:(.*)",
-        TLDBaseKeys.TECH_CITY: r"(?<=Tech contact)[\s\S]*?City:(.*)",
-        TLDBaseKeys.TECH_COUNTRY: r"(?<=Tech contact)[\s\S]*?Country:(.*)",
-        TLDBaseKeys.TECH_EMAIL: r"(?<=Tech contact)[\s\S]*?E-mail:(.*)",
-        TLDBaseKeys.TECH_FAX: r"(?<=Tech contact)[\s\S]*?Fax:(.*)",
-        TLDBaseKeys.TECH_PHONE: r"(?<=Tech contact)[\s\S]*?Phone:(.*)",
+    }
+    section_headers = {
+        "registrant": r"^[ \t]*Owner contact:",
+        "admin": r"^[ \t]*Admin contact:",
+        "billing": r"^[ \t]*Billing contact:",
+        "tech": r"^[ \t]*Tech contact:",
+    }
+    section_expressions = {
+        TLDBaseKeys.REGISTRANT_ORGANIZATION: ("registrant", r"Organization:(.*)"),
+        TLDBaseKeys.REGISTRANT_NAME: ("registrant", r"Name:(.*)"),
+        TLDBaseKeys.REGISTRANT_ADDRESS: ("registrant", r"Address:(.*)"),
+        TLDBaseKeys.REGISTRANT_STATE: ("registrant", r"State:(.*)"),
+        TLDBaseKeys.REGISTRANT_CITY: ("registrant", r"City:(.*)"),
+        TLDBaseKeys.REGISTRANT_COUNTRY: ("registrant", r"Country:(.*)"),
+        TLDBaseKeys.REGISTRANT_EMAIL: ("registrant", r"E-mail:(.*)"),
+        TLDBaseKeys.REGISTRANT_FAX: ("registrant", r"Fax:(.*)"),
+        TLDBaseKeys.REGISTRANT_PHONE: ("registrant", r"Phone:(.*)"),
+        TLDBaseKeys.ADMIN_ORGANIZATION: ("admin", r"Organization:(.*)"),
+        TLDBaseKeys.ADMIN_NAME: ("admin", r"Name:(.*)"),
+        TLDBaseKeys.ADMIN_ADDRESS: ("admin", r"Address:(.*)"),
+        TLDBaseKeys.ADMIN_STATE: ("admin", r"State:(.*)"),
+        TLDBaseKeys.ADMIN_CITY: ("admin", r"City:(.*)"),
+        TLDBaseKeys.ADMIN_COUNTRY: ("admin", r"Country:(.*)"),
+        TLDBaseKeys.ADMIN_EMAIL: ("admin", r"E-mail:(.*)"),
+        TLDBaseKeys.ADMIN_FAX: ("admin", r"Fax:(.*)"),
+        TLDBaseKeys.ADMIN_PHONE: ("admin", r"Phone:(.*)"),
+        TLDBaseKeys.BILLING_ORGANIZATION: ("billing", r"Organization:(.*)"),
+        TLDBaseKeys.BILLING_NAME: ("billing", r"Name:(.*)"),
+        TLDBaseKeys.BILLING_ADDRESS: ("billing", r"Address:(.*)"),
+        TLDBaseKeys.BILLING_STATE: ("billing", r"State:(.*)"),
+        TLDBaseKeys.BILLING_CITY: ("billing", r"City:(.*)"),
+        TLDBaseKeys.BILLING_COUNTRY: ("billing", r"Country:(.*)"),
+        TLDBaseKeys.BILLING_EMAIL: ("billing", r"E-mail:(.*)"),
+        TLDBaseKeys.BILLING_FAX: ("billing", r"Fax:(.*)"),
+        TLDBaseKeys.BILLING_PHONE: ("billing", r"Phone:(.*)"),
+        TLDBaseKeys.TECH_ORGANIZATION: ("tech", r"Organization:(.*)"),
+        TLDBaseKeys.TECH_NAME: ("tech", r"Name:(.*)"),
+        TLDBaseKeys.TECH_ADDRESS: ("tech", r"Address:(.*)"),
+        TLDBaseKeys.TECH_STATE: ("tech", r"State:(.*)"),
+        TLDBaseKeys.TECH_CITY: ("tech", r"City:(.*)"),
+        TLDBaseKeys.TECH_COUNTRY: ("tech", r"Country:(.*)"),
+        TLDBaseKeys.TECH_EMAIL: ("tech", r"E-mail:(.*)"),
+        TLDBaseKeys.TECH_FAX: ("tech", r"Fax:(.*)"),
+        TLDBaseKeys.TECH_PHONE: ("tech", r"Phone:(.*)"),
     }
     known_date_formats = ["%m/%d/%Y"]
 
-    def parse(self, blob: str) -> dict[str, Any]:
-        parsed_output = super().parse(blob)
+    def parse(self, blob: str, fields: Fields = None) -> dict[str, Any]:
+        parsed_output = super().parse(blob, fields)
         # handle multiline nameservers
-        parsed_output[TLDBaseKeys.NAME_SERVERS] = self.find_multiline_match(
-            "Domain nameservers:", blob
-        )
+        if self.wanted(fields, TLDBaseKeys.NAME_SERVERS):
+            parsed_output[TLDBaseKeys.NAME_SERVERS] = self.find_multiline_match(
+                "Domain nameservers:", blob
+            )
         # Check if "Status" is inline with Domain Name. For example:
         # Domain Name:
         #   GOOGLE.TK is Active
         #   -- OR --
         #   GOOGLE.TK
-        domain_name_match = re.search(r"Domain name:\n*(.+)\n\n", blob, re.IGNORECASE)
-        if domain_name_match:
-            if " is " in domain_name_match.group(1):
-                domain_name, status = domain_name_match.group(1).split(" is ")
-                parsed_output[TLDBaseKeys.DOMAIN_NAME] = self._process(
-                    domain_name.replace("\n", "")
-                )
-                parsed_output[TLDBaseKeys.STATUS] = [
-                    self._process(status.replace("\n", ""))
-                ]
-            else:
-                parsed_output[TLDBaseKeys.DOMAIN_NAME] = self._process(
-                    domain_name_match.group(1).replace("\n", "")
-                )
-        return parsed_output
+        if self.wanted(fields, TLDBaseKeys.DOMAIN_NAME, TLDBaseKeys.STATUS):
+            domain_name_match = re.search(
+                r"Domain name:\n*(.+)\n\n", blob, re.IGNORECASE
+            )
+            if domain_name_match:
+                if " is " in domain_name_match.group(1):
+                    domain_name, status = domain_name_match.group(1).split(" is ")
+                    parsed_output[TLDBaseKeys.DOMAIN_NAME] = self._process(
+                        domain_name.replace("\n", "")
+                    )
+                    parsed_output[TLDBaseKeys.STATUS] = [
+                        self._process(status.replace("\n", ""))
+                    ]
+                else:
+                    parsed_output[TLDBaseKeys.DOMAIN_NAME] = self._process(
+                        domain_name_match.group(1).replace("\n", "")
+                    )
+        return self.project(parsed_output, fields)
 
 
 class RegexCC(TLDParser):
@@ -993,40 +1083,50 @@ class RegexEDU(TLDParser):
         TLDBaseKeys.EXPIRES: "Domain expires: *(.+)",
     }
 
-    def parse(self, blob: str) -> dict[str, Any]:
-        parsed_output = super().parse(blob)
-        registrant_match = re.search(
-            r"Registrant:*(.+)Administrative Contact", blob, re.DOTALL | re.IGNORECASE
+    def parse(self, blob: str, fields: Fields = None) -> dict[str, Any]:
+        parsed_output = super().parse(blob, fields)
+        registrant_keys = (
+            TLDBaseKeys.REGISTRANT_NAME,
+            TLDBaseKeys.REGISTRANT_ORGANIZATION,
+            TLDBaseKeys.REGISTRANT_COUNTRY,
+            TLDBaseKeys.REGISTRANT_ADDRESS,
         )
-        if registrant_match:
-            reg_info_raw = registrant_match.group(1).split("\n")
-            # remove duplicates and empty strings
-            reg_info_clean = []
-            for value in reg_info_raw:
-                value = value.strip()
-                if value and value not in reg_info_clean:
-                    reg_info_clean.append(value)
-            # country is usually either last or third to last
-            country_index = -3
-            for i, value in enumerate(reg_info_clean):
-                if len(value) == 2:
-                    country_index = i
-                    break
-
-            org = reg_info_clean[0]
-            address = ", ".join(reg_info_clean[1:country_index])
-            country = reg_info_clean[country_index]
-
-            parsed_output[TLDBaseKeys.REGISTRANT_NAME] = org
-            parsed_output[TLDBaseKeys.REGISTRANT_ORGANIZATION] = org
-            parsed_output[TLDBaseKeys.REGISTRANT_COUNTRY] = country
-            parsed_output[TLDBaseKeys.REGISTRANT_ADDRESS] = address
+        if self.wanted(fields, *registrant_keys):
+            registrant_match = re.search(
+                r"Registrant:*(.+)Administrative Contact",
+                blob,
+                re.DOTALL | re.IGNORECASE,
+            )
+            if registrant_match:
+                reg_info_raw = registrant_match.group(1).split("\n")
+                # remove duplicates and empty strings
+                reg_info_clean = []
+                for value in reg_info_raw:
+                    value = value.strip()
+                    if value and value not in reg_info_clean:
+                        reg_info_clean.append(value)
+                # country is usually either last or third to last
+                country_index = -3
+                for i, value in enumerate(reg_info_clean):
+                    if len(value) == 2:
+                        country_index = i
+                        break
+
+                org = reg_info_clean[0]
+                address = ", ".join(reg_info_clean[1:country_index])
+                country = reg_info_clean[country_index]
+
+                parsed_output[TLDBaseKeys.REGISTRANT_NAME] = org
+                parsed_output[TLDBaseKeys.REGISTRANT_ORGANIZATION] = org
+                parsed_output[TLDBaseKeys.REGISTRANT_COUNTRY] = country
+                parsed_output[TLDBaseKeys.REGISTRANT_ADDRESS] = address
 
         # handle multiline nameservers
-        parsed_output[TLDBaseKeys.NAME_SERVERS] = self.find_multiline_match(
-            "Name Servers:", blob
-        )
-        return parsed_output
+        if self.wanted(fields, TLDBaseKeys.NAME_SERVERS):
+            parsed_output[TLDBaseKeys.NAME_SERVERS] = self.find_multiline_match(
+                "Name Servers:", blob
+            )
+        return self.project(parsed_output, fields)
 
 
 class RegexLV(TLDParser):
@@ -1048,12 +1148,13 @@ class RegexNL(TLDParser):
         TLDBaseKeys.REGISTRAR_ABUSE_EMAIL: r"Abuse Contact:\n(.+)",
     }
 
-    def parse(self, blob: str) -> dict[str, Any]:
-        parsed_output = super().parse(blob)
+    def parse(self, blob: str, fields: Fields = None) -> dict[str, Any]:
+        parsed_output = super().parse(blob, fields)
         # handle multiline nameservers
-        parsed_output[TLDBaseKeys.NAME_SERVERS] = self.find_multiline_match(
-            "Domain nameservers:", blob
-        )
+        if self.wanted(fields, TLDBaseKeys.NAME_SERVERS):
+            parsed_output[TLDBaseKeys.NAME_SERVERS] = self.find_multiline_match(
+                "Domain nameservers:", blob
+            )
         return parsed_output
 
 
@@ -1077,8 +1178,8 @@ class RegexGG(TLDParser):
         TLDBaseKeys.CREATED: r"Registered on *(.+) at",
     }
 
-    def parse(self, blob: str) -> dict[str, Any]:
-        parsed_output = super().parse(blob)
+    def parse(self, blob: str, fields: Fields = None) -> dict[str, Any]:
+        parsed_output = super().parse(blob, fields)
         # parse created date
         created_match = parsed_output.get(
             TLDBaseKeys.CREATED
@@ -1089,12 +1190,14 @@ class RegexGG(TLDParser):
                 date_string, "%d %B %Y"
             )
         # handle multiline nameservers and statuses
-        parsed_output[TLDBaseKeys.NAME_SERVERS] = self.find_multiline_match(
-            "Name servers:", blob
-        )
-        parsed_output[TLDBaseKeys.STATUS] = self.find_multiline_match(
-            "Domain status:", blob
-        )
+        if self.wanted(fields, TLDBaseKeys.NAME_SERVERS):
+            parsed_output[TLDBaseKeys.NAME_SERVERS] = self.find_multiline_match(
+                "Name servers:", blob
+            )
+        if self.wanted(fields, TLDBaseKeys.STATUS):
+            parsed_output[TLDBaseKeys.STATUS] = self.find_multiline_match(
+                "Domain status:", blob
+            )
         return parsed_output
 
 
@@ -1104,11 +1207,12 @@ class RegexAW(TLDParser):
         TLDBaseKeys.REGISTRAR_ABUSE_EMAIL: r"Abuse Contact:\n*(.+)",
     }
 
-    def parse(self, blob: str) -> dict[str, Any]:
-        parsed_output = super().parse(blob)
-        parsed_output[TLDBaseKeys.NAME_SERVERS] = self.find_multiline_match(
-            "Domain nameservers:", blob
-        )
+    def parse(self, blob: str, fields: Fields = None) -> dict[str, Any]:
+        parsed_output = super().parse(blob, fields)
+        if self.wanted(fields, TLDBaseKeys.NAME_SERVERS):
+            parsed_output[TLDBaseKeys.NAME_SERVERS] = self.find_multiline_match(
+                "Domain nameservers:", blob
+            )
         return parsed_output
 
 
@@ -1127,8 +1231,10 @@ class RegexAX(TLDParser):
     }
     known_date_formats = ["%d.%m.%Y"]
 
-    def parse(self, blob: str) -> dict[str, Any]:
-        parsed_output = super().parse(blob)
+    def parse(self, blob: str, fields: Fields = None) -> dict[str, Any]:
+        parsed_output = super().parse(blob, fields)
+        if not self.wanted(fields, TLDBaseKeys.REGISTRANT_ADDRESS):
+            return parsed_output
         addresses = self.find_match(r"address\.+: *(.+)", blob, many=True)
         if addresses:
             parsed_output[TLDBaseKeys.REGISTRANT_ADDRESS] = ", ".join(addresses)
@@ -1143,11 +1249,12 @@ class RegexML(TLDParser):
         TLDBaseKeys.STATUS: r"Domain name:\n.+\sis\s*(.+)",
     }
 
-    def parse(self, blob: str) -> dict[str, Any]:
-        parsed_output = super().parse(blob)
-        parsed_output[TLDBaseKeys.NAME_SERVERS] = self.find_multiline_match(
-            "Domain nameservers:", blob
-        )
+    def parse(self, blob: str, fields: Fields = None) -> dict[str, Any]:
+        parsed_output = super().parse(blob, fields)
+        if self.wanted(fields, TLDBaseKeys.NAME_SERVERS):
+            parsed_output[TLDBaseKeys.NAME_SERVERS] = self.find_multiline_match(
+                "Domain nameservers:", blob
+            )
         for contact in ("Admin", "Billing", "Owner", "Tech"):
             # isolate the appropriate contact block
             contact_blob = re.search(f"{contact} contact:\n(.+)\n\n", blob, re.DOTALL)
@@ -1172,7 +1279,7 @@ class RegexML(TLDParser):
                         base_key = getattr(TLDBaseKeys, f"{contact}_Email".upper())
                     else:
                         base_key = getattr(TLDBaseKeys, f"{contact}_{key}".upper())
-                    if not base_key:
+                    if not base_key or not self.wanted(fields, base_key):
                         continue
                     # updated parser dict
                     parsed_output[base_key] = self.find_match(
@@ -1217,65 +1324,22 @@ class RegexUZ(TLDParser):
         TLDBaseKeys.TECH_NAME: r"Technical Contact:\s+([A-Za-z0-9\.\s]+\n)",
     }
 
-    def parse(self, blob: str) -> dict[str, Any]:
-        output = super().parse(blob)
-        output[TLDBaseKeys.NAME_SERVERS] = self.find_multiline_match(
-            "Domain servers in listed order:", blob
-        )
+    def parse(self, blob: str, fields: Fields = None) -> dict[str, Any]:
+        output = super().parse(blob, fields)
+        if self.wanted(fields, TLDBaseKeys.NAME_SERVERS):
+            output[TLDBaseKeys.NAME_SERVERS] = self.find_multiline_match(
+                "Domain servers in listed order:", blob
+            )
         return output
 
 
-class RegexGA(TLDParser):
+class RegexGA(RegexTK):
     tld_specific_expressions: ExpressionDict = {
         TLDBaseKeys.DOMAIN_NAME: r"Domain name:\n*(.+) is",
         TLDBaseKeys.STATUS: r"Domain name:\n*.+ is (.+)",
         TLDBaseKeys.CREATED: r"Domain registered: *(.+)",
         TLDBaseKeys.EXPIRES: r"Record will expire on: *(.+)",
-        TLDBaseKeys.REGISTRANT_ORGANIZATION: r"(?<=Owner contact)[\s\S]*?Organization:(.*)",
-        TLDBaseKeys.REGISTRANT_NAME: r"(?<=Owner contact)[\s\S]*?Name:(.*)",
-        TLDBaseKeys.REGISTRANT_ADDRESS: r"(?<=Owner contact)[\s\S]*?Address:(.*)",
-        TLDBaseKeys.REGISTRANT_STATE: r"(?<=Owner contact)[\s\S]*?State:(.*)",
-        TLDBaseKeys.REGISTRANT_CITY: r"(?<=Owner contact)[\s\S]*?City:(.*)",
-        TLDBaseKeys.REGISTRANT_COUNTRY: r"(?<=Owner contact)[\s\S]*?Country:(.*)",
-        TLDBaseKeys.REGISTRANT_EMAIL: r"(?<=Owner contact)[\s\S]*?Phone:(.*)",
-        TLDBaseKeys.REGISTRANT_FAX: r"(?<=Owner contact)[\s\S]*?Fax:(.*)",
-        TLDBaseKeys.REGISTRANT_PHONE: r"(?<=Owner contact)[\s\S]*?Phone:(.*)",
-        TLDBaseKeys.ADMIN_ORGANIZATION: r"(?<=Admin contact)[\s\S]*?Organization:(.*)",
-        TLDBaseKeys.ADMIN_NAME: r"(?<=Admin contact)[\s\S]*?Name:(.*)",
-        TLDBaseKeys.ADMIN_ADDRESS: r"(?<=Admin contact)[\s\S]*?Address:(.*)",
-        TLDBaseKeys.ADMIN_STATE: r"(?<=Admin contact)[\s\S]*?State:(.*)",
-        TLDBaseKeys.ADMIN_CITY: r"(?<=Admin contact)[\s\S]*?City:(.*)",
-        TLDBaseKeys.ADMIN_COUNTRY: r"(?<=Admin contact)[\s\S]*?Country:(.*)",
-        TLDBaseKeys.ADMIN_EMAIL: r"(?<=Admin contact)[\s\S]*?Phone:(.*)",
-        TLDBaseKeys.ADMIN_FAX: r"(?<=Admin contact)[\s\S]*?Fax:(.*)",
-        TLDBaseKeys.ADMIN_PHONE: r"(?<=Admin contact)[\s\S]*?Phone:(.*)",
-        TLDBaseKeys.BILLING_ORGANIZATION: r"(?<=Billing contact)[\s\S]*?Organization:(.*)",
-        TLDBaseKeys.BILLING_NAME: r"(?<=Billing contact)[\s\S]*?Name:(.*)",
-        TLDBaseKeys.BILLING_ADDRESS: r"(?<=Billing contact)[\s\S]*?Address:(.*)",
-        TLDBaseKeys.BILLING_STATE: r"(?<=Billing contact)[\s\S]*?State:(.*)",
-        TLDBaseKeys.BILLING_CITY: r"(?<=Billing contact)[\s\S]*?City:(.*)",
-        TLDBaseKeys.BILLING_COUNTRY: r"(?<=Billing contact)[\s\S]*?Country:(.*)",
-        TLDBaseKeys.BILLING_EMAIL: r"(?<=Billing contact)[\s\S]*?Phone:(.*)",
-        TLDBaseKeys.BILLING_FAX: r"(?<=Billing contact)[\s\S]*?Fax:(.*)",
-        TLDBaseKeys.BILLING_PHONE: r"(?<=Billing contact)[\s\S]*?Phone:(.*)",
-        TLDBaseKeys.TECH_ORGANIZATION: r"(?<=Tech contact)[\s\S]*?Organization:(.*)",
-        TLDBaseKeys.TECH_NAME: r"(?<=Tech contact)[\s\S]*?Name:(.*)",
-        TLDBaseKeys.TECH_ADDRESS: r"(?<=Tech contact)[\s\S]*?Address:(.*)",
-        TLDBaseKeys.TECH_STATE: r"(?<=Tech contact)[\s\S]*?State:(.*)",
-        TLDBaseKeys.TECH_CITY: r"(?<=Tech contact)[\s\S]*?City:(.*)",
-        TLDBaseKeys.TECH_COUNTRY: r"(?<=Tech contact)[\s\S]*?Country:(.*)",
-        TLDBaseKeys.TECH_EMAIL: r"(?<=Tech contact)[\s\S]*?Phone:(.*)",
-        TLDBaseKeys.TECH_FAX: r"(?<=Tech contact)[\s\S]*?Fax:(.*)",
-        TLDBaseKeys.TECH_PHONE: r"(?<=Tech contact)[\s\S]*?Phone:(.*)",
     }
-    known_date_formats = ["%m/%d/%Y"]
-
-    def parse(self, blob: str) -> dict[str, Any]:
-        output = super().parse(blob)
-        output[TLDBaseKeys.NAME_SERVERS] = self.find_multiline_match(
-            "Domain Nameservers:", blob
-        )
-        return output
 
 
 class RegexAS(TLDParser):
@@ -1287,11 +1351,12 @@ class RegexAS(TLDParser):
         TLDBaseKeys.STATUS: r"Domain Status:\s+(.*)",
     }
 
-    def parse(self, blob: str) -> dict[str, Any]:
-        output = super().parse(blob)
-        output[TLDBaseKeys.NAME_SERVERS] = self.find_multiline_match(
-            "Name servers:", blob
-        )
+    def parse(self, blob: str, fields: Fields = None) -> dict[str, Any]:
+        output = super().parse(blob, fields)
+        if self.wanted(fields, TLDBaseKeys.NAME_SERVERS):
+            output[TLDBaseKeys.NAME_SERVERS] = self.find_multiline_match(
+                "Name servers:", blob
+            )
         return output
 
 
@@ -1302,11 +1367,12 @@ class RegexBG(TLDParser):
         TLDBaseKeys.DNSSEC: r"DNSSEC:\s(.*)",
     }
 
-    def parse(self, blob: str) -> dict[str, Any]:
-        output = super().parse(blob)
-        output[TLDBaseKeys.NAME_SERVERS] = self.find_multiline_match(
-            "NAME SERVER INFORMATION:", blob
-        )
+    def parse(self, blob: str, fields: Fields = None) -> dict[str, Any]:
+        output = super().parse(blob, fields)
+        if self.wanted(fields, TLDBaseKeys.NAME_SERVERS):
+            output[TLDBaseKeys.NAME_SERVERS] = self.find_multiline_match(
+                "NAME SERVER INFORMATION:", blob
+            )
         return output
 
 
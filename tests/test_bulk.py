@@ -0,0 +1,147 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import asyncwhois
+from asyncwhois.bulk import LookupStatus, run_many
+from asyncwhois.errors import NotFoundError
+
+
+@pytest.mark.asyncio
+async def test_run_many_caps_concurrency_and_yields_in_completion_order():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def lookup(delay):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(delay)
+        in_flight -= 1
+        return str(delay), {}
+
+    delays = [0.05, 0.01, 0.03, 0.02, 0.04]
+    results = [r async for r in run_many(lookup, delays, concurrency=2)]
+    assert max_in_flight == 2
+    assert len(results) == len(delays)
+    # the slow first lookup must not hold back the fast ones queued behind it
+    assert results[0].search_term == 0.01
+    assert all(r.status == LookupStatus.OK for r in results)
+
+
+@pytest.mark.asyncio
+async def test_run_many_consumes_search_terms_lazily():
+    pulled = []
+
+    def search_terms():
+        for i in range(1000):
+            pulled.append(i)
+            yield i
+
+    async def lookup(search_term):
+        return "", {}
+
+    results = run_many(lookup, search_terms(), concurrency=3)
+    await results.__anext__()
+    await results.aclose()
+    assert len(pulled) <= 4
+
+
+@pytest.mark.asyncio
+async def test_run_many_reports_errors_on_envelope():
+    async def lookup(search_term):
+        if search_term == "missing.com":
+            raise NotFoundError("Domain not found!")
+        if search_term == "broken.com":
+            raise ConnectionError("boom")
+        return f"Domain Name: {search_term}", {"domain_name": search_term}
+
+    async def search_terms():
+        for domain in ["amazon.com", "missing.com", "broken.com"]:
+            yield domain
+
+    results = {r.search_term: r async for r in run_many(lookup, search_terms())}
+    assert results["amazon.com"].status == LookupStatus.OK
+    assert results["amazon.com"].parser_output == {"domain_name": "amazon.com"}
+    assert results["missing.com"].status == LookupStatus.NOT_FOUND
+    assert isinstance(results["missing.com"].error, NotFoundError)
+    assert results["broken.com"].status == LookupStatus.ERROR
+    assert isinstance(results["broken.com"].error, ConnectionError)
+
+
+@pytest.mark.asyncio
+async def test_aio_whois_many_reuses_clients(mocker):
+    domain_lookup = mocker.patch(
+        "asyncwhois.client.DomainClient.aio_whois",
+        side_effect=mocker.AsyncMock(return_value=("domain", {})),
+    )
+    number_lookup = mocker.patch(
+        "asyncwhois.client.NumberClient.aio_whois",
+        side_effect=mocker.AsyncMock(return_value=("number", {})),
+    )
+    domain_init = mocker.spy(asyncwhois.DomainClient, "__init__")
+    search_terms = ["amazon.com", "8.8.8.8", "bitcoin.org", "2001:4860::8888"]
+    results = [r async for r in asyncwhois.aio_whois_many(search_terms)]
+    assert sorted(r.query_output for r in results) == [
+        "domain",
+        "domain",
+        "number",
+        "number",
+    ]
+    assert domain_lookup.call_count == 2
+    assert number_lookup.call_count == 2
+    assert domain_init.call_count == 1
+
+
+def test_parse_many_yields_results_in_order():
+    items = [
+        ("Domain Name: amazon.com\nRegistrar: MarkMonitor Inc.\n", "com"),
+        ("No match for domain", "com"),
+        ("NetRange: 8.8.8.0 - 8.8.8.255\nNetName: GOGL\n", "8.8.8.8"),
+    ] * 5
+    results = list(asyncwhois.parse_many(items, processes=2, chunk_size=2))
+    assert [r.search_term for r in results] == [key for _, key in items]
+    assert [r.status for r in results[:3]] == [
+        LookupStatus.OK,
+        LookupStatus.NOT_FOUND,
+        LookupStatus.OK,
+    ]
+    assert results[0].parser_output["registrar"] == "MarkMonitor Inc."
+    assert results[0].query_output == items[0][0]
+    assert isinstance(results[1].error, NotFoundError)
+    assert results[2].parser_output["net_name"] == "GOGL"
+
+
+def test_parse_many_consumes_items_lazily():
+    pulled = []
+
+    def items():
+        for i in range(1000):
+            pulled.append(i)
+            yield "Domain Name: amazon.com\n", "com"
+
+    with ThreadPoolExecutor(2) as executor:
+        results = asyncwhois.parse_many(
+            items(), chunk_size=10, prefetch=2, executor=executor
+        )
+        assert next(results).status == LookupStatus.OK
+        results.close()
+    assert len(pulled) <= 30
+
+
+def test_parse_many_keeps_every_worker_busy(monkeypatch):
+    pulled = []
+
+    def items():
+        for i in range(1000):
+            pulled.append(i)
+            yield "Domain Name: amazon.com\n", "com"
+
+    # the same constructor arguments, without spawning processes
+    monkeypatch.setattr(asyncwhois.bulk, "ProcessPoolExecutor", ThreadPoolExecutor)
+    results = asyncwhois.parse_many(items(), processes=8, chunk_size=1)
+    assert next(results).status == LookupStatus.OK
+    # two chunks per worker are submitted before the first result is yielded
+    assert len(pulled) == 16
+    results.close()
@@ -0,0 +1,279 @@
+import asyncio
+import contextlib
+import ipaddress
+import time
+import unittest.mock as mock
+
+import pytest
+import whodap
+
+from asyncwhois.cache import DiskCache, NetworkCache, ReferralCache, ResultCache
+from asyncwhois.client import DomainClient, NumberClient
+from asyncwhois.errors import NotFoundError
+from asyncwhois.query import DomainQuery, NumberQuery
+
+IANA_TLD_OUTPUT = """% IANA WHOIS server
+refer:        whois.nic.al
+
+domain:       AL
+"""
+
+IANA_IPV6_OUTPUT = """% IANA WHOIS server
+refer:        whois.arin.net
+
+inet6num:     2001:4800:0:0:0:0:0:0/23
+organisation: ARIN
+whois:        whois.arin.net
+"""
+
+
+def mock_servers(query, responses):
+    """Patches `query` so each server returns its entry in `responses`."""
+    contacted = []
+
+    def create_connection(address, _):
+        contacted.append(address[0])
+        return contextlib.nullcontext(address[0])
+
+    patches = contextlib.ExitStack()
+    patches.enter_context(
+        mock.patch.object(query, "_create_connection", side_effect=create_connection)
+    )
+    patches.enter_context(
+        mock.patch.object(
+            query, "_send_and_recv", side_effect=lambda server, _: responses[server]
+        )
+    )
+    return patches, contacted
+
+
+def test_referral_cache_skips_iana_hop():
+    query = DomainQuery(referral_cache=ReferralCache())
+    responses = {
+        "whois.iana.org": IANA_TLD_OUTPUT,
+        "whois.nic.al": "Domain Name: example.al\n",
+    }
+    patches, contacted = mock_servers(query, responses)
+    with patches:
+        first_chain = query.run("example.al")
+        second_chain = query.run("another.al")
+    assert first_chain == second_chain == list(responses.values())
+    assert contacted == ["whois.iana.org", "whois.nic.al", "whois.nic.al"]
+
+
+def test_referral_cache_keys_ipv6_by_iana_block():
+    query = NumberQuery(referral_cache=ReferralCache())
+    responses = {
+        "whois.iana.org": IANA_IPV6_OUTPUT,
+        "whois.arin.net": "NetRange: 2001:4860:: - 2001:4860:FFFF:FFFF:FFFF:FFFF:FFFF:FFFF\n",
+    }
+    patches, contacted = mock_servers(query, responses)
+    # pretend the addresses are missing from the bundled IPv6 allocations
+    patches.enter_context(
+        mock.patch.object(NumberQuery, "_get_server_name", return_value=None)
+    )
+    with patches:
+        query.run(ipaddress.ip_address("2001:4860::8888"))
+        query.run(ipaddress.ip_address("2001:4801::1"))
+        query.run(ipaddress.ip_address("2001:db8::1"))
+    assert contacted.count("whois.iana.org") == 2
+
+
+def test_referral_cache_expires_entries():
+    cache = ReferralCache(ttl=60)
+    cache.set("example.al", "whois.nic.al", IANA_TLD_OUTPUT)
+    assert cache.get("EXAMPLE.AL") == ("whois.nic.al", IANA_TLD_OUTPUT)
+    with mock.patch("asyncwhois.cache.time.time", return_value=time.time() + 61):
+        assert cache.get("example.al") is None
+
+
+def test_referral_cache_persists_to_disk(tmp_path):
+    path = str(tmp_path / "referrals.json")
+    cache = ReferralCache(path=path)
+    cache.set("example.al", "whois.nic.al", IANA_TLD_OUTPUT)
+    cache.set("2001:4860::8888", "whois.arin.net", IANA_IPV6_OUTPUT)
+    cache.close()
+    warm_cache = ReferralCache(path=path)
+    assert warm_cache.get("other.al") == ("whois.nic.al", IANA_TLD_OUTPUT)
+    assert warm_cache.get("2001:4801::1") == ("whois.arin.net", IANA_IPV6_OUTPUT)
+
+
+@pytest.mark.asyncio
+async def test_referral_cache_defers_disk_writes(tmp_path):
+    path = tmp_path / "referrals.json"
+    cache = ReferralCache(path=str(path), save_interval=None)
+    for tld in ("al", "am", "ao"):
+        cache.set(f"example.{tld}", f"whois.nic.{tld}", IANA_TLD_OUTPUT)
+    assert not path.exists()
+    await cache.aio_save()
+    assert ReferralCache(path=str(path)).get("other.ao") is not None
+    # the timer writes new entries without an explicit save
+    timed_cache = ReferralCache(path=str(path), save_interval=0.01)
+    timed_cache.set("example.ax", "whois.ax", IANA_TLD_OUTPUT)
+    for _ in range(100):
+        await asyncio.sleep(0.01)
+        if ReferralCache(path=str(path)).get("other.ax") is not None:
+            break
+    else:
+        pytest.fail("the save timer did not write the new entry")
+
+
+def test_result_cache_evicts_least_recently_used():
+    cache = ResultCache(maxsize=2)
+    cache.set("a", ("a", {}))
+    cache.set("b", ("b", {}))
+    assert cache.get("a") == ("a", {})
+    cache.set("c", ("c", {}))
+    assert cache.get("b") is None
+    assert cache.get("a") == ("a", {})
+    assert cache.get("c") == ("c", {})
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_result_cache_negative_ttl():
+    cache = ResultCache(ttl=3600, negative_ttl=10)
+    cache.set_not_found("missing.com", NotFoundError("Domain not found!"))
+    with pytest.raises(NotFoundError):
+        cache.get("missing.com")
+    later = time.monotonic() + 11
+    with mock.patch("asyncwhois.cache.time.monotonic", return_value=later):
+        assert cache.get("missing.com") is None
+
+
+def test_domain_client_caches_by_registered_domain(mocker):
+    client = DomainClient(result_cache=ResultCache())
+    run = mocker.patch.object(
+        client.query_obj, "run", return_value=["Domain Name: google.com\n"]
+    )
+    first = client.whois("https://www.google.com/search?q=asyncwhois")
+    second = client.whois("mail.GOOGLE.com")
+    assert first == second
+    assert run.call_count == 1
+    assert client.result_cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_number_client_caches_not_found(mocker):
+    client = NumberClient(result_cache=ResultCache())
+    aio_run = mocker.patch.object(
+        client.query_obj,
+        "aio_run",
+        side_effect=mocker.AsyncMock(side_effect=NotFoundError("not found")),
+    )
+    for _ in range(2):
+        with pytest.raises(NotFoundError):
+            await client.aio_whois("192.0.2.1")
+    assert aio_run.call_count == 1
+
+
+ARIN_OUTPUT = """
+NetRange:       8.0.0.0 - 8.127.255.255
+CIDR:           8.0.0.0/9
+NetName:        LVLT-ORG-8-8
+
+NetRange:       8.8.8.0 - 8.8.8.255
+CIDR:           8.8.8.0/24
+NetName:        GOGL
+"""
+
+RIPE_OUTPUT = """
+inetnum:        193.0.0.0 - 193.0.7.255
+netname:        RIPE-NCC
+"""
+
+
+def test_network_cache_uses_most_specific_block():
+    cache = NetworkCache()
+    result = (ARIN_OUTPUT, {"net_name": "GOGL"})
+    network = cache.put(ipaddress.ip_address("8.8.8.8"), result)
+    assert network == ipaddress.ip_network("8.8.8.0/24")
+    assert cache.get(ipaddress.ip_address("8.8.8.200")) == result
+    assert cache.get(ipaddress.ip_address("8.8.9.1")) is None
+
+
+def test_network_cache_narrows_broad_blocks():
+    cache = NetworkCache(min_prefixlen=(24, 48))
+    result = (RIPE_OUTPUT, {})
+    network = cache.put(ipaddress.ip_address("193.0.6.139"), result)
+    assert network == ipaddress.ip_network("193.0.6.0/24")
+    assert cache.get(ipaddress.ip_address("193.0.6.1")) == result
+    assert cache.get(ipaddress.ip_address("193.0.0.1")) is None
+    # a broader limit reuses the whole block from the response
+    cache = NetworkCache(min_prefixlen=(16, 32))
+    cache.put(ipaddress.ip_address("193.0.6.139"), result)
+    assert cache.get(ipaddress.ip_address("193.0.0.1")) == result
+
+
+def test_network_cache_parses_abbreviated_lacnic_blocks():
+    networks = NetworkCache._parse_networks("200.160.0/20", 4)
+    assert networks == [ipaddress.ip_network("200.160.0.0/20")]
+
+
+@pytest.mark.asyncio
+async def test_number_client_merges_lookups_in_same_block(mocker):
+    client = NumberClient(network_cache=NetworkCache())
+
+    async def aio_run(ip):
+        await asyncio.sleep(0.01)
+        return [ARIN_OUTPUT]
+
+    aio_run = mocker.patch.object(client.query_obj, "aio_run", side_effect=aio_run)
+    addresses = [f"8.8.8.{i}" for i in range(50)]
+    results = await asyncio.gather(*(client.aio_whois(ip) for ip in addresses))
+    assert aio_run.call_count == 1
+    assert all(r == results[0] for r in results)
+
+
+def test_disk_cache_survives_restart(tmp_path):
+    path = str(tmp_path / "responses.db")
+    with DiskCache(path, flush_interval=60) as disk_cache:
+        disk_cache.set("whois:google.com", "payload", "whois.verisign-grs.com")
+        # readable before the background writer has committed it
+        assert disk_cache.get("whois:google.com") == "payload"
+    with DiskCache(path) as disk_cache:
+        assert disk_cache.get("whois:google.com") == "payload"
+        assert disk_cache.get("whois:example.com") is None
+
+
+def test_disk_cache_prunes_expired_entries(tmp_path):
+    with DiskCache(str(tmp_path / "responses.db")) as disk_cache:
+        disk_cache.set("fresh", "payload")
+        disk_cache.set("stale", "payload", ttl=0)
+        assert disk_cache.get("stale") is None
+        disk_cache.flush()
+        assert disk_cache.prune() == 1
+        assert disk_cache.get("fresh") == "payload"
+
+
+def test_domain_query_reuses_chain_from_disk_cache(tmp_path):
+    chain = ["refer: whois.nic.al\n", "Domain Name: example.al\n"]
+    with DiskCache(str(tmp_path / "responses.db")) as disk_cache:
+        query = DomainQuery(disk_cache=disk_cache)
+        with mock.patch.object(query, "_run", return_value=chain) as run:
+            assert query.run("example.al") == chain
+            assert query.run("EXAMPLE.al") == chain
+        assert run.call_count == 1
+        # chains that stop at the first hop are cached separately
+        first_hop = DomainQuery(find_authoritative_server=False, disk_cache=disk_cache)
+        with mock.patch.object(first_hop, "_run", return_value=chain[:1]) as run:
+            assert first_hop.run("example.al") == chain[:1]
+        assert run.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_domain_client_reuses_rdap_response_from_disk_cache(tmp_path):
+    rdap_output = whodap.DomainResponse.from_json(
+        '{"ldhName": "example.com", "links": '
+        '[{"rel": "self", "href": "https://rdap.example/domain/example.com"}]}'
+    )
+    whodap_client = mock.Mock()
+    whodap_client.aio_lookup = mock.AsyncMock(return_value=rdap_output)
+    path = str(tmp_path / "responses.db")
+    with DiskCache(path) as disk_cache:
+        client = DomainClient(whodap_client=whodap_client, disk_cache=disk_cache)
+        query_string, _ = await client.aio_rdap("example.com")
+    # a new process starts with an empty client and a warm disk cache
+    with DiskCache(path) as disk_cache:
+        client = DomainClient(whodap_client=whodap_client, disk_cache=disk_cache)
+        assert (await client.aio_rdap("www.example.com"))[0] == query_string
+    assert whodap_client.aio_lookup.call_count == 1
@@ -0,0 +1,80 @@
+import csv
+import datetime
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import asyncwhois
+from asyncwhois.bulk import LookupStatus
+from asyncwhois.columnar import ColumnarWriter
+from asyncwhois.parse import IPBaseKeys, TLDBaseKeys
+from asyncwhois.parse_tld import DomainParser
+
+DOMAIN_OUTPUT = """Domain Name: amazon.com
+Registrar: MarkMonitor Inc.
+Creation Date: 1994-11-01T05:00:00Z
+Name Server: ns1.amzndns.com
+Name Server: ns2.amzndns.com
+"""
+
+
+def test_csv_writer_flushes_row_groups():
+    output = DomainParser().parse(DOMAIN_OUTPUT, "com")
+    file = io.StringIO()
+    writer = ColumnarWriter(
+        file,
+        fields=[TLDBaseKeys.CREATED, TLDBaseKeys.NAME_SERVERS],
+        output_format="csv",
+        row_group_size=2,
+    )
+    for _ in range(3):
+        writer.append(output, "amazon.com")
+    # the header and two full rows are written, one row is still buffered
+    assert len(file.getvalue().splitlines()) == 3
+    writer.append({}, "missing.com", LookupStatus.NOT_FOUND)
+    writer.close()
+    rows = list(csv.reader(io.StringIO(file.getvalue())))
+    assert rows[0] == ["search_term", "lookup_status", "created", "name_servers"]
+    assert rows[1] == [
+        "amazon.com",
+        "ok",
+        "1994-11-01T05:00:00+00:00",
+        "ns1.amzndns.com;ns2.amzndns.com",
+    ]
+    assert rows[4] == ["missing.com", "not_found", "", ""]
+    assert len(writer) == 4
+
+
+def test_writer_extends_with_parse_many_results(tmp_path):
+    path = str(tmp_path / "domains.csv")
+    items = [(DOMAIN_OUTPUT, "com"), ("No match for domain", "com")]
+    with ThreadPoolExecutor(1) as executor:
+        with ColumnarWriter(path, output_format="csv") as writer:
+            writer.extend(asyncwhois.parse_many(items, executor=executor))
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["lookup_status"] for row in rows] == ["ok", "not_found"]
+    assert rows[0]["registrar"] == "MarkMonitor Inc."
+    assert rows[1]["registrar"] == ""
+
+
+def test_arrow_writer_types_columns(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet
+
+    path = str(tmp_path / "networks.parquet")
+    output = {
+        IPBaseKeys.NET_NAME: "GOGL",
+        IPBaseKeys.REG_DATE: datetime.datetime(2014, 3, 14),
+        IPBaseKeys.UPDATED: "not a date",
+    }
+    with ColumnarWriter(path, key_type=IPBaseKeys, row_group_size=1) as writer:
+        writer.append(output, "8.8.8.8")
+        writer.append({}, "8.8.4.4")
+    parquet_file = pyarrow.parquet.ParquetFile(path)
+    assert parquet_file.metadata.num_row_groups == 2
+    table = parquet_file.read()
+    assert table.schema.field("registered_date").type == pa.timestamp("us", tz="UTC")
+    assert table.column("net_name").to_pylist() == ["GOGL", None]
+    assert table.column("updated_date").to_pylist() == [None, None]
@@ -1,6 +1,8 @@
 from datetime import datetime
 
-from asyncwhois.parse import BaseParser
+from dateutil.parser import parse
+
+from asyncwhois.parse import BaseParser, _parse_iso_date
 
 
 def test_dateparsers():  # noqa
@@ -60,3 +62,36 @@ def test_dateparsers():  # noqa
     for dt in date_and_time_examples:
         result = bp._parse_date(dt)
         assert isinstance(result, datetime), f"Failed to parse date string: {dt}"
+
+
+def test_iso_dates_match_dateutil():
+    iso_examples = [
+        "2000-01-02",
+        "2007-01-26T19:10:31",
+        "2007-01-26T19:10:31Z",
+        "2000-08-22 18:55:20",
+        "2018-12-01T16:17:30.568Z",
+        "2024-02-19 01:30:15.927683+11",
+        "2011-09-08T14:44:51.622265+03:00",
+        "2013-12-06T08:17:22-0800",
+        "2011-03-30T19:36:27+0000",
+    ]
+    for dt in iso_examples:
+        expected = parse(dt, tzinfos=BaseParser.timezone_info)
+        result = _parse_iso_date(dt, BaseParser.timezone_info)
+        assert (result, repr(result)) == (expected, repr(expected)), dt
+    # anything else is left to dateutil
+    assert _parse_iso_date("2000-02-30", BaseParser.timezone_info) is None
+    assert _parse_iso_date("2008-08-31 04:14:06 KST", BaseParser.timezone_info) is None
+
+
+def test_known_date_formats_keep_their_results():
+    class DottedDateParser(BaseParser):
+        known_date_formats = ["%d.%m.%Y %H:%M:%S", "%d.%m.%Y"]
+
+    parser = DottedDateParser()
+    assert parser._parse_date("08.03.2014") == datetime(2014, 3, 8)
+    assert DottedDateParser._last_date_format == "%d.%m.%Y"
+    assert parser._parse_date("08.03.2014 10:28:24") == datetime(2014, 3, 8, 10, 28, 24)
+    assert parser._parse_date("08.03.2014") is parser._parse_date("08.03.2014")
+    assert BaseParser._last_date_format is None
@@ -3,6 +3,8 @@ import sys
 import pytest
 import asyncwhois
 from asyncwhois.errors import NotFoundError
+from asyncwhois.parse_tld import NOT_FOUND_WINDOW, DomainParser
+from asyncwhois.tldparsers import RegexDE
 
 if sys.version_info >= (3, 8):
     from unittest import IsolatedAsyncioTestCase
@@ -21,3 +23,32 @@ if sys.version_info >= (3, 8):
                 asyncwhois.whois(domain)
 
             asyncwhois.whois(domain, ignore_not_found=True)
+
+
+def test_domain_parser_not_found_phrases(monkeypatch):
+    parser = DomainParser()
+    with pytest.raises(NotFoundError):
+        parser.parse("% NOT FOUND\n", "com")
+    assert parser.parse("Domain Name: example.com\n", "com")
+    # TLD parsers can add their own phrases
+    monkeypatch.setattr(RegexDE, "no_match_checks", ("status: free",))
+    with pytest.raises(NotFoundError):
+        parser.parse("Domain: example.de\nStatus: free\n", "de")
+    assert DomainParser(ignore_not_found=True).parse("Status: free\n", "de")
+
+
+def test_domain_parser_not_found_window():
+    blob = "Domain Name: example.com\n" + "Remarks: object not found here\n"
+    with pytest.raises(NotFoundError):
+        DomainParser().parse(blob, "com")
+    parsed = DomainParser(not_found_window=len("Domain Name: example.com\n"))
+    assert parsed.parse(blob, "com")["domain_name"] == "example.com"
+
+
+def test_domain_parser_not_found_window_default():
+    padding = "Remarks: " + "x" * NOT_FOUND_WINDOW + "\n"
+    blob = "Domain Name: example.com\n" + padding + "% object not found\n"
+    # the phrase is past the default window
+    assert DomainParser().parse(blob, "com")["domain_name"] == "example.com"
+    with pytest.raises(NotFoundError):
+        DomainParser(not_found_window=None).parse(blob, "com")
@@ -1,10 +1,11 @@
 import asyncio
 import sys
+from concurrent.futures import ThreadPoolExecutor
 import unittest.mock as mock
 
 import asyncwhois
 import pytest
-
+import whodap
 
 test_domain_name = "amazon.com"
 mock_response = ("Domain Name: amazon.com", {"domain_name": test_domain_name})
@@ -51,3 +52,78 @@ def test_whois(mock_whois_domain):
         f"domain name: {test_domain_name}" in q.lower()
     ), f"domain name: {test_domain_name} not in {q.lower()}"
     assert p.get("domain_name").lower() == test_domain_name
+
+
+def test_domain_client_fields(mocker):
+    client = asyncwhois.DomainClient(fields=["expires", "registrar"])
+    mocker.patch.object(
+        client.query_obj,
+        "run",
+        return_value=["Domain Name: amazon.com\nRegistrar: MarkMonitor Inc.\n"],
+    )
+    _, p = client.whois(test_domain_name)
+    assert p == {"expires": None, "registrar": "MarkMonitor Inc."}
+    with pytest.raises(ValueError):
+        asyncwhois.DomainClient(fields=["expiry"])
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_domain_client_adaptive_parse_offload(mocker):
+    with CountingExecutor(1) as executor:
+        client = asyncwhois.DomainClient(
+            parse_offload="adaptive",
+            parse_offload_threshold=100,
+            parse_executor=executor,
+        )
+        small = "Domain Name: amazon.com\n"
+        large = small + "%" * 100 + "\n"
+        aio_run = mock.AsyncMock(return_value=[small])
+        mocker.patch.object(client.query_obj, "aio_run", side_effect=aio_run)
+        _, p = await client.aio_whois("amazon.com")
+        assert executor.submitted == 0
+        aio_run.return_value = [large]
+        _, offloaded = await client.aio_whois("amazon.com")
+        assert executor.submitted == 1
+    assert p == offloaded
+    assert p.get("domain_name") == "amazon.com"
+
+
+@pytest.mark.asyncio
+async def test_number_client_process_parse_offload(mocker):
+    client = asyncwhois.NumberClient(parse_offload="process")
+    mocker.patch.object(
+        client.query_obj,
+        "aio_run",
+        side_effect=mock.AsyncMock(return_value=["NetRange: 8.8.8.0 - 8.8.8.255\n"]),
+    )
+    _, p = await client.aio_whois("8.8.8.8")
+    assert p.get("net_range") == "8.8.8.0 - 8.8.8.255"
+
+
+RDAP_DOMAIN = '{"objectClassName": "domain", "ldhName": "example.com"}'
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("parse_offload", ["thread", "process"])
+async def test_domain_client_rdap_parse_offload(parse_offload):
+    whodap_client = mock.Mock()
+    whodap_client.aio_lookup = mock.AsyncMock(
+        return_value=whodap.DomainResponse.from_json(RDAP_DOMAIN)
+    )
+    with CountingExecutor(1) as executor:
+        client = asyncwhois.DomainClient(
+            whodap_client=whodap_client,
+            parse_offload=parse_offload,
+            parse_executor=executor if parse_offload == "thread" else None,
+        )
+        _, p = await client.aio_rdap("example.com")
+        assert executor.submitted == (parse_offload == "thread")
+    assert p.get("domain_name") == "example.com"
@@ -1,9 +1,81 @@
 import unittest
+import unittest.mock as mock
+from concurrent.futures import ThreadPoolExecutor
 import datetime
+import ipaddress
 import json
 import os
 
-from asyncwhois.parse import BaseParser, convert_whodap_keys
+from asyncwhois import tldparsers
+from asyncwhois.parse import (
+    BaseParser,
+    IPBaseKeys,
+    LazyParseResult,
+    ParseEngine,
+    TLDBaseKeys,
+    convert_whodap_keys,
+)
+from asyncwhois.parse_rir import ARINParser, NumberParser, RIPEParser, RPSLIndex
+from asyncwhois.parse_tld import DomainParser
+
+RIR_OUTPUTS = {
+    "whois.arin.net": """
+NetRange:       8.8.8.0 - 8.8.8.255
+CIDR:           8.8.8.0/24
+NetName:        GOGL
+OrgAbuseHandle: ABUSE5250-ARIN
+OrgAbuseEmail:  network-abuse@google.com
+""",
+    "whois.afrinic.net": """
+inetnum:        196.1.0.0 - 196.1.0.255
+netname:        AFRINIC-NET
+abuse-c:        AA1-AFRINIC
+tech-c:         TC1-AFRINIC
+
+role:           AFRINIC Abuse
+address:        Ebene
+phone:          +230 403 51 00
+nic-hdl:        AA1-AFRINIC
+source:         AFRINIC
+""",
+    "whois.apnic.net": """
+inetnum:        1.1.1.0 - 1.1.1.255
+netname:        APNIC-LABS
+abuse-c:        AA1412-AP
+tech-c:         AA1412-AP
+
+role:           ABUSE APNICRESEARCH
+address:        PO Box 3646
+address:        South Brisbane, QLD 4101
+e-mail:         helpdesk@apnic.net
+nic-hdl:        AA1412-AP
+source:         APNIC
+""",
+    "whois.lacnic.net": """
+inetnum:     200.160.0.0/20
+owner:       Example BR
+abuse-c:     ABR1
+tech-c:      TBR1
+
+nic-hdl-br:  ABR1
+person:      Abuse BR
+e-mail:      abuse@example.br
+
+nic-hdl-br:  TBR1
+person:      Tech BR
+e-mail:      tech@example.br
+""",
+    "whois.ripe.net": """
+inetnum:        193.0.0.0 - 193.0.7.255
+netname:        RIPE-NCC
+abuse-c:        AR123-RIPE
+
+role:           Abuse Role
+address:        Amsterdam
+nic-hdl:        AR123-RIPE
+abuse-mailbox:  abuse@ripe.net
+""",
+}
 
 
 class TestWhoIsParserMethods(unittest.TestCase):
@@ -86,3 +158,238 @@ class TestWhoIsParserMethods(unittest.TestCase):
             r"Domain nameservers:\n", test_blob
         )
         self.assertEqual(len(name_servers), 4)
+
+    def test_expressions_compiled_per_class(self):
+        parser_classes = [tldparsers.TLDParser, tldparsers.RegexRU]
+        for parser_class in parser_classes:
+            for key, regex in parser_class.reg_expressions.items():
+                pattern = parser_class.compiled_expressions[key]
+                if regex:
+                    self.assertEqual(pattern.pattern, regex)
+                    self.assertTrue(pattern.flags & parser_class.reg_flags)
+                else:
+                    self.assertIsNone(pattern)
+        self.assertEqual(
+            tldparsers.RegexRU.compiled_expressions[TLDBaseKeys.DOMAIN_NAME].pattern,
+            tldparsers.RegexRU.tld_specific_expressions[TLDBaseKeys.DOMAIN_NAME],
+        )
+        with self.assertRaises(TypeError):
+            tldparsers.TLDParser.compiled_expressions[TLDBaseKeys.DOMAIN_NAME] = None
+
+    def test_update_reg_expressions_only_affects_instance(self):
+        parser = tldparsers.TLDParser()
+        parser.update_reg_expressions({TLDBaseKeys.DOMAIN_NAME: r"domain: *(.+)"})
+        self.assertEqual(
+            parser.parse("domain: google.com")["domain_name"], "google.com"
+        )
+        self.assertIsNone(
+            tldparsers.TLDParser().parse("domain: google.com")["domain_name"]
+        )
+
+    def test_init_parser_shares_instances(self):
+        parser = DomainParser._init_parser("ru")
+        self.assertIsInstance(parser, tldparsers.RegexRU)
+        self.assertIs(DomainParser._init_parser("RU"), parser)
+        self.assertIs(type(DomainParser._init_parser("dev")), tldparsers.TLDParser)
+        self.assertIs(
+            DomainParser._init_parser("dev"), DomainParser._init_parser("app")
+        )
+        ripe_parser = NumberParser._init_parser("whois.ripe.net")
+        self.assertIsInstance(ripe_parser, RIPEParser)
+        self.assertIs(NumberParser._init_parser("whois.ripe.net"), ripe_parser)
+        self.assertIsInstance(NumberParser._init_parser("unknown"), ARINParser)
+
+    def test_rir_parsers_interleave(self):
+        expected = {
+            server: type(NumberParser._init_parser(server))().parse(blob)
+            for server, blob in RIR_OUTPUTS.items()
+        }
+        self.assertEqual(expected["whois.arin.net"][IPBaseKeys.NET_NAME], "GOGL")
+        self.assertEqual(
+            expected["whois.apnic.net"][IPBaseKeys.ABUSE_ADDRESS],
+            "PO Box 3646, South Brisbane, QLD 4101",
+        )
+        self.assertEqual(
+            expected["whois.lacnic.net"][IPBaseKeys.TECH_EMAIL], "tech@example.br"
+        )
+        self.assertEqual(
+            expected["whois.ripe.net"][IPBaseKeys.ABUSE_EMAIL], "abuse@ripe.net"
+        )
+
+        def parse(server):
+            return server, NumberParser._init_parser(server).parse(RIR_OUTPUTS[server])
+
+        servers = list(RIR_OUTPUTS) * 20
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for server, output in executor.map(parse, servers):
+                self.assertEqual(output, expected[server], server)
+        with self.assertRaises(TypeError):
+            RIPEParser.reg_expressions[IPBaseKeys.NET_NAME] = r"descr: *(.+)"
+
+    def test_rpsl_index(self):
+        index = RPSLIndex(RIR_OUTPUTS["whois.apnic.net"])
+        self.assertEqual(
+            index.first("inetnum", "inet6num").get("netname"), "APNIC-LABS"
+        )
+        contact = index.get("aa1412-ap")
+        self.assertEqual(contact.object_class, "role")
+        self.assertEqual(contact.get("e-mail"), "helpdesk@apnic.net")
+        self.assertEqual([o.object_class for o in index.by_class["role"]], ["role"])
+        self.assertIsNone(index.get("missing-ap"))
+
+    def test_rpsl_parser_reads_ipv6_networks(self):
+        blob = RIR_OUTPUTS["whois.ripe.net"].replace(
+            "inetnum:        193.0.0.0 - 193.0.7.255",
+            "inet6num:       2001:67c:2e8::/48",
+        )
+        output = NumberParser().parse(blob, ipaddress.ip_address("2001:67c:2e8::1"))
+        self.assertEqual(output[IPBaseKeys.NET_RANGE], "2001:67c:2e8::/48")
+        self.assertEqual(output[IPBaseKeys.ABUSE_EMAIL], "abuse@ripe.net")
+
+    def test_section_expressions_stay_in_their_section(self):
+        blob = (
+            "   Owner contact:\n"
+            "      Name:         Owner Name\n"
+            "\n"
+            "   Admin contact:\n"
+            "      Name:         Admin Name\n"
+            "      Phone:        +1-2062664064\n"
+        )
+        output = tldparsers.RegexTK().parse(blob)
+        self.assertEqual(output[TLDBaseKeys.REGISTRANT_NAME], "Owner Name")
+        self.assertEqual(output[TLDBaseKeys.ADMIN_PHONE], "+1-2062664064")
+        # previously read from the admin block that follows
+        self.assertIsNone(output[TLDBaseKeys.REGISTRANT_PHONE])
+        self.assertIsNone(output[TLDBaseKeys.TECH_NAME])
+
+    def test_section_headers_skip_inline_labels(self):
+        blob = (
+            "Domain:          example.sk\n"
+            "Registrar:       REG-0001\n"
+            "Created:         2003-07-24\n"
+            "\n"
+            "Registrar:       REG-0001\n"
+            "Phone:           +421.220201400\n"
+            "\n"
+            "Contact:         EXAMPLE\n"
+            "Organization:    Example Inc.\n"
+            "Email:           dns-admin@example.com\n"
+            "City:            Mountain View\n"
+        )
+        output = tldparsers.RegexSK().parse(blob)
+        self.assertEqual(output[TLDBaseKeys.CREATED], datetime.datetime(2003, 7, 24))
+        self.assertEqual(output[TLDBaseKeys.REGISTRAR_ABUSE_PHONE], "+421.220201400")
+        self.assertEqual(output[TLDBaseKeys.REGISTRANT_CITY], "Mountain View")
+        # previously read from the contact block that follows
+        self.assertIsNone(output[TLDBaseKeys.REGISTRAR])
+        self.assertIsNone(output[TLDBaseKeys.REGISTRAR_ABUSE_EMAIL])
+
+    def test_line_engine_matches_regex_engine(self):
+        samples_dir = os.path.join(
+            os.path.abspath(os.path.dirname(__file__)), "samples"
+        )
+        for filename in sorted(os.listdir(samples_dir)):
+            if not (filename.startswith("tld_") and filename.endswith(".txt")):
+                continue
+            with open(os.path.join(samples_dir, filename), encoding="utf-8") as o:
+                blob = o.read()
+            # a private instance, since the shared ones must not be changed
+            parser = type(DomainParser._init_parser(filename[4:-4]))()
+            self.assertEqual(parser.parse_engine, ParseEngine.LINES)
+            lines_output = parser.parse(blob)
+            parser.parse_engine = ParseEngine.REGEX
+            self.assertEqual(lines_output, parser.parse(blob), filename)
+
+    def test_line_engine_edge_cases(self):
+        blob = "\n".join(
+            [
+                "Sponsoring REGISTRAR:   ",  # all spaces: ": *(.+)" keeps the last one
+                "Note: see Registrar: example registrar",
+                "Admin Name:no space",
+                "Admin Name: Jane",
+                "Admin City: ",
+                "Name Server: ns1.example.com",
+                "name server:",
+                "Name Server:   NS2.EXAMPLE.COM\r",
+            ]
+        )
+        lines_parser = tldparsers.TLDParser()
+        regex_parser = tldparsers.TLDParser()
+        regex_parser.parse_engine = ParseEngine.REGEX
+        output = lines_parser.parse(blob)
+        self.assertEqual(output, regex_parser.parse(blob))
+        self.assertEqual(output[TLDBaseKeys.ADMIN_NAME], "Jane")
+        self.assertEqual(
+            output[TLDBaseKeys.NAME_SERVERS], ["ns1.example.com", "NS2.EXAMPLE.COM"]
+        )
+
+    def test_lazy_parse_result_equals_parse(self):
+        samples_dir = os.path.join(
+            os.path.abspath(os.path.dirname(__file__)), "samples"
+        )
+        for tld in ("com", "ru", "uk"):  # TLDParser and `parse` overrides
+            with open(
+                os.path.join(samples_dir, f"tld_{tld}.txt"), encoding="utf-8"
+            ) as o:
+                blob = o.read()
+            parser = DomainParser._init_parser(tld)
+            lazy_output = DomainParser(lazy=True).parse(blob, tld)
+            self.assertIsInstance(lazy_output, LazyParseResult)
+            self.assertEqual(lazy_output, parser.parse(blob))
+            self.assertEqual(list(lazy_output), list(parser.parse(blob)))
+
+    def test_lazy_parse_result_extracts_on_first_access(self):
+        blob = "Registrar: Example Registrar\nCreation Date: 2000-01-01T00:00:00Z\n"
+        parser = tldparsers.TLDParser()
+        with mock.patch.object(
+            parser, "_parse_date", wraps=parser._parse_date
+        ) as parse_date:
+            output = parser.parse_lazy(blob)
+            self.assertIn("created", output)
+            self.assertEqual(output["registrar"], "Example Registrar")
+            parse_date.assert_not_called()
+            created = output["created"]
+            self.assertEqual(created.date(), datetime.date(2000, 1, 1))
+            self.assertIs(output[TLDBaseKeys.CREATED], created)
+            parse_date.assert_called_once()
+        with self.assertRaises(KeyError):
+            output["not_a_key"]
+
+    def test_parse_fields_projects_output(self):
+        samples_dir = os.path.join(
+            os.path.abspath(os.path.dirname(__file__)), "samples"
+        )
+        for filename in sorted(os.listdir(samples_dir)):
+            if not (filename.startswith("tld_") and filename.endswith(".txt")):
+                continue
+            with open(os.path.join(samples_dir, filename), encoding="utf-8") as o:
+                blob = o.read()
+            parser = DomainParser._init_parser(filename[4:-4])
+            output = parser.parse(blob)
+            for key, value in output.items():
+                self.assertEqual(parser.parse(blob, {key}), {key: value}, filename)
+            fields = ["created", "expires", "registrar", "name_servers"]
+            self.assertEqual(
+                parser.parse(blob, fields),
+                {key: value for key, value in output.items() if key in fields},
+            )
+
+    def test_parse_fields_keeps_dependencies_internal(self):
+        blob = "\n".join(
+            [
+                "inetnum:        193.0.0.0 - 193.0.7.255",
+                "abuse-c:        AR123-RIPE",
+                "",
+                "role:           Abuse Role",
+                "address:        Amsterdam",
+                "nic-hdl:        AR123-RIPE",
+                "abuse-mailbox:  abuse@example.net",
+                "",
+            ]
+        )
+        parser = RIPEParser()
+        output = parser.parse(blob, [IPBaseKeys.ABUSE_EMAIL])
+        self.assertEqual(output, {IPBaseKeys.ABUSE_EMAIL: "abuse@example.net"})
+        self.assertEqual(
+            parser.parse(blob)[IPBaseKeys.ABUSE_EMAIL], "abuse@example.net"
+        )
@@ -1089,6 +1089,37 @@ class TestTLDParsers(unittest.TestCase):
         )
         self.assertEqual(parser_output.get("registrant_city"), "Mountain View")
 
+    def test_parser_ga(self):
+        query_output = self.get_txt("ga")
+        tld = "ga"
+        parser_output = self.parser.parse(query_output, tld)
+        # confirm dates, which are month first
+        created_date = parser_output.get("created")
+        expires_date = parser_output.get("expires")
+        self.assertEqual(created_date.year, 2014)
+        self.assertEqual(expires_date.year, 2021)
+        self.assertEqual(created_date.month, 9)
+        self.assertEqual(expires_date.month, 12)
+        self.assertEqual(created_date.day, 17)
+        self.assertEqual(expires_date.day, 11)
+        # "Domain name:" is followed by "<name> is <status>"
+        self.assertEqual(parser_output.get("domain_name"), "AMAZON.GA")
+        self.assertEqual(parser_output.get("status"), ["Active"])
+        self.assertEqual(len(parser_output.get("name_servers")), 5)
+        self.assertEqual(parser_output.get("registrant_email"), "hostmaster@amazon.com")
+        self.assertEqual(parser_output.get("admin_email"), "hostmaster@amazon.com")
+        self.assertEqual(
+            parser_output.get("billing_email"), "ccopsbilling@markmonitor.com"
+        )
+        self.assertEqual(parser_output.get("tech_email"), "hostmaster@amazon.com")
+        self.assertEqual(parser_output.get("registrant_phone"), "+1-2062664064")
+        # without a status the whole line is the domain name
+        parser_output = self.parser.parse(
+            query_output.replace("AMAZON.GA is Active", "AMAZON.GA"), tld
+        )
+        self.assertEqual(parser_output.get("domain_name"), "AMAZON.GA")
+        self.assertEqual(parser_output.get("status"), [])
+
     def test_tld_nu(self):
         query_output = self.get_txt("nu")
         tld = "nu"
@@ -0,0 +1,80 @@
+import asyncio
+import contextlib
+import unittest.mock as mock
+
+import pytest
+
+from asyncwhois.query import DomainQuery
+from asyncwhois.ratelimit import (
+    DEFAULT_SERVER_POLICIES,
+    RateGovernor,
+    ServerPolicy,
+    TokenBucket,
+)
+
+
+def test_token_bucket_allows_burst_then_spaces_out():
+    bucket = TokenBucket(rate=10.0, burst=2)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_policy_overrides_and_defaults():
+    governor = RateGovernor(
+        policies={"WHOIS.DENIC.DE": ServerPolicy(max_concurrency=1)},
+        default_policy=ServerPolicy(max_concurrency=3),
+    )
+    assert governor.policy("whois.denic.de") == ServerPolicy(max_concurrency=1)
+    assert (
+        governor.policy("whois.jprs.jp") == DEFAULT_SERVER_POLICIES["whois.jprs.jp"]
+    )
+    assert governor.policy("whois.example") == ServerPolicy(max_concurrency=3)
+    assert RateGovernor(use_default_policies=False).policy("whois.jprs.jp") == (
+        ServerPolicy()
+    )
+
+
+@pytest.mark.asyncio
+async def test_aio_limit_caps_concurrency_per_server():
+    governor = RateGovernor(
+        policies={"whois.slow.example": ServerPolicy(max_concurrency=2)}
+    )
+    in_flight = {"whois.slow.example": 0, "whois.fast.example": 0}
+    peak = dict(in_flight)
+
+    async def query(server):
+        async with governor.aio_limit(server):
+            in_flight[server] += 1
+            peak[server] = max(peak[server], in_flight[server])
+            await asyncio.sleep(0.01)
+            in_flight[server] -= 1
+
+    servers = ["whois.slow.example"] * 6 + ["whois.fast.example"] * 6
+    await asyncio.gather(*(query(server) for server in servers))
+    assert peak["whois.slow.example"] == 2
+    assert peak["whois.fast.example"] == 6
+
+
+def test_every_hop_goes_through_governor():
+    governor = RateGovernor()
+    query = DomainQuery(rate_governor=governor)
+    responses = {
+        "whois.iana.org": "refer: whois.nic.al\n",
+        "whois.nic.al": "Registrar WHOIS Server: whois.registrar.example\n",
+        "whois.registrar.example": "Domain Name: example.al\n",
+    }
+    with mock.patch.object(
+        governor, "limit", wraps=governor.limit
+    ) as limit, mock.patch.object(
+        query,
+        "_create_connection",
+        side_effect=lambda address, _: contextlib.nullcontext(address[0]),
+    ), mock.patch.object(
+        query, "_send_and_recv", side_effect=lambda server, _: responses[server]
+    ):
+        # .al has no server in the IANA root db, so the chain starts at IANA
+        chain = query.run("example.al")
+    assert chain == list(responses.values())
+    assert [c.args[0] for c in limit.call_args_list] == list(responses)
@@ -0,0 +1,55 @@
+import ipaddress
+import pickle
+
+import asyncwhois
+from asyncwhois.parse import IPBaseKeys, TLDBaseKeys
+from asyncwhois.parse_rir import NumberParser
+from asyncwhois.parse_tld import DomainParser
+from asyncwhois.records import DomainRecord, IPRecord
+
+DOMAIN_OUTPUT = """Domain Name: amazon.com
+Registrar: MarkMonitor Inc.
+Creation Date: 1994-11-01T05:00:00Z
+Name Server: ns1.amzndns.com
+Name Server: ns2.amzndns.com
+"""
+
+
+def test_domain_record_equals_parser_dict():
+    expected = DomainParser().parse(DOMAIN_OUTPUT, "com")
+    record = DomainParser(compact=True).parse(DOMAIN_OUTPUT, "com")
+    assert isinstance(record, DomainRecord)
+    assert record == expected
+    assert record.to_dict() == expected
+    assert list(record) == [key for key in TLDBaseKeys if key in expected]
+    assert record["registrar"] == record[TLDBaseKeys.REGISTRAR] == "MarkMonitor Inc."
+    assert record.name_servers == ["ns1.amzndns.com", "ns2.amzndns.com"]
+    assert not hasattr(record, "__dict__")
+    assert pickle.loads(pickle.dumps(record)) == record
+
+
+def test_record_keeps_only_parsed_fields():
+    record = DomainParser(compact=True).parse(
+        DOMAIN_OUTPUT, "com", fields=[TLDBaseKeys.REGISTRAR]
+    )
+    assert record.to_dict() == {TLDBaseKeys.REGISTRAR: "MarkMonitor Inc."}
+    assert record.get("expires") is None
+    assert "expires" not in record
+    # keys outside the record's fields are kept too
+    record = IPRecord({IPBaseKeys.NET_NAME: "GOGL", "custom": 1})
+    assert record.to_dict() == {IPBaseKeys.NET_NAME: "GOGL", "custom": 1}
+
+
+def test_number_client_compact(mocker):
+    client = asyncwhois.NumberClient(compact=True)
+    mocker.patch.object(
+        client.query_obj,
+        "run",
+        return_value=["NetRange: 8.8.8.0 - 8.8.8.255\nNetName: GOGL\n"],
+    )
+    _, p = client.whois(ipaddress.ip_address("8.8.8.8"))
+    assert isinstance(p, IPRecord)
+    assert p == NumberParser().parse(
+        "NetRange: 8.8.8.0 - 8.8.8.255\nNetName: GOGL\n",
+        ipaddress.ip_address("8.8.8.8"),
+    )
@@ -0,0 +1,76 @@
+from ipaddress import IPv4Address, IPv6Address
+
+import pytest
+
+from asyncwhois.errors import GeneralError
+from asyncwhois.query import NumberQuery
+from asyncwhois.servers import IPv4Allocations, IPv6Allocations
+from asyncwhois.servers.ipv4 import IPV4_ALLOCATION_RANGES, IPV4_SERVERS
+
+
+def test_ipv4_allocation_ranges_are_sorted_and_disjoint():
+    for (_, last, _), (first, _, _) in zip(
+        IPV4_ALLOCATION_RANGES, IPV4_ALLOCATION_RANGES[1:]
+    ):
+        assert last < first
+    assert all(
+        first <= last and 0 <= server < len(IPV4_SERVERS)
+        for first, last, server in IPV4_ALLOCATION_RANGES
+    )
+
+
+@pytest.mark.parametrize(
+    "ip,whois_server",
+    [
+        ("1.0.0.0", "whois.apnic.net"),
+        ("8.8.8.8", "whois.arin.net"),
+        ("9.255.255.255", "whois.arin.net"),
+        ("41.0.0.1", "whois.afrinic.net"),
+        ("43.255.255.255", "whois.apnic.net"),
+        ("200.1.1.1", "whois.lacnic.net"),
+        ("223.255.255.255", "whois.apnic.net"),
+    ],
+)
+def test_ipv4_get_servers(ip, whois_server):
+    rdap_server, server = IPv4Allocations().get_servers(IPv4Address(ip))
+    assert server == whois_server
+    assert rdap_server.startswith("https://")
+
+
+@pytest.mark.parametrize("ip", ["0.0.0.1", "10.0.0.1", "127.0.0.1", "240.0.0.1"])
+def test_ipv4_get_servers_unallocated(ip):
+    with pytest.raises(GeneralError):
+        IPv4Allocations().get_servers(IPv4Address(ip))
+
+
+@pytest.mark.parametrize(
+    "ip,whois_server",
+    [
+        ("2001:200::1", "whois.apnic.net"),
+        ("2001:4860:4860::8888", "whois.arin.net"),
+        ("2001:67c:2e8::1", "whois.ripe.net"),
+        ("2001:b7ff:ffff::1", "whois.apnic.net"),
+        ("2610:a1:1071::1", "whois.arin.net"),
+        ("2800:3f0:4001::1", "whois.lacnic.net"),
+        ("2a1f:ffff::1", "whois.ripe.net"),
+        ("2c0f:f248::1", "whois.afrinic.net"),
+    ],
+)
+def test_ipv6_get_servers(ip, whois_server):
+    rdap_server, server = IPv6Allocations().get_servers(IPv6Address(ip))
+    assert server == whois_server
+    assert rdap_server.startswith("https://")
+
+
+@pytest.mark.parametrize("ip", ["::1", "2001::1", "2002:c000:204::1", "fe80::1"])
+def test_ipv6_get_servers_unallocated(ip):
+    with pytest.raises(GeneralError):
+        IPv6Allocations().get_servers(IPv6Address(ip))
+    # unallocated addresses are still referred by whois.iana.org
+    assert NumberQuery._get_server_name(IPv6Address(ip)) is None
+
+
+def test_ipv6_query_skips_iana():
+    assert NumberQuery._get_server_name(IPv6Address("2a00:1450::1")) == (
+        "whois.ripe.net"
+    )
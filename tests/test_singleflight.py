@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from asyncwhois.client import DomainClient, NumberClient
+from asyncwhois.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_one_call():
+    calls = 0
+
+    async def lookup():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "result"
+
+    flights = SingleFlight()
+    results = await asyncio.gather(*(flights.do("key", lookup) for _ in range(10)))
+    assert results == ["result"] * 10
+    assert calls == 1
+    assert len(flights) == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_exceptions():
+    async def lookup():
+        await asyncio.sleep(0.01)
+        raise ConnectionError("boom")
+
+    flights = SingleFlight()
+    results = await asyncio.gather(
+        *(flights.do("key", lookup) for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(r, ConnectionError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelling_one_waiter_does_not_cancel_shared_call():
+    async def lookup():
+        await asyncio.sleep(0.05)
+        return "result"
+
+    flights = SingleFlight()
+    first = asyncio.ensure_future(flights.do("key", lookup))
+    second = asyncio.ensure_future(flights.do("key", lookup))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    assert await second == "result"
+    assert first.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_domain_client_coalesces_whois_and_rdap(mocker):
+    client = DomainClient(coalesce=True)
+
+    async def aio_run(domain):
+        await asyncio.sleep(0.01)
+        return [f"Domain Name: {domain}\n"]
+
+    aio_run = mocker.patch.object(client.query_obj, "aio_run", side_effect=aio_run)
+    aio_rdap = mocker.patch.object(
+        client, "_aio_rdap", side_effect=mocker.AsyncMock(return_value=("{}", {}))
+    )
+    domains = ["google.com", "www.google.com", "https://google.com/maps"]
+    await asyncio.gather(*(client.aio_whois(domain) for domain in domains))
+    await asyncio.gather(*(client.aio_rdap(domain) for domain in domains))
+    assert aio_run.call_count == 1
+    assert aio_rdap.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_number_client_does_not_coalesce_by_default(mocker):
+    client = NumberClient()
+    aio_run = mocker.patch.object(
+        client.query_obj,
+        "aio_run",
+        side_effect=mocker.AsyncMock(return_value=["NetRange: 192.0.2.0"]),
+    )
+    await asyncio.gather(*(client.aio_whois("192.0.2.1") for _ in range(3)))
+    assert aio_run.call_count == 3
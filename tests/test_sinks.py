@@ -0,0 +1,107 @@
+import csv
+import datetime
+import json
+
+import pytest
+
+from asyncwhois.bulk import LookupResult, LookupStatus
+from asyncwhois.errors import NotFoundError
+from asyncwhois.parse import IPBaseKeys, TLDBaseKeys
+from asyncwhois.sinks import CSVSink, JSONLSink, Sink
+
+PARSER_OUTPUT = {
+    TLDBaseKeys.DOMAIN_NAME: "amazon.com",
+    TLDBaseKeys.CREATED: datetime.datetime(1994, 11, 1, tzinfo=datetime.timezone.utc),
+    TLDBaseKeys.NAME_SERVERS: ["ns1.amzndns.com", "ns2.amzndns.com"],
+}
+
+
+def test_jsonl_sink_serializes_results(capsys):
+    with JSONLSink(batch_size=2) as sink:
+        sink.write(LookupResult("amazon.com", "Domain Name: amazon.com", PARSER_OUTPUT))
+        sink.write(
+            LookupResult(
+                "missing.com",
+                status=LookupStatus.NOT_FOUND,
+                error=NotFoundError("Domain not found!"),
+            )
+        )
+        sink.write(PARSER_OUTPUT)
+        # the third item waits for the next batch
+        assert len(capsys.readouterr().out.splitlines()) == 2
+    lines = capsys.readouterr().out.splitlines()
+    assert json.loads(lines[0]) == {
+        "domain_name": "amazon.com",
+        "created": "1994-11-01T00:00:00+00:00",
+        "name_servers": ["ns1.amzndns.com", "ns2.amzndns.com"],
+    }
+
+
+def test_jsonl_sink_envelopes(tmp_path):
+    path = str(tmp_path / "results.jsonl")
+    with JSONLSink(path) as sink:
+        sink.write(LookupResult("amazon.com", "Domain Name: amazon.com", PARSER_OUTPUT))
+        sink.write(
+            LookupResult(
+                "missing.com",
+                status=LookupStatus.NOT_FOUND,
+                error=NotFoundError("Domain not found!"),
+            )
+        )
+    with open(path) as f:
+        found, missing = map(json.loads, f)
+    assert found["parser_output"]["domain_name"] == "amazon.com"
+    assert "query_output" not in found
+    assert missing == {
+        "search_term": "missing.com",
+        "status": "not_found",
+        "parser_output": {},
+        "error": "Domain not found!",
+    }
+
+
+def test_csv_sink_rotates_files(tmp_path):
+    path = str(tmp_path / "networks.csv")
+    output = {IPBaseKeys.NET_NAME: "GOGL", IPBaseKeys.CIDR: "8.8.8.0/24"}
+    with CSVSink(
+        path,
+        batch_size=1,
+        max_bytes=1,
+        key_type=IPBaseKeys,
+        fields=[IPBaseKeys.CIDR, IPBaseKeys.NET_NAME],
+    ) as sink:
+        sink.extend(LookupResult(f"8.8.8.{i}", "", output) for i in range(3))
+    assert sink.paths == [
+        path,
+        str(tmp_path / "networks.1.csv"),
+        str(tmp_path / "networks.2.csv"),
+    ]
+    for i, rotated in enumerate(sink.paths):
+        with open(rotated, newline="") as f:
+            assert list(csv.reader(f)) == [
+                ["search_term", "lookup_status", "cidr", "net_name"],
+                [f"8.8.8.{i}", "ok", "8.8.8.0/24", "GOGL"],
+            ]
+
+
+@pytest.mark.asyncio
+async def test_sink_aio_extend(tmp_path):
+    path = str(tmp_path / "results.jsonl")
+
+    async def results():
+        for i in range(25):
+            yield LookupResult(f"{i}.com", "", PARSER_OUTPUT)
+
+    async with JSONLSink(path, batch_size=10) as sink:
+        await sink.aio_extend(results())
+    with open(path) as f:
+        search_terms = [json.loads(line)["search_term"] for line in f]
+    assert search_terms == [f"{i}.com" for i in range(25)]
+
+
+def test_sink_subclasses_must_serialize():
+    class NoSerializeSink(Sink):
+        pass
+
+    with pytest.raises(TypeError):
+        NoSerializeSink()
@@ -23,16 +23,18 @@ This tool currently relies on pypi:`httpx` to perform HTTP(s) request and on
 pypi:`netaddr` 3rd party module to minimize the number of entries produced in
 the final structure
 
+The generated module holds sorted, non-overlapping integer address ranges so
+that asyncwhois can look up an address with a binary search.
+
 """
 
 import os.path
 import sys
 import asyncio
 import csv
-import textwrap
 from datetime import datetime, timezone
 from typing import NamedTuple, TextIO
-from ipaddress import IPv4Network
+from ipaddress import IPv4Address, IPv4Network
 from io import StringIO
 
 from netaddr import IPSet
@@ -51,7 +53,12 @@ AllocationMapping = dict[Servers, IPSet]
 
 
 IPv4Allocations = dict[IPv4Network, dict[str, str]]
-"""The data format used by asyncwhois"""
+"""An IPv4Network -> Servers mapping (the format formerly used by asyncwhois)"""
+
+
+CompactAllocations = tuple[list[tuple[str, str]], list[tuple[int, int, int]]]
+"""The data format used by asyncwhois: a list of unique (rdap, whois) server
+pairs and a sorted list of (first address, last address, server index) ranges"""
 
 
 ALLOCATIONS_CSV_URL = (
@@ -102,32 +109,63 @@ def compat(data: AllocationMapping) -> IPv4Allocations:
     }
 
 
-def create_module_file(allocations: IPv4Allocations) -> str:
+def compact(allocations: IPv4Allocations) -> CompactAllocations:
+    """Given an IPv4Network -> Servers mapping, return the unique server pairs
+    and the sorted integer ranges pointing at them; adjacent ranges served by
+    the same servers are merged
+    """
+    servers: list[tuple[str, str]] = []
+    ranges: list[tuple[int, int, int]] = []
+    for network in sorted(allocations):
+        pair = (allocations[network]["rdap"], allocations[network]["whois"])
+        if pair not in servers:
+            servers.append(pair)
+        index = servers.index(pair)
+        first, last = int(network.network_address), int(network.broadcast_address)
+        if ranges and ranges[-1][2] == index and ranges[-1][1] + 1 == first:
+            ranges[-1] = (ranges[-1][0], last, index)
+        else:
+            ranges.append((first, last, index))
+    return servers, ranges
+
+
+def create_module_file(allocations: CompactAllocations) -> str:
     """Generate the output module content"""
     ts = datetime.now(tz=timezone.utc).strftime("%Y:%m:%d %H:%M:%S")
     progname = os.path.basename(sys.argv[0])
-    mapping_type_name = "AllocationsT"
-    return textwrap.dedent(
-        f'''
-    """
-    This file has been generated by {progname} program on {ts} UTC
+    servers, ranges = allocations
+    servers_lines = "".join(
+        f"    ({rdap!r}, {whois!r}),  # {index}\n"
+        for index, (rdap, whois) in enumerate(servers)
+    )
+    ranges_lines = "".join(
+        f"    (0x{first:08X}, 0x{last:08X}, {index}),"
+        f"  # {IPv4Address(first)} - {IPv4Address(last)}\n"
+        for first, last, index in ranges
+    )
+    return f'''"""
+This file has been generated by {progname} program on {ts} UTC
 
-    If you need it updated, override this file content with {progname} output.
-    """
+If you need it updated, override this file content with {progname} output.
+"""
 
 
-    from ipaddress import IPv4Network
+ServersT = tuple[tuple[str, str], ...]
+AllocationRangesT = tuple[tuple[int, int, int], ...]
 
 
-    {mapping_type_name} = dict[IPv4Network, dict[str, str]]
+# (rdap, whois) server pairs
+IPV4_SERVERS: ServersT = (
+{servers_lines})
 
 
-    IPV4_ALLOCATIONS: {mapping_type_name} = {allocations}
+# sorted, non-overlapping (first address, last address, index into IPV4_SERVERS)
+IPV4_ALLOCATION_RANGES: AllocationRangesT = (
+{ranges_lines})
 
 
-    __all__ = ("IPV4_ALLOCATIONS", "{mapping_type_name}")
-    '''
-    )
+__all__ = ("IPV4_SERVERS", "IPV4_ALLOCATION_RANGES", "ServersT", "AllocationRangesT")
+'''
 
 
 async def main() -> None:
@@ -136,7 +174,7 @@ async def main() -> None:
     """
     csv_content: str = await retrieve_allocation_data(ALLOCATIONS_CSV_URL)
     allocation_data = parse(StringIO(csv_content))
-    print(create_module_file(compat(allocation_data)))
+    print(create_module_file(compact(compat(allocation_data))), end="")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+
+"""This tool can be used to update the list mapping between IPv6 blocks and
+their RDAP & Whois servers.
+
+Data is retrieved from
+https://www.iana.org/assignments/ipv6-unicast-address-assignments/ipv6-unicast-address-assignments.xhtml
+
+More specifically from
+https://www.iana.org/assignments/ipv6-unicast-address-assignments/ipv6-unicast-address-assignments.csv
+
+Then, parsed and converted to the structured used by asyncwhois: a table of
+prefixes allocated to the Regional Internet Registries, which asyncwhois
+searches with a longest-prefix match.
+
+This tool should (arguably) be piped to "black -" to enhance the readability
+of the produced content and then redirected to a source file in asyncwhois.
+
+e.g:
+
+    $ ipv6allocs | black - > asyncwhois/servers/ipv6.py
+
+
+This tool currently relies on pypi:`httpx` to perform HTTP(s) request.
+
+"""
+
+import os.path
+import sys
+import asyncio
+import csv
+from datetime import datetime, timezone
+from typing import NamedTuple, TextIO
+from ipaddress import IPv6Network, collapse_addresses
+from io import StringIO
+
+import httpx
+
+
+class Servers(NamedTuple):
+    """A tuple linking Matching rdap and whois servers altogether"""
+
+    rdap: str
+    whois: str
+
+
+AllocationMapping = dict[Servers, list[IPv6Network]]
+"""The type of data produced by the :py:func:`parse` function."""
+
+
+IPv6Allocations = tuple[list[Servers], list[tuple[IPv6Network, int]]]
+"""The data format used by asyncwhois: a list of unique server pairs and a
+sorted list of (prefix, server index) entries"""
+
+
+ALLOCATIONS_CSV_URL = (
+    "https://www.iana.org/assignments/ipv6-unicast-address-assignments"
+    "/ipv6-unicast-address-assignments.csv"
+)
+"""The URL of the IANA document containing of the list of whois/rdap servers
+matching IPv6 blocks."""
+
+
+async def retrieve_allocation_data(url: str) -> str:
+    """Simply perform an HTTP GET query and return the text"""
+    async with httpx.AsyncClient() as client:
+        response = await client.get(url)
+        return response.text
+
+
+def parse(csv_file: TextIO) -> AllocationMapping:
+    """From a given CSV text file, return the allocated prefixes of every
+    Regional Internet Registry (Servers -> prefixes)
+    """
+    servers_to_networks: AllocationMapping = {}
+    csv_raw = csv.DictReader(csv_file)
+    for data in csv_raw:
+        # reserved blocks, 6to4 and IANA's own special-purpose blocks have no RDAP server
+        if data["Status"].upper() != "ALLOCATED" or not data["RDAP"]:
+            continue
+        servers = Servers(
+            rdap=data["RDAP"].split("\n")[0], whois=data["WHOIS"].split("\n")[0]
+        )
+        networks = servers_to_networks.setdefault(servers, [])
+        networks.append(IPv6Network(data["Prefix"]))
+    return servers_to_networks
+
+
+def compat(data: AllocationMapping) -> IPv6Allocations:
+    """Given an AllocationMapping structure, return the unique server pairs and
+    the sorted, collapsed prefixes pointing at them
+    """
+    servers = list(data)
+    prefixes = sorted(
+        (network, index)
+        for index, networks in enumerate(data.values())
+        for network in collapse_addresses(networks)
+    )
+    return servers, prefixes
+
+
+def create_module_file(allocations: IPv6Allocations) -> str:
+    """Generate the output module content"""
+    ts = datetime.now(tz=timezone.utc).strftime("%Y:%m:%d %H:%M:%S")
+    progname = os.path.basename(sys.argv[0])
+    servers, prefixes = allocations
+    servers_lines = "".join(
+        f"    ({rdap!r}, {whois!r}),  # {index}\n"
+        for index, (rdap, whois) in enumerate(servers)
+    )
+    prefixes_lines = "".join(
+        f"    ({str(network)!r}, {index}),\n" for network, index in prefixes
+    )
+    return f'''"""
+This file has been generated by {progname} program on {ts} UTC
+
+If you need it updated, override this file content with {progname} output.
+"""
+
+
+ServersT = tuple[tuple[str, str], ...]
+AllocationPrefixesT = tuple[tuple[str, int], ...]
+
+
+# (rdap, whois) server pairs
+IPV6_SERVERS: ServersT = (
+{servers_lines})
+
+
+# (prefix, index into IPV6_SERVERS), sorted by prefix
+IPV6_ALLOCATION_PREFIXES: AllocationPrefixesT = (
+{prefixes_lines})
+
+
+__all__ = ("IPV6_SERVERS", "IPV6_ALLOCATION_PREFIXES", "ServersT", "AllocationPrefixesT")
+'''
+
+
+async def main() -> None:
+    """Retrieve the allocation data, parse it and generate a basic data-only
+    python module.
+    """
+    csv_content: str = await retrieve_allocation_data(ALLOCATIONS_CSV_URL)
+    allocation_data = parse(StringIO(csv_content))
+    print(create_module_file(compat(allocation_data)), end="")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
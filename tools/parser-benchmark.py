@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+
+"""Benchmarks the domain parsers on the WHOIS samples in tests/samples.
+
+Every sample is parsed in a mixed-TLD round robin, which is what a bulk
+workload looks like to the parsers. Two ways of running the expression tables
+are compared:
+
+- "raw strings": hand each pattern string to `re.search` / `re.findall` on
+  every call (the strategy used before the tables were precompiled), so
+  patterns are recompiled whenever they fall out of the `re` module's cache
+- "precompiled": run the per-class `compiled_expressions` tables
+
+Both are also measured with the `re` module's cache emptied between parses,
+which models a program whose working set of patterns (all parser classes plus
+its own regexes) is larger than that cache, so raw strings keep getting evicted.
+The time spent in `DomainParser.parse` (tables, `parse` overrides and date
+parsing) is reported as well, once with each parse engine: "lines" scans every
+blob once and only runs the expressions its label table cannot answer, "regex"
+runs every expression over the whole blob.
+
+e.g:
+
+    $ python tools/parser-benchmark.py --rounds 20
+
+"""
+
+import argparse
+import os.path
+import re
+import time
+from typing import Callable
+
+from asyncwhois import tldparsers
+from asyncwhois.parse import ParseEngine
+from asyncwhois.parse_tld import DomainParser
+
+SAMPLES_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, "tests", "samples"
+)
+
+
+def load_samples(samples_dir: str) -> list[tuple[str, str]]:
+    """Return (tld, query output) pairs for every tld_*.txt sample"""
+    samples = []
+    for filename in sorted(os.listdir(samples_dir)):
+        if filename.startswith("tld_") and filename.endswith(".txt"):
+            with open(os.path.join(samples_dir, filename), encoding="utf-8") as f:
+                samples.append((filename[4:-4], f.read()))
+    return samples
+
+
+def scan_raw_strings(parser: tldparsers.TLDParser, blob: str) -> None:
+    for key, regex in parser.reg_expressions.items():
+        if not regex:
+            continue
+        if key in parser.multiple_match_keys:
+            re.findall(regex, blob, flags=re.IGNORECASE)
+        else:
+            re.search(regex, blob, flags=re.IGNORECASE)
+
+
+def scan_precompiled(parser: tldparsers.TLDParser, blob: str) -> None:
+    for key, pattern in parser.compiled_expressions.items():
+        if pattern is None:
+            continue
+        if key in parser.multiple_match_keys:
+            pattern.findall(blob)
+        else:
+            pattern.search(blob)
+
+
+def timed(func: Callable[[], None], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--rounds", type=int, default=10)
+    arg_parser.add_argument("--samples", default=SAMPLES_DIR)
+    args = arg_parser.parse_args()
+
+    samples = load_samples(args.samples)
+    domain_parser = DomainParser(ignore_not_found=True)
+    # private instances, since `run_engine` switches their engine
+    parsers = [(type(domain_parser._init_parser(tld))(), blob) for tld, blob in samples]
+    distinct_patterns = {
+        regex for parser, _ in parsers for regex in parser.reg_expressions.values()
+    }
+
+    def run_raw_strings() -> None:
+        for parser, blob in parsers:
+            scan_raw_strings(parser, blob)
+
+    def run_precompiled() -> None:
+        for parser, blob in parsers:
+            scan_precompiled(parser, blob)
+
+    def run_raw_strings_evicted() -> None:
+        for parser, blob in parsers:
+            re.purge()
+            scan_raw_strings(parser, blob)
+
+    def run_precompiled_evicted() -> None:
+        for parser, blob in parsers:
+            re.purge()
+            scan_precompiled(parser, blob)
+
+    def run_domain_parser() -> None:
+        for tld, blob in samples:
+            domain_parser.parse(blob, tld)
+
+    def run_engine(engine: ParseEngine) -> Callable[[], None]:
+        def run() -> None:
+            for parser, blob in parsers:
+                parser.parse_engine = engine
+                parser.parse(blob)
+
+        return run
+
+    print(
+        f"{len(samples)} samples, {len(distinct_patterns)} distinct patterns, "
+        f"{args.rounds} rounds"
+    )
+    results = [
+        ("tables, raw strings", timed(run_raw_strings, args.rounds)),
+        ("tables, precompiled", timed(run_precompiled, args.rounds)),
+        ("tables, raw strings, evicted", timed(run_raw_strings_evicted, args.rounds)),
+        ("tables, precompiled, evicted", timed(run_precompiled_evicted, args.rounds)),
+        ("DomainParser.parse", timed(run_domain_parser, args.rounds)),
+        ("parse, lines engine", timed(run_engine(ParseEngine.LINES), args.rounds)),
+        ("parse, regex engine", timed(run_engine(ParseEngine.REGEX), args.rounds)),
+    ]
+    parses = len(samples) * args.rounds
+    for name, elapsed in results:
+        print(f"{name:<32} {elapsed:8.3f}s  {elapsed / parses * 1e6:10.1f}us/parse")
+
+
+if __name__ == "__main__":
+    main()